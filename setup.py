@@ -43,6 +43,7 @@ setup(name='cortx-py-utils',
                 'cortx.utils.cleanup',
                 'cortx.utils.data', 'cortx.utils.data.access', 'cortx.utils.data.db',
                 'cortx.utils.data.db.consul_db', 'cortx.utils.data.db.elasticsearch_db',
+                'cortx.utils.data.db.sqlite_db', 'cortx.utils.data.db.memory_db',
                 'cortx.utils.ha.hac',
                 'cortx.utils.ha.dm', 'cortx.utils.ha.dm.models',
                 'cortx.utils.ha.dm.repository',
@@ -16,6 +16,8 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 from .base_model import BaseModel
-from .filters import And, Or, Compare, IFilter, IFilterTreeVisitor
+from .filters import And, Or, Compare, StartsWith, In, IFilter, IFilterTreeVisitor
+from .filter_compiler import FilterCompiler, compile_filter
+from .filter_optimizer import FilterOptimizer, is_contradiction
 from .queries import Query, ExtQuery, SortOrder, SortBy, QueryLimits, DateTimeRange
-from .storage import IDataBase, AbstractDataBaseProvider
+from .storage import IDataBase, AbstractDataBaseProvider, BulkWriteResult
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import operator
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Collection, Hashable, Type
+
+from schematics.exceptions import ConversionError
+
+from cortx.utils.data.access.base_model import BaseModel
+from cortx.utils.data.access.filters import (IFilter, IFilterTreeVisitor, FilterOperationAnd,
+                                             FilterOperationOr, FilterOperationCompare,
+                                             ComparisonOperation, field_to_str)
+from cortx.utils.errors import DataAccessInternalError
+
+Predicate = Callable[[Any], bool]
+
+
+class FilterCompiler(IFilterTreeVisitor):
+    """
+    Implementation of filter tree visitor which turns filter into single predicate function.
+    AND and OR predicates are short-circuiting, comparison constants are converted with
+    model field `to_native` once during compilation.
+
+    Object field values are obtained by `value_getter(obj, field_name)`, so predicate can be
+    evaluated on model objects (default `getattr`) or on any other object representation which
+    provides native field values.
+
+    Usage:
+    compiler = FilterCompiler(model)
+    predicate = compiler.build(filter_root)
+    suitable = [obj for obj in objects if predicate(obj)]
+    """
+
+    _OPERATORS = {
+        ComparisonOperation.OPERATION_EQ: operator.eq,
+        ComparisonOperation.OPERATION_NE: operator.ne,
+        ComparisonOperation.OPERATION_GEQ: operator.ge,
+        ComparisonOperation.OPERATION_LEQ: operator.le,
+        ComparisonOperation.OPERATION_GT: operator.gt,
+        ComparisonOperation.OPERATION_LT: operator.lt,
+        ComparisonOperation.OPERATION_LIKE: operator.contains,
+        ComparisonOperation.OPERATION_STARTS_WITH: lambda value, prefix: value.startswith(prefix),
+        ComparisonOperation.OPERATION_IN: lambda value, values: value in values
+    }
+
+    def __init__(self, model: Type[BaseModel],
+                 value_getter: Callable[[Any, str], Any] = getattr):
+        """
+
+        :param Type[BaseModel] model: model which fields are used in filters
+        :param value_getter: function which returns native field value of the object by name
+        """
+        self._model = model
+        self._value_getter = value_getter
+
+    def build(self, root: IFilter) -> Predicate:
+        return root.accept_visitor(self)
+
+    def handle_and(self, entry: FilterOperationAnd) -> Predicate:
+        predicates = tuple(operand.accept_visitor(self) for operand in entry.get_operands())
+        return lambda obj: all(predicate(obj) for predicate in predicates)
+
+    def handle_or(self, entry: FilterOperationOr) -> Predicate:
+        predicates = tuple(operand.accept_visitor(self) for operand in entry.get_operands())
+        return lambda obj: any(predicate(obj) for predicate in predicates)
+
+    def handle_compare(self, entry: FilterOperationCompare) -> Predicate:
+        field_str = field_to_str(entry.get_left_operand())
+        field = self._model.fields.get(field_str)
+        if field is None:
+            raise DataAccessInternalError(
+                f"Model {self._model.__name__} has no field {field_str}")
+
+        op = entry.get_operation()
+        if op not in self._OPERATORS:
+            raise DataAccessInternalError(f"Unsupported comparison operation: {op}")
+        right_operand = entry.get_right_operand()
+        try:
+            if op == ComparisonOperation.OPERATION_IN:
+                right_operand = self._convert_values(field, right_operand)
+            elif right_operand is not None:
+                right_operand = field.to_native(right_operand)
+        except ConversionError as e:
+            raise DataAccessInternalError(f"{e}")
+
+        compare = self._OPERATORS[op]
+        value_getter = self._value_getter
+        if op in (ComparisonOperation.OPERATION_EQ, ComparisonOperation.OPERATION_NE):
+            return lambda obj: compare(value_getter(obj, field_str), right_operand)
+
+        # NOTE: absent values never satisfy ordering, "like", prefix and "in" comparisons
+        def _predicate(obj):
+            value = value_getter(obj, field_str)
+            return value is not None and compare(value, right_operand)
+
+        return _predicate
+
+    @staticmethod
+    def _convert_values(field, values) -> Collection:
+        """
+        Convert constants of "in" comparison into the collection suitable for membership test
+
+        :param field: model field
+        :param values: list or tuple of the field values
+        :return: set of native values or tuple if they are not hashable
+        """
+        if not isinstance(values, (list, tuple)):
+            raise DataAccessInternalError(f"In comparison requires list of values: {values}")
+        values = tuple(field.to_native(value) for value in values if value is not None)
+        try:
+            return frozenset(values)
+        except TypeError:
+            return values
+
+
+class _PredicateCache:
+    """Thread-safe LRU cache of compiled predicates"""
+
+    _MAX_SIZE = 1024
+
+    def __init__(self):
+        self._predicates = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Predicate:
+        with self._lock:
+            predicate = self._predicates.get(key)
+            if predicate is not None:
+                self._predicates.move_to_end(key)
+            return predicate
+
+    def put(self, key: Hashable, predicate: Predicate) -> None:
+        with self._lock:
+            self._predicates[key] = predicate
+            if len(self._predicates) > self._MAX_SIZE:
+                self._predicates.popitem(last=False)
+
+
+_predicate_cache = _PredicateCache()
+
+
+def compile_filter(model: Type[BaseModel], filter_obj: IFilter,
+                   value_getter: Callable[[Any, str], Any] = getattr) -> Predicate:
+    """
+    Compile filter into predicate function. Compiled predicates are cached, so structurally
+    equal filters are not compiled again.
+
+    :param Type[BaseModel] model: model which fields are used in the filter
+    :param IFilter filter_obj: filter object
+    :param value_getter: function which returns native field value of the object by name
+    :return: function which takes object and returns `True` if the object satisfies the filter
+    """
+    try:
+        key = (model, value_getter, filter_obj)
+        hash(key)
+    except TypeError:
+        # NOTE: filters with unhashable constants (e.g. lists) are compiled every time
+        return FilterCompiler(model, value_getter).build(filter_obj)
+
+    predicate = _predicate_cache.get(key)
+    if predicate is None:
+        predicate = FilterCompiler(model, value_getter).build(filter_obj)
+        _predicate_cache.put(key, predicate)
+    return predicate
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from typing import List, Optional, Sequence, Type, Union
+
+from schematics.exceptions import ConversionError
+from schematics.types import IntType, LongType, FloatType, DateTimeType, DateType
+
+from cortx.utils.data.access.base_model import BaseModel
+from cortx.utils.data.access.filters import (IFilter, FilterOperationAnd, FilterOperationOr,
+                                             FilterOperationCompare, ComparisonOperation,
+                                             field_to_str)
+from cortx.utils.errors import DataAccessInternalError, MalformedQueryError
+
+
+class FilterContradiction(IFilter):
+    """
+    Filter which is not satisfied by any object. Optimizer returns it instead of contradictory
+    filters, so storages can return empty result without a request to the database.
+    """
+
+    def accept_visitor(self, visitor):
+        raise DataAccessInternalError("Contradictory filter must not be passed to the database")
+
+    def to_primitive(self) -> list:
+        raise MalformedQueryError("Contradictory filter has no representation")
+
+    def _build_canonical(self) -> list:
+        return self.to_primitive()
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
+CONTRADICTION = FilterContradiction()
+
+
+def is_contradiction(filter_obj: Optional[IFilter]) -> bool:
+    return filter_obj is CONTRADICTION
+
+
+class _Bound:
+    """Lower or upper bound of the field values interval"""
+
+    def __init__(self, value, inclusive: bool, leaf: FilterOperationCompare):
+        self.value = value
+        self.inclusive = inclusive
+        self.leaf = leaf
+
+
+class FilterOptimizer:
+    """
+    Normalizes filter trees before execution:
+    1) nested AND/OR operations are flattened and duplicate operands are removed;
+    2) range comparisons of the same field inside of AND are merged into single interval;
+    3) contradictions are folded into CONTRADICTION;
+    4) AND operands are ordered so comparisons of key fields (primary key, indexed fields) and
+    cheap comparisons come first.
+
+    Usage:
+    optimizer = FilterOptimizer(model, key_fields)
+    filter_obj = optimizer.optimize(filter_obj)
+    """
+
+    # NOTE: string fields are compared case-insensitively by some storages (e.g. elasticsearch
+    #  keyword normalizer), so only fields with unambiguous ordering are merged
+    _MERGEABLE_TYPES = (IntType, LongType, FloatType, DateTimeType, DateType)
+
+    _RANGE_OPERATIONS = (ComparisonOperation.OPERATION_GT, ComparisonOperation.OPERATION_GEQ,
+                         ComparisonOperation.OPERATION_LT, ComparisonOperation.OPERATION_LEQ)
+
+    # relative cost of comparison operations, nested logical operations are the most expensive
+    _OPERATION_COST = {
+        ComparisonOperation.OPERATION_EQ: 0,
+        ComparisonOperation.OPERATION_STARTS_WITH: 1,
+        ComparisonOperation.OPERATION_IN: 1,
+        ComparisonOperation.OPERATION_GT: 2,
+        ComparisonOperation.OPERATION_GEQ: 2,
+        ComparisonOperation.OPERATION_LT: 2,
+        ComparisonOperation.OPERATION_LEQ: 2,
+        ComparisonOperation.OPERATION_NE: 3,
+        ComparisonOperation.OPERATION_LIKE: 3,
+    }
+    _LOGICAL_OPERATION_COST = 4
+
+    def __init__(self, model: Type[BaseModel], key_fields: Sequence[str] = None):
+        """
+
+        :param Type[BaseModel] model: model which fields are used in filters
+        :param key_fields: fields which comparisons are served by keys in the storage, the most
+                           selective first. Primary key is used by default
+        """
+        self._model = model
+        self._key_fields = list(key_fields) if key_fields is not None else [model.primary_key]
+
+    def optimize(self, filter_obj: Optional[IFilter]) -> Optional[IFilter]:
+        """
+        Optimize filter
+
+        :param IFilter filter_obj: filter object or None
+        :return: equivalent optimized filter, CONTRADICTION or None if filter_obj is None
+        """
+        if filter_obj is None:
+            return None
+        return self._optimize(filter_obj)
+
+    def _optimize(self, filter_obj: IFilter) -> IFilter:
+        if isinstance(filter_obj, FilterOperationAnd):
+            return self._optimize_and(filter_obj)
+        if isinstance(filter_obj, FilterOperationOr):
+            return self._optimize_or(filter_obj)
+        if isinstance(filter_obj, FilterOperationCompare) and \
+                filter_obj.get_operation() == ComparisonOperation.OPERATION_IN:
+            values = filter_obj.get_right_operand()
+            if isinstance(values, (list, tuple)) and all(value is None for value in values):
+                return CONTRADICTION  # NOTE: "in" comparison with empty list matches nothing
+        return filter_obj
+
+    def _optimize_and(self, filter_obj: FilterOperationAnd) -> IFilter:
+        operands = self._flatten(FilterOperationAnd, filter_obj.get_operands())
+        if any(is_contradiction(operand) for operand in operands):
+            return CONTRADICTION
+
+        operands = self._merge_ranges(self._remove_duplicates(operands))
+        if operands is CONTRADICTION:
+            return CONTRADICTION
+
+        operands.sort(key=self._cost)  # NOTE: sort is stable, so equal operands keep the order
+        return operands[0] if len(operands) == 1 else FilterOperationAnd(*operands)
+
+    def _optimize_or(self, filter_obj: FilterOperationOr) -> IFilter:
+        operands = self._flatten(FilterOperationOr, filter_obj.get_operands())
+        operands = [operand for operand in operands if not is_contradiction(operand)]
+        if not operands:
+            return CONTRADICTION
+
+        operands = self._remove_duplicates(operands)
+        return operands[0] if len(operands) == 1 else FilterOperationOr(*operands)
+
+    def _flatten(self, operation: Type[Union[FilterOperationAnd, FilterOperationOr]],
+                 operands: Sequence[IFilter]) -> List[IFilter]:
+        flattened = list()
+        for operand in operands:
+            operand = self._optimize(operand)
+            if isinstance(operand, operation):
+                flattened.extend(operand.get_operands())
+            else:
+                flattened.append(operand)
+        return flattened
+
+    @staticmethod
+    def _remove_duplicates(operands: List[IFilter]) -> List[IFilter]:
+        unique, keys = list(), set()
+        for operand in operands:
+            try:
+                if operand in keys:
+                    continue
+                keys.add(operand)
+            except TypeError:
+                pass  # operand with unhashable constant is kept as is
+            unique.append(operand)
+        return unique
+
+    def _merge_ranges(self, operands: List[IFilter]) -> Union[List[IFilter], IFilter]:
+        """
+        Merge equality and range comparisons of the same field into the narrowest interval
+
+        :param list operands: operands of AND operation
+        :return: new list of operands or CONTRADICTION if the interval is empty
+        """
+        groups = dict()
+        for operand in operands:
+            if isinstance(operand, FilterOperationCompare) and (
+                    operand.get_operation() in self._RANGE_OPERATIONS or
+                    operand.get_operation() == ComparisonOperation.OPERATION_EQ):
+                field_str = field_to_str(operand.get_left_operand())
+                groups.setdefault(field_str, list()).append(operand)
+
+        merged, merged_fields = dict(), dict()
+        for field_str, leaves in groups.items():
+            field = self._model.fields.get(field_str)
+            if len(leaves) < 2 or not isinstance(field, self._MERGEABLE_TYPES):
+                continue
+            try:
+                interval = self._merge_interval(field, leaves)
+            except (ConversionError, TypeError):
+                continue  # constants can't be compared, so leave them to the storage
+            if interval is CONTRADICTION:
+                return CONTRADICTION
+            merged[field_str] = interval
+            merged_fields.update((id(leaf), field_str) for leaf in leaves)
+
+        result = list()
+        for operand in operands:
+            field_str = merged_fields.get(id(operand))
+            if field_str is None:
+                result.append(operand)
+            elif field_str in merged:
+                # NOTE: merged interval takes place of the first leaf of the field
+                result.extend(merged.pop(field_str))
+        return result
+
+    def _merge_interval(self, field, leaves: List[FilterOperationCompare]) \
+            -> Union[List[IFilter], IFilter]:
+        equal, lower, upper = None, None, None
+        for leaf in leaves:
+            if leaf.get_right_operand() is None:
+                raise TypeError("None can't be compared")
+            value = field.to_native(leaf.get_right_operand())
+            op = leaf.get_operation()
+            if op == ComparisonOperation.OPERATION_EQ:
+                if equal is not None and equal.value != value:
+                    return CONTRADICTION
+                equal = equal or _Bound(value, True, leaf)
+            elif op in (ComparisonOperation.OPERATION_GT, ComparisonOperation.OPERATION_GEQ):
+                inclusive = op == ComparisonOperation.OPERATION_GEQ
+                if lower is None or value > lower.value or \
+                        (value == lower.value and not inclusive):
+                    lower = _Bound(value, inclusive, leaf)
+            else:
+                inclusive = op == ComparisonOperation.OPERATION_LEQ
+                if upper is None or value < upper.value or \
+                        (value == upper.value and not inclusive):
+                    upper = _Bound(value, inclusive, leaf)
+
+        if equal is not None:
+            if lower is not None and (equal.value < lower.value or
+                                      (equal.value == lower.value and not lower.inclusive)):
+                return CONTRADICTION
+            if upper is not None and (equal.value > upper.value or
+                                      (equal.value == upper.value and not upper.inclusive)):
+                return CONTRADICTION
+            return [equal.leaf]
+
+        if lower is not None and upper is not None:
+            if lower.value > upper.value:
+                return CONTRADICTION
+            if lower.value == upper.value:
+                if not (lower.inclusive and upper.inclusive):
+                    return CONTRADICTION
+                return [FilterOperationCompare(lower.leaf.get_left_operand(),
+                                               ComparisonOperation.OPERATION_EQ,
+                                               lower.leaf.get_right_operand())]
+        return [bound.leaf for bound in (lower, upper) if bound is not None]
+
+    def _cost(self, operand: IFilter) -> int:
+        if not isinstance(operand, FilterOperationCompare):
+            return len(self._key_fields) + self._LOGICAL_OPERATION_COST
+
+        field_str = field_to_str(operand.get_left_operand())
+        op = operand.get_operation()
+        if field_str in self._key_fields and op in (ComparisonOperation.OPERATION_EQ,
+                                                    ComparisonOperation.OPERATION_STARTS_WITH,
+                                                    ComparisonOperation.OPERATION_IN):
+            return self._key_fields.index(field_str)
+        return len(self._key_fields) + self._OPERATION_COST.get(op, self._LOGICAL_OPERATION_COST)
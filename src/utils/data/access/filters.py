@@ -15,59 +15,240 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import datetime
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from decimal import Decimal
 from enum import Enum
-from typing import List, Any
-from cortx.utils.errors import MalformedQueryError
+from typing import List, Any, Iterable, Union
+from schematics.types import BaseType
+from cortx.utils.errors import MalformedQueryError, DataAccessInternalError
+
+
+def field_to_str(field: Union[str, BaseType]) -> str:
+    """
+    Convert model field to its string representation
+
+    :param Union[str, BaseType] field:
+    :return: model field string representation
+    """
+    if isinstance(field, str):
+        return field
+    elif isinstance(field, BaseType):
+        return field.name
+    else:
+        raise DataAccessInternalError(
+            "Failed to convert field to string representation")
+
+
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+_DATETIME_TZ_FORMAT = _DATETIME_FORMAT + "%z"
+_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _format_date(value: datetime.date, date_format: str) -> str:
+    # NOTE: strftime doesn't pad years below 1000 on all platforms, but strptime requires
+    #  four digits of the year
+    return value.strftime(date_format.replace("%Y", f"{value.year:04d}"))
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert filter or query constant into JSON-compatible representation
+
+    :param value: constant
+    :return: JSON-compatible value
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            return {"$datetime": _format_date(value, _DATETIME_FORMAT)}
+        return {"$datetime": _format_date(value, _DATETIME_TZ_FORMAT), "$tz": True}
+    if isinstance(value, datetime.date):
+        return {"$date": _format_date(value, _DATE_FORMAT)}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    raise MalformedQueryError(f"Unsupported type of query value: {type(value).__name__}")
+
+
+def decode_value(value: Any) -> Any:
+    """
+    Restore constant from representation made by encode_value
+
+    :param value: JSON-compatible value
+    :return: constant
+    """
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if "$datetime" in value:
+            date_format = _DATETIME_TZ_FORMAT if value.get("$tz") else _DATETIME_FORMAT
+            try:
+                return datetime.datetime.strptime(value["$datetime"], date_format)
+            except (TypeError, ValueError) as e:
+                raise MalformedQueryError(f"Wrong datetime query value: {e}")
+        if "$date" in value:
+            return datetime.datetime.strptime(value["$date"], _DATE_FORMAT).date()
+        if "$decimal" in value:
+            return Decimal(value["$decimal"])
+        raise MalformedQueryError(f"Unsupported query value: {value}")
+    return value
+
+
+def fingerprint_of(primitive: Any) -> str:
+    """
+    Calculate stable fingerprint of JSON-compatible representation
+
+    :param primitive: JSON-compatible representation
+    :return: hex digest
+    """
+    dump = json.dumps(primitive, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(dump.encode()).hexdigest()
 
 
 class IFilter(ABC):
     """
     Abstract class for IFilter
+
+    Filters are immutable value objects: structurally equal filters are equal and have the same
+    hash and fingerprint regardless of AND/OR operands order and of the way fields are passed
+    (as model fields or as field names).
     """
 
+    _canonical = None
+    _fingerprint = None
+
     @abstractmethod
     def accept_visitor(self, visitor) -> Any:
         pass
 
+    @abstractmethod
+    def to_primitive(self) -> list:
+        """
+        Get compact JSON-compatible representation of the filter
+
+        :return: list representation
+        """
+        pass
+
+    @abstractmethod
+    def _build_canonical(self) -> list:
+        pass
+
+    def get_canonical(self) -> list:
+        """
+        Get representation which is the same for structurally equal filters
+
+        :return: list representation with sorted AND/OR operands
+        """
+        if self._canonical is None:
+            self._canonical = self._build_canonical()
+        return self._canonical
+
+    def fingerprint(self) -> str:
+        """
+        Get stable fingerprint of the filter, it is the same across processes
+
+        :return: hex digest
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_of(self.get_canonical())
+        return self._fingerprint
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_primitive(), separators=(",", ":"))
+
+    @staticmethod
+    def from_primitive(data: list) -> "IFilter":
+        """
+        Restore filter from representation made by to_primitive
+
+        :param list data: list representation
+        :return: filter object
+        """
+        if not isinstance(data, list) or len(data) < 2:
+            raise MalformedQueryError(f"Invalid filter representation: {data}")
+        if data[0] == FilterOperationAnd.OPERATION:
+            return FilterOperationAnd(*(IFilter.from_primitive(item) for item in data[1:]))
+        if data[0] == FilterOperationOr.OPERATION:
+            return FilterOperationOr(*(IFilter.from_primitive(item) for item in data[1:]))
+        if len(data) != 3:
+            raise MalformedQueryError(f"Invalid comparison representation: {data}")
+        op, field, value = data
+        return FilterOperationCompare(field, ComparisonOperation.from_standard_representation(op),
+                                      decode_value(value))
+
+    @staticmethod
+    def from_json(data: str) -> "IFilter":
+        return IFilter.from_primitive(json.loads(data))
+
+    def __eq__(self, other):
+        if not isinstance(other, IFilter):
+            return NotImplemented
+        try:
+            # NOTE: fingerprints distinguish constants like 1, 1.0 and True unlike list equality
+            return self.fingerprint() == other.fingerprint()
+        except MalformedQueryError:
+            return self is other
+
+    def __hash__(self):
+        try:
+            return hash(self.fingerprint())
+        except MalformedQueryError as e:
+            raise TypeError(f"Unhashable filter: {e}")
+
+
+class _FilterOperationLogical(IFilter):
+    """Base class of AND and OR conditions"""
+
+    OPERATION = None
+
+    def __init__(self, *args):
+        if len(args) < 2 or not all(isinstance(x, IFilter) for x in args):
+            raise MalformedQueryError(
+                f"{self.OPERATION.upper()} operation takes >= 2 arguments of filter type")
+
+        self._operands = tuple(args)
 
-class FilterOperationAnd(IFilter):
+    def get_operands(self) -> List[IFilter]:
+        return self._operands
+
+    def to_primitive(self) -> list:
+        return [self.OPERATION] + [operand.to_primitive() for operand in self._operands]
+
+    def _build_canonical(self) -> list:
+        operands = sorted((operand.get_canonical() for operand in self._operands),
+                          key=lambda x: json.dumps(x, sort_keys=True))
+        return [self.OPERATION] + operands
+
+
+class FilterOperationAnd(_FilterOperationLogical):
     """
     Class representing AND condition
     :param *args: List of nested filter conditions (each must be of type IFilterQuery)
     """
 
-    def __init__(self, *args):
-        if len(args) < 2 or not all(isinstance(x, IFilter) for x in args):
-            raise MalformedQueryError("AND operation takes >= 2 arguments of filter type")
-
-        self._operands = args
+    OPERATION = "and"
 
     def accept_visitor(self, visitor):
         return visitor.handle_and(self)
 
-    def get_operands(self) -> List[IFilter]:
-        return self._operands
 
-
-class FilterOperationOr(IFilter):
+class FilterOperationOr(_FilterOperationLogical):
     """
     Class representing OR condition
     :param *args: List of nested filter conditions (each must be of type IFilterQuery)
     """
 
-    def __init__(self, *args):
-        if len(args) < 2 or not all(isinstance(x, IFilter) for x in args):
-            raise MalformedQueryError("OR operation takes >= 2 arguments of filter type")
-
-        self._operands = args
+    OPERATION = "or"
 
     def accept_visitor(self, visitor):
         return visitor.handle_or(self)
 
-    def get_operands(self) -> List[IFilter]:
-        return self._operands
-
 
 class ComparisonOperation(Enum):
     """
@@ -79,8 +260,10 @@ class ComparisonOperation(Enum):
     OPERATION_EQ = '='
     OPERATION_LEQ = '<='
     OPERATION_GEQ = '>='
-    OPERATION_NE = "!="  # TODO: Add support to elasticsearch
-    OPERATION_LIKE = "like" # TODO: Add support to elasticsearch
+    OPERATION_NE = "!="
+    OPERATION_LIKE = "like"
+    OPERATION_STARTS_WITH = "startswith"
+    OPERATION_IN = "in"
 
     @classmethod
     def from_standard_representation(cls, op: str):
@@ -91,7 +274,9 @@ class ComparisonOperation(Enum):
             '>=': cls.OPERATION_GEQ,
             '<=': cls.OPERATION_LEQ,
             "!=": cls.OPERATION_NE,
-            "like": cls.OPERATION_LIKE
+            "like": cls.OPERATION_LIKE,
+            "startswith": cls.OPERATION_STARTS_WITH,
+            "in": cls.OPERATION_IN
         }
 
         if op in mapping:
@@ -106,21 +291,40 @@ class FilterOperationCompare(IFilter):
     """
 
     def __init__(self, left_operand, operation: ComparisonOperation, right_operand):
-        self.left_operand = left_operand
-        self.operation = operation
-        self.right_operand = right_operand
+        self._left_operand = left_operand
+        self._operation = operation
+        self._right_operand = right_operand
+
+    @property
+    def left_operand(self):
+        return self._left_operand
+
+    @property
+    def operation(self) -> ComparisonOperation:
+        return self._operation
+
+    @property
+    def right_operand(self):
+        return self._right_operand
 
     def accept_visitor(self, visitor):
         return visitor.handle_compare(self)
 
     def get_left_operand(self):
-        return self.left_operand
+        return self._left_operand
 
     def get_right_operand(self):
-        return self.right_operand
+        return self._right_operand
 
     def get_operation(self) -> ComparisonOperation:
-        return self.operation
+        return self._operation
+
+    def to_primitive(self) -> list:
+        return [self._operation.value, field_to_str(self._left_operand),
+                encode_value(self._right_operand)]
+
+    def _build_canonical(self) -> list:
+        return self.to_primitive()
 
 
 class IFilterTreeVisitor(ABC):
@@ -184,3 +388,26 @@ def Compare(left, operation: str, right):
     """
     op = ComparisonOperation.from_standard_representation(operation)
     return FilterOperationCompare(left, op, right)
+
+
+def StartsWith(left, right: str):
+    """
+    Adds a condition that demands that the field value starts with the given prefix.
+    Unlike "like" comparison it doesn't match the value in the middle of the field value,
+    so storages are able to perform prefix scans for it.
+    :param left: Left operand. A field.
+    :param right: Right operand. Prefix of the field value.
+    :returns: a FilterOperationCompare object
+    """
+    return FilterOperationCompare(left, ComparisonOperation.OPERATION_STARTS_WITH, right)
+
+
+def In(left, right: Iterable):
+    """
+    Adds a condition that demands that the field value is equal to one of the given values.
+    :param left: Left operand. A field.
+    :param right: Right operand. Collection of the field values.
+    :returns: a FilterOperationCompare object
+    """
+    # NOTE: values are kept in tuple, so the filter stays hashable and its predicate is cached
+    return FilterOperationCompare(left, ComparisonOperation.OPERATION_IN, tuple(right))
@@ -15,11 +15,16 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import base64
+import binascii
 import datetime
+import json
 from enum import Enum
-from typing import Optional
+from typing import Any, List, Optional, Tuple, Type, Union
 from schematics.types import BaseType
-from cortx.utils.data.access.filters import IFilter
+from cortx.utils.data.access.base_model import BaseModel
+from cortx.utils.data.access.filters import IFilter, field_to_str, fingerprint_of
+from cortx.utils.errors import MalformedQueryError
 
 class SortOrder(Enum):
     ASC = "asc"
@@ -58,29 +63,204 @@ class Query:
         """Data storage class for Query parameters"""
 
         # TODO: it can be a schematics model
-        def __init__(self, order_by: OrderBy = None, filter_by: IFilter = None, limit: int = None,
-                     offset: int = None):
+        def __init__(self, order_by: Union[OrderBy, List[OrderBy]] = None,
+                     filter_by: IFilter = None, limit: int = None, offset: int = None,
+                     cursor: str = None, fields: List[str] = None):
 
             self.order_by = order_by
             self.filter_by = filter_by
             self.limit = limit
             self.offset = offset
+            self.cursor = cursor
+            self.fields = fields
+
+        @property
+        def order_by(self) -> Optional[OrderBy]:
+            """The most significant sort key, see `sort_by` for all of them"""
+            return self.sort_by[0] if self.sort_by else None
+
+        @order_by.setter
+        def order_by(self, order_by: Union[OrderBy, List[OrderBy], None]) -> None:
+            if order_by is None:
+                self.sort_by = list()
+            elif isinstance(order_by, OrderBy):
+                self.sort_by = [order_by]
+            else:
+                self.sort_by = list(order_by)
+
+        def get_sort_keys(self) -> List[Tuple[str, SortOrder]]:
+            """
+            Get sort keys of the query
+
+            :return: list of field names with sort orders, the first one is the most significant
+            """
+            return [(field_to_str(key.field), key.order) for key in self.sort_by]
+
+        def get_keyset(self, primary_key: str) -> List[Tuple[str, SortOrder]]:
+            """
+            Get fields which define objects order for keyset pagination: sort keys and primary
+            key as a tie-breaker in the direction of the last sort key
+
+            :param str primary_key: name of the model primary key field
+            :return: list of field names with sort orders
+            """
+            keyset = list()
+            for field, order in self.get_sort_keys():
+                keyset.append((field, order))
+                if field == primary_key:
+                    return keyset  # primary key is unique, following keys don't matter
+            keyset.append((primary_key, keyset[-1][1] if keyset else SortOrder.ASC))
+            return keyset
+
+        def get_cursor_values(self, primary_key: str) -> Optional[List[Any]]:
+            """
+            Decode query cursor
+
+            :param str primary_key: name of the model primary key field
+            :return: primitive keyset values of the object which the cursor was made for or None
+                     if pagination starts from the beginning
+            """
+            if self.offset:
+                raise MalformedQueryError("Query cursor can't be used together with offset")
+            if not self.cursor:
+                return None
+            try:
+                position = json.loads(base64.urlsafe_b64decode(self.cursor.encode()).decode())
+                fields = [field for field, _value in position]
+                values = [value for _field, value in position]
+            except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+                raise MalformedQueryError(f"Invalid query cursor: {e}")
+            if fields != [field for field, _order in self.get_keyset(primary_key)]:
+                raise MalformedQueryError(f"Query cursor was made for other ordering: {fields}")
+            return values
+
+        def get_projection(self, model: Type[BaseModel]) -> Optional[List[str]]:
+            """
+            Get model fields which should be returned by the query. Primary key is always
+            returned, keyset fields are returned as well if the query has cursor, so the
+            returned objects can be used for `cursor_of` call.
+
+            :param Type[BaseModel] model: model of the queried objects
+            :return: names of the returned fields or None if objects are returned completely
+            """
+            if self.fields is None:
+                return None
+            projection = list(self.fields)
+            projection.append(model.primary_key)
+            if self.cursor is not None:
+                projection.extend(field for field, _order in self.get_keyset(model.primary_key))
+            unknown = [field for field in projection if field not in model.fields]
+            if unknown:
+                raise MalformedQueryError(f"Unknown query fields: {', '.join(unknown)}")
+            return list(dict.fromkeys(projection))  # drop duplicates keeping the order
+
+        def to_primitive(self, canonical: bool = False) -> dict:
+            """
+            Get JSON-compatible representation of query parameters
+
+            :param bool canonical: use canonical filter representation
+            :return: dict with set parameters only
+            """
+            primitive = dict()
+            if self.filter_by is not None:
+                primitive["filter_by"] = self.filter_by.get_canonical() if canonical \
+                    else self.filter_by.to_primitive()
+            sort_keys = [[field, order.value] for field, order in self.get_sort_keys()]
+            if len(sort_keys) == 1:
+                primitive["order_by"] = sort_keys[0]
+            elif sort_keys:
+                primitive["order_by"] = sort_keys
+            if self.limit is not None:
+                primitive["limit"] = self.limit
+            if self.offset is not None:
+                primitive["offset"] = self.offset
+            if self.cursor is not None:
+                primitive["after"] = self.cursor
+            if self.fields is not None:
+                primitive["select"] = list(self.fields)
+            return primitive
+
+    def __init__(self, order_by: Union[OrderBy, List[OrderBy]] = None, filter_by: IFilter = None,
+                 limit: int = None, offset: int = None, cursor: str = None,
+                 fields: List[str] = None):
+
+        self.data = self.Data(order_by, filter_by, limit, offset, cursor, fields)
+
+    # NOTE: Query is mutable builder, so its hash is calculated from the current parameters.
+    #  Query must not be changed while it is used as a key, use fingerprint() to keep the key
+    def fingerprint(self) -> str:
+        """
+        Get stable fingerprint of the query, it is the same for structurally equal queries
+        across processes
+
+        :return: hex digest
+        """
+        return fingerprint_of([type(self).__name__, self.data.to_primitive(canonical=True)])
+
+    def __eq__(self, other):
+        if not isinstance(other, Query):
+            return NotImplemented
+        return self.fingerprint() == other.fingerprint()
+
+    def __hash__(self):
+        return hash(self.fingerprint())
 
-    def __init__(self, order_by: OrderBy = None, filter_by: IFilter = None, limit: int = None,
-                 offset: int = None):
+    def to_primitive(self) -> dict:
+        return self.data.to_primitive()
 
-        self.data = self.Data(order_by, filter_by, limit, offset)
+    def to_json(self) -> str:
+        return json.dumps(self.to_primitive(), separators=(",", ":"))
+
+    @classmethod
+    def from_primitive(cls, data: dict) -> "Query":
+        """
+        Restore query from representation made by to_primitive
+
+        :param dict data: dict representation
+        :return: query object
+        """
+        if not isinstance(data, dict):
+            raise MalformedQueryError(f"Invalid query representation: {data}")
+        query = cls()
+        query._load_primitive(dict(data))
+        return query
+
+    @classmethod
+    def from_json(cls, data: str) -> "Query":
+        return cls.from_primitive(json.loads(data))
+
+    def _load_primitive(self, data: dict) -> None:
+        if "filter_by" in data:
+            self.filter_by(IFilter.from_primitive(data.pop("filter_by")))
+        if "order_by" in data:
+            sort_keys = data.pop("order_by")
+            if sort_keys and not isinstance(sort_keys[0], list):
+                sort_keys = [sort_keys]  # single sort key
+            for field, order in sort_keys:
+                self.order_by(field, SortOrder(order))
+        if "limit" in data:
+            self.limit(data.pop("limit"))
+        if "offset" in data:
+            self.offset(data.pop("offset"))
+        if "after" in data:
+            self.after(data.pop("after"))
+        if "select" in data:
+            self.select(*data.pop("select"))
+        if data:
+            raise MalformedQueryError(f"Unknown query parameters: {', '.join(data)}")
 
-    # TODO: order_by can be chained and we can store an array of fields to sort by them
     def order_by(self, by_field: BaseType, by_order: SortOrder = SortOrder.ASC):
         """
-        Set Query order_by parameter
+        Add Query sort key. Calls can be chained, objects are ordered by the first key and
+        objects with equal values of it are ordered by the next one and so on:
+
+            query = Query().order_by(Model.severity, SortOrder.DESC).order_by(Model.time)
 
         :param BaseType by_field: particular field to perform ordering
         :param int by_order: direction of ordering
 
         """
-        self.data.order_by = OrderBy(by_field, by_order)
+        self.data.sort_by.append(OrderBy(by_field, by_order))
         return self
 
     def filter_by(self, by_filter: IFilter):
@@ -114,6 +294,51 @@ class Query:
         self.data.offset = offset
         return self
 
+    def after(self, cursor: str = ""):
+        """
+        Set Query cursor parameter to use keyset pagination. Objects are ordered by sort keys
+        and primary key, the query returns objects which follow the object the cursor
+        was made for. Unlike offset, cost of the page request doesn't depend on the page number.
+
+            query = Query().filter_by(some_filter).order_by(Model.time).limit(100).after()
+            page = await db(Model).get(query)
+            while page:
+                process(page)
+                page = await db(Model).get(query.after(query.cursor_of(page[-1])))
+
+        :param str cursor: cursor made by `cursor_of` call, empty cursor means the first page
+        :return:
+        """
+        self.data.cursor = cursor
+        return self
+
+    def select(self, *fields: BaseType):
+        """
+        Set Query fields parameter: only selected fields (and primary key) of the objects are
+        fetched from Storage. Returned model objects are partial, not selected fields have
+        default values.
+
+            query = Query().select(AlertModel.severity, AlertModel.state).limit(100)
+
+        :param fields: model fields to be returned
+        :return:
+        """
+        self.data.fields = [field_to_str(field) for field in fields]
+        return self
+
+    def cursor_of(self, obj: BaseModel) -> str:
+        """
+        Make cursor pointing after the given object in the query order
+
+        :param BaseModel obj: object returned by the query, usually the last one of the page
+        :return: opaque cursor token
+        """
+        position = list()
+        for field, _order in self.data.get_keyset(obj.primary_key):
+            position.append([field, obj.fields[field].to_primitive(getattr(obj, field))])
+        dump = json.dumps(position, separators=(",", ":"))
+        return base64.urlsafe_b64encode(dump.encode()).decode()
+
     # TODO: having functionality
 
 
@@ -121,19 +346,31 @@ class ExtQuery(Query):
 
     """Storage Extended Query API used by Storage aggregation functions"""
 
-    class Data:
+    class Data(Query.Data):
 
         """Data storage class for Query parameters"""
 
         # TODO: it can be a schematics model
         def __init__(self, order_by: OrderBy = None, group_by: BaseType = None,
-                     filter_by: IFilter = None, limit: int = None, offset: int = None):
+                     filter_by: IFilter = None, limit: int = None, offset: int = None,
+                     aggregate: BaseType = None):
 
             self.order_by = order_by
             self.group_by = group_by
             self.filter_by = filter_by
             self.limit = limit
             self.offset = offset
+            self.cursor = None
+            self.fields = None
+            self.aggregate = aggregate
+
+        def to_primitive(self, canonical: bool = False) -> dict:
+            primitive = super().to_primitive(canonical)
+            if self.group_by is not None:
+                primitive["group_by"] = field_to_str(self.group_by)
+            if self.aggregate is not None:
+                primitive["aggregate"] = field_to_str(self.aggregate)
+            return primitive
 
     def __init__(self):
         super().__init__()
@@ -147,3 +384,24 @@ class ExtQuery(Query):
         """
         self.data.group_by = by_field
         return self
+
+    def aggregate(self, field: BaseType):
+        """
+        Set Query aggregate parameter: field which values are aggregated by sum, avg, min and
+        max aggregation functions
+
+            ext_query = ExtQuery().filter_by(some_filter).aggregate(Model.size).group_by(Model.type)
+            total_size_by_type = await db(Model).sum(ext_query)
+
+        :param BaseType field: field for aggregation
+        :return:
+        """
+        self.data.aggregate = field
+        return self
+
+    def _load_primitive(self, data: dict) -> None:
+        if "group_by" in data:
+            self.group_by(data.pop("group_by"))
+        if "aggregate" in data:
+            self.aggregate(data.pop("aggregate"))
+        super()._load_primitive(data)
@@ -16,13 +16,50 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 from abc import ABC, abstractmethod
-from typing import Type, Union, Any
+from typing import Type, Union, Any, AsyncIterator, Dict, Iterable
 from cortx.utils.data.access import Query
 from cortx.utils.data.access import ExtQuery
 from cortx.utils.data.access import IFilter
 from cortx.utils.data.access import BaseModel
 
 
+# Default number of objects fetched from Storage by one request during iteration
+ITERATION_BATCH_SIZE = 1000
+
+
+class BulkWriteResult:
+    """
+    Per-object outcome of bulk write call. Objects are identified by primary key values
+    """
+
+    def __init__(self):
+        self.succeeded = list()  # ids of written objects
+        self.missing = list()  # ids of objects which are not found for update or delete
+        self.errors = dict()  # id -> error description for objects which were not written
+
+    def add_success(self, obj_id: Any) -> None:
+        self.succeeded.append(obj_id)
+
+    def add_missing(self, obj_id: Any) -> None:
+        self.missing.append(obj_id)
+
+    def add_error(self, obj_id: Any, error: str) -> None:
+        self.errors[obj_id] = error
+
+    def merge(self, other: "BulkWriteResult") -> None:
+        self.succeeded.extend(other.succeeded)
+        self.missing.extend(other.missing)
+        self.errors.update(other.errors)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(succeeded={len(self.succeeded)}, "
+                f"missing={len(self.missing)}, errors={self.errors})")
+
+
 class IDataBase(ABC):
     """Abstract Storage Interface"""
 
@@ -35,6 +72,17 @@ class IDataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def store_many(self, objs: Iterable[BaseModel]) -> BulkWriteResult:
+        """
+        Store objects into Storage using as few requests as possible. Failure to store one
+        object doesn't stop storing of the others.
+
+        :param objs: model objects for storing into DB
+        :return: result with ids of stored objects and errors of objects which were not stored
+        """
+        pass
+
     @abstractmethod
     async def get(self, query: Query):
         """Get object from Storage by Query
@@ -44,6 +92,23 @@ class IDataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def iterate(self, query: Query,
+                batch_size: int = ITERATION_BATCH_SIZE) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over objects which satisfy the query. Objects are fetched from Storage by
+        batches, so memory usage doesn't depend on the result size and the first objects are
+        available before the whole result is fetched. For example,
+
+            async for obj in db(YourBaseModel).iterate(Query().filter_by(some_filter)):
+                process(obj)
+
+        :param Query query: query object which describes request to Storage
+        :param int batch_size: number of objects fetched from Storage by one request
+        :return: asynchronous iterator over objects
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, obj_id: Any) -> Union[BaseModel, None]:
         """
@@ -63,6 +128,22 @@ class IDataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values at once. Storages fetch the objects
+        by batched requests instead of one query per object.
+
+        This API call is equivalent to
+
+            await db(YourBaseModel).get(Query().filter_by(
+                                                    In(YourBaseModel.primary_key, obj_ids)))
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        pass
+
     @abstractmethod
     async def update(self, filter_obj: IFilter, to_update: dict) -> int:
         """
@@ -85,6 +166,18 @@ class IDataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_many(self, to_update: Dict[Any, dict]) -> BulkWriteResult:
+        """
+        Update objects in Storage by their ids (primary keys) using as few requests as possible
+
+        :param dict to_update: object id -> dictionary with fields and values which should be
+                               updated
+        :return: result with ids of updated and not found objects and errors of objects which
+                 were not updated
+        """
+        pass
+
     @abstractmethod
     async def delete(self, filter_obj: IFilter) -> int:
         """
@@ -106,11 +199,24 @@ class IDataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def delete_many(self, obj_ids: Iterable[Any]) -> BulkWriteResult:
+        """
+        Delete objects by their ids (primary keys) using as few requests as possible
+
+        :param obj_ids: ids of the objects to be deleted
+        :return: result with ids of deleted and not found objects and errors of objects which
+                 were not deleted
+        """
+        pass
+
     @abstractmethod
     async def sum(self, ext_query: ExtQuery):
         """Sum Aggregation function
 
             :param ExtQuery ext_query: Extended query which describes how to perform sum aggregation
+            :return: sum of the aggregate field values of the objects which satisfy the query
+                     filter or dict group_by field value -> sum of the group if group_by is set
 
         """
         pass
@@ -121,6 +227,8 @@ class IDataBase(ABC):
 
             :param ExtQuery ext_query: Extended query which describes how to perform average
                                        aggregation
+            :return: average of the aggregate field values (None if there are no values) or
+                     dict group_by field value -> average of the group if group_by is set
 
         """
         pass
@@ -141,7 +249,8 @@ class IDataBase(ABC):
         Count Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes to perform count aggregation
-        :return:
+        :return: number of objects which satisfy the query filter or dict group_by field
+                 value -> number of objects in the group if group_by is set
         """
         pass
 
@@ -150,6 +259,8 @@ class IDataBase(ABC):
         """Max Aggregation function
 
             :param ExtQuery ext_query: Extended query which describes how to perform Max aggregation
+            :return: max of the aggregate field values (None if there are no values) or dict
+                     group_by field value -> max of the group if group_by is set
 
         """
         pass
@@ -159,6 +270,8 @@ class IDataBase(ABC):
         """Min Aggregation function
 
             :param ExtQuery ext_query: Extended query which describes how to perform Min aggregation
+            :return: min of the aggregate field values (None if there are no values) or dict
+                     group_by field value -> min of the group if group_by is set
 
         """
         pass
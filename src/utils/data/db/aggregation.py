@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+from cortx.utils.data.access import BaseModel, ExtQuery
+from cortx.utils.data.access.filters import field_to_str
+from cortx.utils.errors import DataAccessInternalError
+
+
+class AggregationFunction:
+    """Names of the aggregation functions"""
+
+    COUNT = "count"
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+
+    # functions which need ExtQuery aggregate field
+    METRICS = frozenset((SUM, AVG, MIN, MAX))
+
+
+def get_aggregation_fields(model: Type[BaseModel], function: str,
+                           ext_query: ExtQuery) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get and check model fields of the aggregation
+
+    :param Type[BaseModel] model: model of the aggregated objects
+    :param str function: aggregation function name
+    :param ExtQuery ext_query: extended query of the aggregation
+    :return: names of the aggregated field (None for count) and of the group_by field (or None)
+    """
+    data = ext_query.data
+    value_field = None
+    if function in AggregationFunction.METRICS:
+        if data.aggregate is None:
+            raise DataAccessInternalError(f"Field for {function} aggregation is not set")
+        value_field = field_to_str(data.aggregate)
+    group_field = field_to_str(data.group_by) if data.group_by is not None else None
+
+    for field in (value_field, group_field):
+        if field is not None and field not in model.fields:
+            raise DataAccessInternalError(f"Model {model.__name__} doesn't have field '{field}'")
+    return value_field, group_field
+
+
+class StreamAggregator:
+    """
+    Single-pass aggregation of values, optionally grouped by key. Only running counters are
+    kept per group, so memory usage doesn't depend on the number of aggregated values.
+    """
+
+    def __init__(self, function: str):
+        """
+
+        :param str function: aggregation function name, see `AggregationFunction`
+        """
+        self._function = function
+        # group key -> [number of values, sum, min, max]
+        self._groups = dict()
+
+    def add(self, value: Any, group: Any = None) -> None:
+        """
+        Add the value of the next object
+
+        :param value: aggregated field value, None values are counted by count function only
+        :param group: group_by field value
+        :return:
+        """
+        state = self._groups.get(group)
+        if state is None:
+            state = self._groups[group] = [0, 0, None, None]
+        if self._function == AggregationFunction.COUNT:
+            state[0] += 1
+            return
+        if value is None:
+            return
+
+        state[0] += 1
+        if self._function in (AggregationFunction.SUM, AggregationFunction.AVG):
+            state[1] += value
+        elif self._function == AggregationFunction.MIN:
+            state[2] = value if state[2] is None else min(state[2], value)
+        else:
+            state[3] = value if state[3] is None else max(state[3], value)
+
+    def _result_of(self, state: Optional[list]) -> Any:
+        count, total, minimum, maximum = state or (0, 0, None, None)
+        if self._function == AggregationFunction.COUNT:
+            return count
+        if self._function == AggregationFunction.SUM:
+            return total
+        if self._function == AggregationFunction.AVG:
+            return total / count if count else None
+        return minimum if self._function == AggregationFunction.MIN else maximum
+
+    def get_result(self) -> Any:
+        """
+        Get aggregation result of all added values
+
+        :return: aggregated value
+        """
+        return self._result_of(self._groups.get(None))
+
+    def get_grouped_result(self) -> Dict[Any, Any]:
+        """
+        Get aggregation results per group
+
+        :return: dict group value -> aggregated value of the group
+        """
+        return {group: self._result_of(state) for group, state in self._groups.items()}
@@ -16,27 +16,37 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import asyncio
+import base64
 import multiprocessing
 from concurrent.futures import ThreadPoolExecutor
 from string import Template
-from typing import List, Type, Union, Dict
+from functools import partial
+from typing import (List, Type, Union, Dict, Set, Optional, Any, AsyncIterator, Iterable,
+                    Callable, Awaitable)
 from datetime import datetime
+from urllib.parse import quote
 import json
-import operator
 
 from aiohttp import ClientConnectorError
+from consul import ConsulException
 from consul.aio import Consul
-from schematics.types import BaseType, StringType
+from schematics.undefined import Undefined
 from schematics.exceptions import ConversionError
 
 from cortx.utils.data.access import Query, SortOrder, IDataBase
 from cortx.utils.data.access import ExtQuery
 from cortx.utils.data.db import GenericDataBase, GenericQueryConverter
-from cortx.utils.data.access import BaseModel
+from cortx.utils.data.access import BaseModel, BulkWriteResult
 from cortx.utils.errors import DataAccessExternalError, DataAccessInternalError, \
-    DataAccessError
+    DataAccessError, MalformedConfigurationError, MalformedQueryError
 from cortx.utils.data.access.filters import FilterOperationCompare
-from cortx.utils.data.access.filters import ComparisonOperation, IFilter
+from cortx.utils.data.access.filters import ComparisonOperation, IFilter, Compare
+from cortx.utils.data.access.filters import field_to_str
+from cortx.utils.data.access.filter_compiler import compile_filter
+from cortx.utils.data.access.filter_optimizer import FilterOptimizer, is_contradiction
+from cortx.utils.data.access.storage import ITERATION_BATCH_SIZE
+from cortx.utils.data.db.aggregation import StreamAggregator, get_aggregation_fields
+from cortx.utils.data.db.ordering import make_position_key, make_sort_key, select_ordered
 
 CONSUL_ROOT = "cortx/base"
 OBJECT_DIR = "obj"
@@ -47,88 +57,474 @@ class ConsulWords:
 
     VALUE = "Value"
     KEY = "Key"
-
-def field_to_str(field: Union[str, BaseType]) -> str:
+    MODIFY_INDEX = "ModifyIndex"
+    KV = "KV"
+    VERB = "Verb"
+    SET = "set"
+    DELETE = "delete"
+    CAS = "cas"
+    CHECK_INDEX = "check-index"
+    INDEX = "Index"
+    ERRORS = "Errors"
+    RESULTS = "Results"
+    OP_INDEX = "OpIndex"
+    WHAT = "What"
+
+
+class ConsulEntry:
+    """
+    Consul object entry with once decoded JSON value. Model fields are converted to native
+    values only when filter or ordering needs them and model object is created on demand.
     """
-    Convert model field to its string representation
 
-    :param Union[str, BaseType] field:
-    :return: model field string representation
+    __slots__ = ("key", "value", "modify_index", "_model", "_native")
+
+    def __init__(self, model: Type[BaseModel], key: str, value: dict, modify_index: int = None):
+        """
+
+        :param Type[BaseModel] model: model of the stored object
+        :param str key: consul key of the object
+        :param dict value: primitive representation of the object
+        :param int modify_index: consul modify index of the entry
+        """
+        self._model = model
+        self.key = key
+        self.value = value
+        self.modify_index = modify_index
+        self._native = dict()
+
+    @classmethod
+    def from_raw(cls, model: Type[BaseModel], raw_entry: Dict) -> "ConsulEntry":
+        """
+        Decode raw consul entry
+
+        :param Type[BaseModel] model: model of the stored object
+        :param dict raw_entry: raw consul entry returned by consul client
+        :return: decoded entry
+        """
+        return cls(model, raw_entry[ConsulWords.KEY], json.loads(raw_entry[ConsulWords.VALUE]),
+                   raw_entry.get(ConsulWords.MODIFY_INDEX))
+
+    def get_native(self, field_str: str) -> Any:
+        """
+        Get native value of the model field in the same way as model object does it
+
+        :param str field_str: model field name
+        :return: native field value
+        """
+        if field_str not in self._native:
+            field = self._model.fields[field_str]
+            value = self.value.get(field.serialized_name or field_str, Undefined)
+            if value is Undefined:
+                value = field.default
+            self._native[field_str] = field.to_native(value) if value is not None else None
+        return self._native[field_str]
+
+    def to_model(self, fields: Optional[List[str]] = None) -> BaseModel:
+        """
+        Create new model object from the entry value
+
+        :param list fields: names of the fields to be set, object is created completely if it
+                            is not set
+        :return: model object
+        """
+        if fields is None:
+            return self._model(self.value)
+
+        partial_value = dict()
+        for field_str in fields:
+            name = self._model.fields[field_str].serialized_name or field_str
+            if name in self.value:
+                partial_value[name] = self.value[name]
+        return self._model(partial_value)
+
+
+def decode_raw_entries(model: Type[BaseModel], raw_data: List[Dict]) -> List[ConsulEntry]:
+    return [ConsulEntry.from_raw(model, raw_entry) for raw_entry in raw_data]
+
+
+class ConsulTxnWrite:
     """
-    if isinstance(field, str):
-        return field
-    elif isinstance(field, BaseType):
-        return field.name
-    else:
-        raise DataAccessInternalError(
-            "Failed to convert field to string representation")
-
-class ConsulQueryConverterWithData(GenericQueryConverter):
+    Write of a single object by consul transaction operations. Operations of the write are
+    always put into the same transaction.
     """
-    Implementation of filter tree visitor which performs query tree traversal in parallel with
-    data filtering based on given filter logical and comparison operations
+
+    __slots__ = ("obj_id", "operations", "on_success", "on_conflict", "attempt")
+
+    def __init__(self, obj_id: Any, operations: List[dict],
+                 on_success: Callable[[Optional[int]], None],
+                 on_conflict: Optional[Callable[[], Awaitable[Optional["ConsulTxnWrite"]]]] = None):
+        """
+
+        :param obj_id: primary key value of the written object
+        :param list operations: consul transaction operations of the object
+        :param on_success: function which is called after the object is written, it gets
+                           consul index of the transaction or None if it is unknown
+        :param on_conflict: coroutine function which makes the write again from the current
+                            object state if check-and-set operations of the write failed. It
+                            returns None if the object is not found anymore
+        """
+        self.obj_id = obj_id
+        self.operations = operations
+        self.on_success = on_success
+        self.on_conflict = on_conflict
+        self.attempt = 0
+
+
+class ConsulQueryConverterWithData:
+    """
+    Filters decoded consul entries by single pass of the compiled filter predicate over them
 
     Usage:
-    converter = ConsulQueryConverter()
-    q_obj = converter.build(filter_root)
+    converter = ConsulQueryConverterWithData(model)
+    suitable_entries = converter.build(filter_root, entries)
     """
 
     def __init__(self, model):
         # Needed to perform for type casting if field name is pure string,
         # not of format Model.field
         self._model = model
-        self._operator = {
-            ComparisonOperation.OPERATION_EQ: operator.eq,
-            ComparisonOperation.OPERATION_NE: operator.ne,
-            ComparisonOperation.OPERATION_GEQ: operator.ge,
-            ComparisonOperation.OPERATION_LEQ: operator.le,
-            ComparisonOperation.OPERATION_GT: operator.gt,
-            ComparisonOperation.OPERATION_LT: operator.lt,
-            ComparisonOperation.OPERATION_LIKE: operator.contains
-        }
-        self._raw_data = None
-        self._object_data = None
-
-    def _filter(self, suitable_keys: List[str]):
-        return filter(lambda x: x[ConsulWords.KEY] in suitable_keys,
-                      self._raw_data)
-
-    def build(self, root: IFilter, raw_data: List[Dict]):
+
+    def build(self, root: IFilter, entries: List[ConsulEntry]) -> List[ConsulEntry]:
+        """
+        Filter decoded consul entries
+
+        :param IFilter root: filter object
+        :param list entries: decoded consul entries
+        :return: entries which satisfy the filter in the same order
+        """
         # TODO: may be, we should move this method to the entity that processes
         # Query objects
-        self._raw_data = raw_data
-        self._object_data = {
-            entry[ConsulWords.KEY]: self._model(
-                json.loads(entry[ConsulWords.VALUE])) for entry in
-            self._raw_data}
-        return self._filter(root.accept_visitor(self))
+        predicate = compile_filter(self._model, root, ConsulEntry.get_native)
+        return [entry for entry in entries if predicate(entry)]
+
+def query_converter_build(model: Type[BaseModel], filter_obj: IFilter,
+                          raw_data: List[Dict]) -> List[ConsulEntry]:
+    query_converter = ConsulQueryConverterWithData(model)
+    return query_converter.build(filter_obj, decode_raw_entries(model, raw_data))
+
+
+class ConsulKeyPlan:
+    """
+    Base class for the plans built by ConsulQueryPlanner. Each plan describes how to obtain
+    a set of object keys which is a superset of keys satisfying the filter.
+    """
+
+    def __and__(self, other: "ConsulKeyPlan") -> "ConsulKeyPlan":
+        if isinstance(other, ConsulFullScanPlan):
+            return self
+        return ConsulIntersectionPlan(self, other)
+
+    def __or__(self, other: "ConsulKeyPlan") -> "ConsulKeyPlan":
+        if isinstance(other, ConsulFullScanPlan):
+            return other
+        return ConsulUnionPlan(self, other)
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        """
+        Get set of object keys which are candidates for the filter
+
+        :param dict fetched: raw consul entries which are already fetched by plans, the plan
+                             can put there entries fetched during resolving
+        :return: set of consul object keys
+        """
+        raise NotImplementedError
+
+
+class ConsulFullScanPlan(ConsulKeyPlan):
+    """Plan which means that candidates can't be narrowed and whole collection is needed"""
+
+    def __and__(self, other: ConsulKeyPlan) -> ConsulKeyPlan:
+        return other
+
+    def __or__(self, other: ConsulKeyPlan) -> ConsulKeyPlan:
+        return self
+
+
+class ConsulIndexLookupPlan(ConsulKeyPlan):
+    """Plan which reads object keys from the secondary property index"""
+
+    def __init__(self, consul_db: "ConsulDB", field: str, value):
+        self._consul_db = consul_db
+        self._field = field
+        self._value = value
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        return await self._consul_db.get_indexed_keys(self._field, self._value)
+
+
+class ConsulKeyLookupPlan(ConsulKeyPlan):
+    """Plan which contains already known object keys, e.g. keys built from primary key values"""
+
+    def __init__(self, keys: Set[str]):
+        self._keys = keys
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        return set(self._keys)
+
+
+class ConsulPrefixScanPlan(ConsulKeyPlan):
+    """Plan which reads all objects under the key prefix built from primary key prefix"""
+
+    def __init__(self, consul_db: "ConsulDB", prefix: str):
+        self._consul_db = consul_db
+        self.prefix = prefix
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        raw_data = await self._consul_db.get_raw_by_prefix(self.prefix)
+        fetched.update((entry[ConsulWords.KEY], entry) for entry in raw_data)
+        return set(entry[ConsulWords.KEY] for entry in raw_data)
+
+
+class ConsulIntersectionPlan(ConsulKeyPlan):
+    """Plan which intersects candidates of nested plans"""
+
+    def __init__(self, *plans: ConsulKeyPlan):
+        self._plans = plans
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        key_sets = await asyncio.gather(*(plan.resolve(fetched) for plan in self._plans))
+        return set.intersection(*key_sets)
+
+
+class ConsulUnionPlan(ConsulKeyPlan):
+    """Plan which unites candidates of nested plans"""
+
+    def __init__(self, *plans: ConsulKeyPlan):
+        self._plans = plans
+
+    async def resolve(self, fetched: Dict[str, Dict]) -> Set[str]:
+        key_sets = await asyncio.gather(*(plan.resolve(fetched) for plan in self._plans))
+        return set.union(*key_sets)
+
+
+class ConsulQueryPlanner(GenericQueryConverter):
+    """
+    Implementation of filter tree visitor which builds ConsulKeyPlan for given filter.
+    Comparisons which can't be served by key lookups produce full collection scan.
+
+    Usage:
+    planner = ConsulQueryPlanner(consul_db)
+    plan = planner.build(filter_root)
+    """
+
+    def __init__(self, consul_db: "ConsulDB"):
+        self._consul_db = consul_db
+
+    def build(self, root: IFilter) -> ConsulKeyPlan:
+        return root.accept_visitor(self)
 
     def handle_compare(self, entry: FilterOperationCompare):
         super().handle_compare(entry)  # Call the generic code
 
-        field = entry.get_left_operand()
+        field_str = field_to_str(entry.get_left_operand())
+        op = entry.get_operation()
+        if op == ComparisonOperation.OPERATION_STARTS_WITH and \
+                field_str == self._consul_db.primary_key:
+            prefix = self._consul_db.get_object_prefix(entry.get_right_operand())
+            return ConsulPrefixScanPlan(self._consul_db, prefix)
+        if op == ComparisonOperation.OPERATION_IN:
+            return self._plan_in(field_str, entry.get_right_operand())
+        if op != ComparisonOperation.OPERATION_EQ:
+            return ConsulFullScanPlan()
+
+        if field_str == self._consul_db.primary_key:
+            obj_path = self._consul_db.get_object_path(entry.get_right_operand())
+            return ConsulKeyLookupPlan({obj_path})
+        if self._consul_db.is_indexed(field_str):
+            return ConsulIndexLookupPlan(self._consul_db, field_str, entry.get_right_operand())
+
+        return ConsulFullScanPlan()
+
+    def _plan_in(self, field_str: str, values) -> ConsulKeyPlan:
+        """
+        Build plan of "in" comparison as union of lookups of each value
 
-        field_str = field_to_str(field)
+        :param str field_str: field name
+        :param values: list of the field values
+        :return: key plan
+        """
+        if not isinstance(values, (list, tuple)):
+            return ConsulFullScanPlan()  # NOTE: malformed comparison is reported by the filter
+        values = [value for value in values if value is not None]
+        if field_str == self._consul_db.primary_key:
+            return ConsulKeyLookupPlan({self._consul_db.get_object_path(value)
+                                        for value in values})
+        if not self._consul_db.is_indexed(field_str):
+            return ConsulFullScanPlan()
+        if not values:
+            return ConsulKeyLookupPlan(set())
+        return ConsulUnionPlan(*(ConsulIndexLookupPlan(self._consul_db, field_str, value)
+                                 for value in values))
+
+class ConsulCollectionReplica:
+    """
+    In-process deserialized copy of the consul object collection. It is kept up to date by
+    background task which performs consul blocking queries on the object directory.
+    """
 
-        op = entry.get_operation()
-        try:
-            right_operand = getattr(self._model, field_str).to_native(
-                entry.get_right_operand())
-        except ConversionError as e:
-            raise DataAccessInternalError(f"{e}")
-        if not entry.get_operation() != ComparisonOperation.OPERATION_LIKE:
-            return set(entry_key for entry_key in filter(lambda x: self._operator[op](
-            getattr(self._object_data[x], field_str),right_operand),
-                                                         self._object_data.keys()))
-        else:
-            return set(entry_key for entry_key in filter(lambda x: self._operator[op](
-                right_operand, getattr(self._object_data[x], field_str)),
-                                                         self._object_data.keys()))
+    _RETRY_DELAY = 1  # seconds before the next attempt to query consul after a failure
+
+    def __init__(self, consul_client: Consul, model: Type[BaseModel], obj_dir: str,
+                 staleness: float, loop: asyncio.AbstractEventLoop):
+        """
+
+        :param Consul consul_client: consul client
+        :param Type[BaseModel] model: model of the collection objects
+        :param str obj_dir: consul object directory with trailing "/"
+        :param float staleness: max age in seconds of the last confirmed synchronization
+                                allowing to serve reads from the replica
+        :param AbstractEventLoop loop: asyncio event loop
+        """
+        self._consul_client = consul_client
+        self._model = model
+        self._obj_dir = obj_dir
+        self._staleness = staleness
+        self._loop = loop
+        # NOTE: blocking query returns at least once per wait period even without changes, so
+        #  healthy watch confirms the replica state within staleness interval
+        self._wait = f"{max(1, int(staleness / 2))}s"
+        self._index = None
+        self._last_sync = None
+        self._entries = dict()
+        # NOTE: local writes are kept over responses which may not contain them yet
+        self._local_writes = dict()  # key -> (write sequence number, consul index or None)
+        self._write_sequence = 0
+        self._task = None
+        self._running = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.ensure_future(self._watch(), loop=self._loop)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._running = False
+            self._task.cancel()
+            await asyncio.wait([self._task])
+            self._task = None
+        self._last_sync = None
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the replica can be used to serve reads
+
+        :return: `True` if last confirmed synchronization is not older than allowed staleness
+        """
+        return self._last_sync is not None and \
+            self._loop.time() - self._last_sync <= self._staleness
+
+    async def _watch(self) -> None:
+        while self._running:
+            sequence = self._write_sequence
+            try:
+                index, data = await self._consul_client.kv.get(self._obj_dir, recurse=True,
+                                                               index=self._index,
+                                                               wait=self._wait)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # NOTE: reads are served by consul until watch is restored
+                self._last_sync = None
+                self._index = None
+                await asyncio.sleep(self._RETRY_DELAY)
+                continue
+
+            if self._index is not None and int(index) < int(self._index):
+                # consul index can go backwards, e.g. after snapshot restore
+                self._index = None
+                continue
+
+            if index != self._index:
+                self._load(data or list(), int(index), sequence)
+                self._index = index
+            self._last_sync = self._loop.time()
+
+    def _load(self, raw_data: List[Dict], index: int, sequence: int) -> None:
+        """
+        Replace replica content. Only changed objects are decoded. Local writes which are
+        newer than the response keep their state.
+
+        :param list raw_data: list of raw consul entries of the collection
+        :param int index: consul index of the response
+        :param int sequence: local write sequence number at the moment of the request
+        :return:
+        """
+        entries = dict()
+        for raw_entry in raw_data:
+            key = raw_entry[ConsulWords.KEY]
+            entry = self._entries.get(key)
+            if entry is None or entry.modify_index is None or \
+                    entry.modify_index != raw_entry.get(ConsulWords.MODIFY_INDEX):
+                entry = ConsulEntry.from_raw(self._model, raw_entry)
+            entries[key] = entry
+
+        for key, (write_sequence, write_index) in list(self._local_writes.items()):
+            # NOTE: the response contains the write if the request was made after the write
+            #  or the response index is not older than the index of the write transaction
+            if write_sequence <= sequence or (write_index is not None and write_index <= index):
+                del self._local_writes[key]
+            elif key in self._entries:
+                entries[key] = self._entries[key]
+            else:
+                entries.pop(key, None)
+
+        self._entries = entries
+
+    def _add_local_write(self, key: str, index: Optional[int]) -> None:
+        self._write_sequence += 1
+        self._local_writes[key] = (self._write_sequence, index)
+
+    def put(self, key: str, value: dict, index: Optional[int] = None) -> None:
+        """
+        Apply local write to the replica, so reads after writes see the written object
+
+        :param str key: consul object key
+        :param dict value: primitive representation of the object
+        :param index: consul index of the write or None if it is unknown
+        :return:
+        """
+        self._entries[key] = ConsulEntry(self._model, key, value)
+        self._add_local_write(key, index)
+
+    def remove(self, key: str, index: Optional[int] = None) -> None:
+        """
+        Apply local delete to the replica
+
+        :param str key: consul object key
+        :param index: consul index of the delete or None if it is unknown
+        :return:
+        """
+        self._entries.pop(key, None)
+        self._add_local_write(key, index)
+
+    def remove_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self.remove(key)
+
+    def get_entries(self, filter_obj: Optional[IFilter]) -> List[ConsulEntry]:
+        """
+        Get replica entries which satisfy the filter. Entries are shared, so they must not
+        be changed.
+
+        :param IFilter filter_obj: filter object or None
+        :return: list of decoded consul entries
+        """
+        if filter_obj is None:
+            return list(self._entries.values())
+        converter = ConsulQueryConverterWithData(self._model)
+        return converter.build(filter_obj, list(self._entries.values()))
+
+    def get_entry(self, key: str) -> Optional[ConsulEntry]:
+        """
+        Get replica entry by consul key
+
+        :param str key: consul object key
+        :return: decoded consul entry or None if there is no object with the key
+        """
+        return self._entries.get(key)
 
-def query_converter_build(model: BaseModel, filter_obj: IFilter,
-                          raw_data: List[Dict]):
-    query_converter = ConsulQueryConverterWithData(model)
-    return query_converter.build(filter_obj, raw_data)
 
 class ConsulKeyTemplate:
     """Class-helper for storing consul key structure"""
@@ -136,12 +532,14 @@ class ConsulKeyTemplate:
     _OBJECT_ROOT = f"{CONSUL_ROOT}/$OBJECT_TYPE"
     _OBJECT_DIR = _OBJECT_ROOT + f"/{OBJECT_DIR}"
     _OBJECT_PATH = _OBJECT_DIR + "/$OBJECT_UUID"
-    _PROPERTY_DIR = _OBJECT_ROOT + f"/{PROPERTY_DIR}/$PROPERTY_NAME/$PROPERTY_VALUE"
+    _PROPERTY_ROOT = _OBJECT_ROOT + f"/{PROPERTY_DIR}/$PROPERTY_NAME"
+    _PROPERTY_DIR = _PROPERTY_ROOT + "/$PROPERTY_VALUE"
 
     def __init__(self):
         self._object_root = Template(self._OBJECT_ROOT)
         self._object_dir = Template(self._OBJECT_DIR)
         self._object_path = Template(self._OBJECT_PATH)
+        self._property_root = Template(self._PROPERTY_ROOT)
         self._property_dir = Template(self._PROPERTY_DIR)
         self._object_type_is_set = False
 
@@ -158,6 +556,8 @@ class ConsulKeyTemplate:
             self._object_dir.substitute(OBJECT_TYPE=object_type))
         self._object_path = Template(
             self._object_path.safe_substitute(OBJECT_TYPE=object_type))
+        self._property_root = Template(
+            self._property_root.safe_substitute(OBJECT_TYPE=object_type))
         self._property_dir = Template(
             self._property_dir.safe_substitute(OBJECT_TYPE=object_type))
         self._object_type_is_set = True
@@ -181,6 +581,10 @@ class ConsulKeyTemplate:
         return self._render_template(self._object_path, object_type=object_type,
                                      OBJECT_UUID=object_uuid)
 
+    def get_property_root(self, property_name: str, object_type: str = None):
+        return self._render_template(self._property_root, object_type=object_type,
+                                     PROPERTY_NAME=property_name)
+
     def get_property_dir(self, property_name: str, property_value: str,
                          object_type: str = None):
         return self._render_template(self._property_dir, object_type=object_type,
@@ -194,10 +598,18 @@ class ConsulDB(GenericDataBase):
     thread_pool = None
     loop = None
 
+    # max number of operations in one consul transaction
+    _txn_max_operations = 64
+    # max number of simultaneous single key requests
+    _max_concurrent_reads = 32
+    # max number of attempts to rewrite the object which was changed concurrently during update
+    _cas_max_retries = 5
+
     def __init__(self, consul_client: Consul, model: Type[BaseModel],
                  collection: str,
                  process_pool: ThreadPoolExecutor,
-                 loop: asyncio.AbstractEventLoop = None):
+                 loop: asyncio.AbstractEventLoop = None,
+                 indexes: List[str] = None):
         """
 
         :param Consul consul_client: consul client
@@ -205,6 +617,7 @@ class ConsulDB(GenericDataBase):
         :param str collection: string represented collection for `model`
         :param ThreadPoolExecutor process_pool: thread pool executor
         :param AbstractEventLoop loop: asyncio event loop
+        :param List[str] indexes: model fields which have secondary property index
         """
         self._consul_client = consul_client
         self._collection = collection.lower()
@@ -228,15 +641,27 @@ class ConsulDB(GenericDataBase):
         self._templates.set_object_type(self._collection)
         self._model_scheme = dict()
 
+        self._replica = None
+
+        self._indexes = set(indexes or ())
+        unknown_fields = self._indexes - set(model.fields.keys())
+        if unknown_fields:
+            raise MalformedConfigurationError(f"Indexed fields are not presented in model "
+                                              f"{model.__name__}: {unknown_fields}")
+        # NOTE: primary key lookups are the cheapest, then secondary index lookups
+        self._filter_optimizer = FilterOptimizer(model,
+                                                 [model.primary_key] + sorted(self._indexes))
+
     @classmethod
     async def create_database(cls, config, collection: str,
-                              model: Type[BaseModel]) -> IDataBase:
+                              model: Type[BaseModel], model_settings=None) -> IDataBase:
         """
         Creates new instance of Consul KV DB and performs necessary initializations
 
         :param DBSettings config: configuration for consul kv server
         :param str collection: collection for storing model onto db
         :param Type[BaseModel] model: model which instances will be stored in DB
+        :param ModelSettings model_settings: model specific settings like indexed fields
         :return:
         """
         # NOTE: please, be sure that you avoid using this method twice (or more times) for the same
@@ -252,11 +677,15 @@ class ConsulDB(GenericDataBase):
             cls.thread_pool = ThreadPoolExecutor(
                 max_workers=multiprocessing.cpu_count())
 
+        indexes = model_settings.indexes if model_settings is not None else None
         consul_db = cls(cls.consul_client, model, collection, cls.thread_pool,
-                        cls.loop)
+                        cls.loop, indexes)
 
         try:
             await consul_db.create_object_root()
+            await consul_db.create_indexes()
+            if model_settings is not None and model_settings.replica_cache:
+                consul_db.start_replica(model_settings.replica_staleness)
         except ClientConnectorError as e:
             raise DataAccessExternalError(f"{e}")
         except Exception as e:
@@ -303,6 +732,265 @@ class ConsulDB(GenericDataBase):
 
         await _create_obj_dir()  # create if it is not exists
 
+    def start_replica(self, staleness: float) -> None:
+        """
+        Start maintaining local replica of the collection which serves get and count requests
+
+        :param float staleness: max age in seconds of the last confirmed replica synchronization
+        :return:
+        """
+        if self._replica is None:
+            obj_dir = self._templates.get_object_dir().lower() + "/"
+            self._replica = ConsulCollectionReplica(self._consul_client, self._model, obj_dir,
+                                                    staleness, self._loop)
+        self._replica.start()
+
+    async def stop_replica(self) -> None:
+        if self._replica is not None:
+            await self._replica.stop()
+            self._replica = None
+
+    def _is_replica_fresh(self) -> bool:
+        return self._replica is not None and self._replica.is_fresh()
+
+    async def create_indexes(self) -> None:
+        """
+        Build secondary property indexes for already stored objects if index for some
+        field was configured after objects were stored
+
+        :return:
+        """
+        for field in self._indexes:
+            index_root = self._templates.get_property_root(field).lower()
+            _index, data = await self._consul_client.kv.get(index_root)
+            if data is not None:
+                continue  # index is already built
+
+            for entry in decode_raw_entries(self._model, await self._get_all_raw()):
+                await self._put_index_entry(field, entry.value, entry.key)
+
+            response = await self._consul_client.kv.put(index_root, str(datetime.now()))
+            if not response:
+                raise DataAccessExternalError(f"Can't put key={index_root}")
+
+    @property
+    def primary_key(self) -> str:
+        return self._model.primary_key
+
+    def get_object_path(self, obj_id) -> str:
+        """
+        Get consul key of the object by its primary key value
+
+        :param obj_id: primary key value. It is converted to the primary key field type
+        :return: consul key of the object
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        try:
+            converted = id_field.to_native(obj_id)
+        except ConversionError as e:
+            raise DataAccessInternalError(f"{e}")
+
+        return self._templates.get_object_path(str(converted)).lower()
+
+    def get_object_prefix(self, obj_id_prefix: str) -> str:
+        """
+        Get consul key prefix of objects which primary key values start with given prefix
+
+        :param str obj_id_prefix: prefix of primary key values
+        :return: consul key prefix
+        """
+        return self._templates.get_object_path(str(obj_id_prefix)).lower()
+
+    def is_indexed(self, field: str) -> bool:
+        """
+        Check whether secondary property index is maintained for the field
+
+        :param str field: model field name
+        :return: `True` if the field is indexed and `False` otherwise
+        """
+        return field in self._indexes
+
+    def _get_index_path(self, field: str, value, obj_id) -> str:
+        """
+        Get key of index entry for the object
+
+        :param str field: indexed model field name
+        :param value: native or primitive field value
+        :param obj_id: primary key value of the object
+        :return: consul key of the index entry
+        """
+        model_field = getattr(self._model, field)
+        primitive = model_field.to_primitive(model_field.to_native(value))
+        # NOTE: values can contain '/' and other characters which are special for consul keys.
+        #  Values are lowered in the same way as object keys, so index lookup returns superset
+        #  of suitable objects and filter is always applied after lookup
+        index_dir = self._templates.get_property_dir(field, quote(str(primitive).lower(), safe=""))
+        return f"{index_dir}/{quote(str(obj_id).lower(), safe='')}".lower()
+
+    async def _put_index_entry(self, field: str, obj_value: dict, obj_path: str) -> None:
+        obj_id = obj_value.get(self._model.primary_key)
+        index_path = self._get_index_path(field, obj_value.get(field), obj_id)
+        response = await self._consul_client.kv.put(index_path, obj_path)
+        if not response:
+            raise DataAccessExternalError(
+                f"Can't put key={index_path} and value={obj_path}")
+
+    async def get_indexed_keys(self, field: str, value) -> Set[str]:
+        """
+        Get keys of objects which field value is equal to the given value
+
+        :param str field: indexed model field name
+        :param value: field value
+        :return: set of consul object keys
+        """
+        try:
+            index_path = self._get_index_path(field, value, "")
+        except ConversionError as e:
+            raise DataAccessInternalError(f"{e}")
+
+        # NOTE: index path for empty object id is the index directory with trailing "/"
+        _index, data = await self._consul_client.kv.get(index_path, recurse=True,
+                                                        consistency=True)
+        if data is None:
+            return set()
+        return set(entry[ConsulWords.VALUE].decode() for entry in data)
+
+    async def _get_raw_by_keys(self, keys: Set[str]) -> List[Dict]:
+        # NOTE: number of simultaneous requests is bounded, so big key sets don't exhaust
+        #  connections of consul agent
+        semaphore = asyncio.Semaphore(self._max_concurrent_reads)
+
+        async def _get_raw(_key):
+            async with semaphore:
+                _index, _data = await self._consul_client.kv.get(_key, consistency=True)
+            return _data
+
+        data = await asyncio.gather(*(_get_raw(key) for key in keys))
+        return [entry for entry in data if entry is not None]
+
+    async def get_raw_by_prefix(self, prefix: str) -> List[Dict]:
+        """
+        Get raw consul entries of objects which keys start with given prefix
+
+        :param str prefix: consul key prefix inside of the object directory
+        :return: list of raw consul entries
+        """
+        _index, data = await self._consul_client.kv.get(prefix, recurse=True,
+                                                        consistency=True)
+        if data is None:
+            return list()
+        return data
+
+    async def _get_suitable_entries(self, filter_obj: Optional[IFilter]) -> List[ConsulEntry]:
+        """
+        Get decoded consul entries which satisfy the filter. Secondary indexes are used to
+        narrow the set of fetched objects when it is possible.
+
+        :param IFilter filter_obj: filter object
+        :return: list of decoded consul entries
+        """
+        if filter_obj is None:
+            return decode_raw_entries(self._model, await self._get_all_raw())
+
+        plan = ConsulQueryPlanner(self).build(filter_obj)
+        if isinstance(plan, ConsulFullScanPlan):
+            raw_data = await self._get_all_raw()
+        else:
+            fetched = dict()
+            keys = await plan.resolve(fetched)
+            raw_data = [fetched[key] for key in keys if key in fetched]
+            raw_data.extend(await self._get_raw_by_keys(keys - fetched.keys()))
+            # NOTE: planned keys come from sets, keep key order of the full scan and `iterate`
+            raw_data.sort(key=lambda raw_entry: raw_entry[ConsulWords.KEY])
+            if not isinstance(plan, ConsulPrefixScanPlan):
+                # NOTE: key lookups return few entries, so filter them without thread handoff
+                return query_converter_build(self._model, filter_obj, raw_data)
+
+        if not raw_data:
+            return list()
+
+        # NOTE: use processes for parallel data calculations and make true asynchronous work.
+        #  Values are decoded there as well, so each value is decoded exactly once
+        return await self._loop.run_in_executor(self._process_pool, query_converter_build,
+                                                self._model, filter_obj, raw_data)
+
+    async def _get_entry_by_id(self, obj_id: Any) -> Optional[ConsulEntry]:
+        """
+        Get decoded consul entry of the object by its primary key value using single key request
+
+        :param Any obj_id: primary key value
+        :return: decoded consul entry or None if object is not found
+        """
+        _index, data = await self._consul_client.kv.get(self.get_object_path(obj_id),
+                                                        consistency=True)
+        if data is None:
+            return None
+
+        # NOTE: consul keys are lowered, so check that primary key value coincides exactly
+        suitable = query_converter_build(self._model, Compare(self.primary_key, "=", obj_id),
+                                         [data])
+        return next(iter(suitable), None)
+
+    async def get_by_id(self, obj_id: Any) -> Union[BaseModel, None]:
+        """
+        Get object by its primary key value using single key request
+
+        :param Any obj_id: primary key value
+        :return: BaseModel if object was found by its id and None otherwise
+        """
+        if self._is_replica_fresh():
+            entry = self._replica.get_entry(self.get_object_path(obj_id))
+            if entry is None or entry.get_native(self.primary_key) != getattr(
+                    self._model, self.primary_key).to_native(obj_id):
+                return None
+            return entry.to_model()
+
+        entry = await self._get_entry_by_id(obj_id)
+        if entry is None:
+            return None
+        return entry.to_model()
+
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values using concurrent single key requests
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        converted = set(self._convert_ids(obj_ids))
+        keys = {self.get_object_path(obj_id) for obj_id in converted}
+        if self._is_replica_fresh():
+            entries = [entry for entry in map(self._replica.get_entry, keys) if entry is not None]
+        else:
+            entries = decode_raw_entries(self._model, await self._get_raw_by_keys(keys))
+
+        found = dict()
+        for entry in entries:
+            # NOTE: consul keys are lowered, so check that primary key value coincides exactly
+            obj_id = entry.get_native(self.primary_key)
+            if obj_id in converted:
+                found[obj_id] = entry.to_model()
+        return found
+
+    async def update_by_id(self, obj_id: Any, to_update: dict) -> bool:
+        """
+        Update object by its primary key value using single key requests
+
+        :param Any obj_id: id-value of the object which should be updated (primary key value)
+        :param dict to_update: dictionary with fields and values which should be updated
+        :return: `True` if object was updated and `False` otherwise
+        """
+        await super().update(None, to_update)  # Call the generic code to validate to_update
+
+        entry = await self._get_entry_by_id(obj_id)
+        if entry is None:
+            return False
+
+        write = await self._update_write(obj_id, entry, to_update,
+                                         partial(self._get_entry_by_id, obj_id))
+        result = await self._execute_write(write)
+        return bool(result.succeeded)
+
     async def store(self, obj: BaseModel):
         """
         Store object into Storage
@@ -315,11 +1003,16 @@ class ConsulDB(GenericDataBase):
         obj_path = self._templates.get_object_path(obj.primary_key_val)
         obj_path = obj_path.lower()
 
-        obj_val = json.dumps(obj.to_primitive())
-        response = await self._consul_client.kv.put(obj_path, obj_val)
-        if not response:
-            raise DataAccessExternalError(
-                f"Can't put key={obj_path} and value={obj_val}")
+        previous_value = None
+        if self._indexes:
+            _index, data = await self._consul_client.kv.get(obj_path, consistency=True)
+            if data is not None:
+                previous_value = json.loads(data[ConsulWords.VALUE])
+
+        obj_primitive = obj.to_primitive()
+        operations = self._store_operations(obj_primitive, obj_path, previous_value)
+        await self._execute_write(ConsulTxnWrite(
+            obj.primary_key_val, operations, partial(self._replica_put, obj_path, obj_primitive)))
 
     async def _get_all_raw(self) -> List[Dict]:
         obj_dir = self._templates.get_object_dir()
@@ -330,6 +1023,14 @@ class ConsulDB(GenericDataBase):
             return list()
         return data
 
+    async def _get_all_keys(self) -> List[str]:
+        obj_dir = self._templates.get_object_dir()
+        obj_dir = obj_dir.lower() + "/"  # exclude key cortx/base/type/obj without trailing "/"
+        index, keys = await self._consul_client.kv.get(obj_dir, keys=True, consistency=True)
+        if keys is None:
+            return list()
+        return keys
+
     async def get(self, query: Query) -> List[BaseModel]:
         """
         Get object from Storage by Query
@@ -337,62 +1038,139 @@ class ConsulDB(GenericDataBase):
         :param query:
         :return: empty list or list with objects which satisfy the passed query condition
         """
+        # NOTE: model objects are created only for the returned entries
+        projection = query.data.get_projection(self._model)
+        return [entry.to_model(projection) for entry in await self._select_entries(query)]
 
-        def _sorted_key_func(_by_field, _field_type):
-            """
-            Generates key function for built-in sorted function to perform correct sorting
-            of get results
+    async def iterate(self, query: Query,
+                      batch_size: int = ITERATION_BATCH_SIZE) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over objects which satisfy the query. Object keys are listed first and values
+        are fetched by chunks of `batch_size` keys. Ordered queries, queries with offset or
+        cursor and reads from the local replica need the whole result, so only model objects
+        are created lazily for them.
+
+        :param Query query: query object which describes request to Storage
+        :param int batch_size: number of objects fetched from Storage by one request
+        :return: asynchronous iterator over objects
+        """
+        if batch_size <= 0:
+            raise DataAccessInternalError(f"Wrong iteration batch size: {batch_size}")
+
+        query_data = query.data
+        projection = query_data.get_projection(self._model)
+        if query_data.order_by or query_data.offset or query_data.cursor is not None or \
+                self._is_replica_fresh():
+            for entry in await self._select_entries(query):
+                yield entry.to_model(projection)
+            return
+
+        filter_obj = self._filter_optimizer.optimize(query_data.filter_by)
+        if is_contradiction(filter_obj):
+            return
+
+        remaining = query_data.limit
+        if remaining is not None and remaining < 0:
+            raise DataAccessInternalError(
+                f"Wrong limit parameter of Query object: limit={query_data.limit}")
 
-            :param _by_field: field which will be used for sorting (ordering by)
-            :param _field_type: type of the field which will be used for sorting
-            :return:
-            """
-            # TODO: for other types we can define other wrapper-functions
-            wrapper = str.lower if _field_type is StringType else lambda x: x
-            return lambda x: wrapper(getattr(x, _by_field))
+        fetched = dict()
+        plan = ConsulFullScanPlan() if filter_obj is None else \
+            ConsulQueryPlanner(self).build(filter_obj)
+        if isinstance(plan, ConsulFullScanPlan):
+            keys = await self._get_all_keys()
+        else:
+            keys = await plan.resolve(fetched)
+        keys = sorted(keys)
+
+        for start in range(0, len(keys), batch_size):
+            if remaining == 0:
+                return
+            chunk = keys[start:start + batch_size]
+            missing = set(key for key in chunk if key not in fetched)
+            raw_data = [fetched.pop(key) for key in chunk if key in fetched]
+            raw_data.extend(await self._get_raw_by_keys(missing))
+            if filter_obj is None:
+                entries = decode_raw_entries(self._model, raw_data)
+            else:
+                entries = query_converter_build(self._model, filter_obj, raw_data)
+            if remaining is not None:
+                entries = entries[:remaining]
+                remaining -= len(entries)
+            for entry in entries:
+                yield entry.to_model(projection)
+
+    async def _select_entries(self, query: Query) -> List[ConsulEntry]:
+        """
+        Get decoded consul entries which satisfy the query, ordered and sliced by the query
+        parameters
 
+        :param Query query: query object
+        :return: list of decoded consul entries
+        """
         query = query.data
 
-        suitable_models = await self._get_all_raw()
-
-        if not suitable_models:
+        filter_obj = self._filter_optimizer.optimize(query.filter_by)
+        if is_contradiction(filter_obj):
             return list()
 
-        # NOTE: use processes for parallel data calculations and make true asynchronous work
-        if query.filter_by is not None:
-            suitable_models = await self._loop.run_in_executor(self._process_pool,
-                                                               query_converter_build,
-                                                               self._model,
-                                                               query.filter_by,
-                                                               suitable_models)
-
-        base_models = [self._model(json.loads(entry[ConsulWords.VALUE]))
-                       for entry in suitable_models]
-
-        # NOTE: if offset parameter is set in Query then order_by option is enabled automatically
-        if any((query.order_by, query.offset)):
-            field = query.order_by.field if query.order_by else getattr(
-                self._model,
-                self._model.primary_key)
-            field_str = field_to_str(field)
+        if self._is_replica_fresh():
+            entries = self._replica.get_entries(filter_obj)
+        else:
+            entries = await self._get_suitable_entries(filter_obj)
 
-            field_type = type(getattr(self._model, field_str))
+        if not entries:
+            return list()
 
-            reverse = SortOrder.DESC == query.order_by.order if query.order_by else False
-            key = _sorted_key_func(field_str, field_type)
-            base_models = sorted(base_models, key=key, reverse=reverse)
+        if query.cursor is not None:
+            return self._select_keyset_page(query, entries)
 
         offset = query.offset or 0
-        limit = offset + query.limit if query.limit is not None else len(
-            base_models)
-        # NOTE: if query.limit is None then slice will be from offset to the end of array
-        #  slice(0, None) means that start is 0 and stop is not specified
-        if offset < 0 or limit < 0:
+        if offset < 0 or (query.limit is not None and query.limit < 0):
             raise DataAccessInternalError(
                 "Wrong offset and limit parameters of Query object: "
                 f"offset={query.offset}, limit={query.limit}")
-        model_slice = slice(offset, limit)
-        return base_models[model_slice]
+
+        # NOTE: if offset parameter is set in Query then ordering by primary key is enabled
+        #  automatically
+        sort_keys = query.get_sort_keys()
+        if not sort_keys and query.offset:
+            sort_keys = [(self.primary_key, SortOrder.ASC)]
+        if sort_keys:
+            # NOTE: only offset + limit first entries are selected, whole result is not sorted
+            sort_key = make_sort_key(self._model, sort_keys, ConsulEntry.get_native)
+            return select_ordered(entries, sort_key, offset, query.limit)
+
+        # NOTE: if query.limit is None then slice will be from offset to the end of array
+        limit = offset + query.limit if query.limit is not None else None
+        return entries[offset:limit]
+
+    def _select_keyset_page(self, query: Query.Data,
+                            entries: List[ConsulEntry]) -> List[ConsulEntry]:
+        """
+        Select entries of the keyset pagination page: entries which follow the cursor position
+        in order of the query keyset. Only `limit` entries are kept during selection, so page
+        cost doesn't depend on the page number.
+
+        :param Query.Data query: query parameters with cursor
+        :param list entries: decoded consul entries which satisfy the query filter
+        :return: list of decoded consul entries of the page
+        """
+        keyset = query.get_keyset(self.primary_key)
+        cursor_values = query.get_cursor_values(self.primary_key)
+        if query.limit is not None and query.limit < 0:
+            raise DataAccessInternalError(
+                f"Wrong limit parameter of Query object: limit={query.limit}")
+
+        sort_key = make_sort_key(self._model, keyset, ConsulEntry.get_native)
+        if cursor_values is not None:
+            try:
+                position = make_position_key(self._model, keyset, cursor_values)
+            except ConversionError as e:
+                raise MalformedQueryError(f"Invalid query cursor: {e}")
+            entries = [entry for entry in entries if position < sort_key(entry)]
+
+        return select_ordered(entries, sort_key, limit=query.limit)
 
     async def update(self, filter_obj: IFilter, to_update: dict) -> int:
         """
@@ -404,28 +1182,129 @@ class ConsulDB(GenericDataBase):
         """
         await super().update(filter_obj, to_update)  # Call the generic code
 
-        raw_data = await self._get_all_raw()
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
 
-        if not raw_data:
+        suitable_entries = await self._get_suitable_entries(filter_obj)
+
+        if not suitable_entries:
             return 0
 
-        # NOTE: use processes for parallel data calculations and make true asynchronous work
-        suitable_models = await self._loop.run_in_executor(self._process_pool,
-                                                           query_converter_build,
-                                                           self._model,
-                                                           filter_obj,
-                                                           raw_data)
-        base_models = [self._model(json.loads(entry[ConsulWords.VALUE]))
-                       for entry in suitable_models]
+        writes = list()
+        for entry in suitable_entries:
+            obj_id = entry.get_native(self.primary_key)
+            refetch = partial(self._get_suitable_entry, entry.key, filter_obj)
+            writes.append(await self._update_write(obj_id, entry, to_update, refetch))
+
+        result = BulkWriteResult()
+        await self._execute_transactions(writes, result)
+        if not result.ok:
+            raise DataAccessExternalError(f"{len(result.succeeded)} objects are updated, "
+                                          f"failed to update objects: {result.errors}")
+        # NOTE: objects which were deleted or stopped satisfying the filter concurrently are
+        #  not updated
+        return len(result.succeeded)  # return number of entries updated
+
+    async def _get_suitable_entry(self, key: str,
+                                  filter_obj: Optional[IFilter]) -> Optional[ConsulEntry]:
+        """
+        Get decoded consul entry by its key if the object satisfies the filter
+
+        :param str key: consul key of the object
+        :param IFilter filter_obj: filter object or None
+        :return: decoded consul entry or None if object is not found or doesn't satisfy
+                 the filter
+        """
+        _index, data = await self._consul_client.kv.get(key, consistency=True)
+        if data is None:
+            return None
+        if filter_obj is None:
+            return ConsulEntry.from_raw(self._model, data)
+        return next(iter(query_converter_build(self._model, filter_obj, [data])), None)
+
+    async def _update_write(self, obj_id: Any, entry: ConsulEntry, to_update: dict,
+                            refetch: Callable[[], Awaitable[Optional[ConsulEntry]]]
+                            ) -> ConsulTxnWrite:
+        """
+        Make transactional write of the object from decoded consul entry with applied changes.
+        The object is written by check-and-set operation with modify index of the entry, so
+        the write fails if the object is changed concurrently. Then the write is made again
+        from the refetched entry.
+
+        :param obj_id: primary key value of the object
+        :param ConsulEntry entry: decoded consul entry
+        :param dict to_update: dictionary with already converted fields and values
+        :param refetch: coroutine function which gets the current entry of the object or None
+                        if the object must not be updated anymore
+        :return: transactional write of the object
+        """
+        model, obj_path, previous_value = await self._apply_update(entry, to_update)
+        obj_primitive = model.to_primitive()
+        if obj_path == entry.key:
+            operations = self._store_operations(obj_primitive, obj_path, previous_value,
+                                                entry.modify_index)
+        else:
+            # NOTE: primary key is changed, so the object is written to the new key if the
+            #  source object is not changed
+            operations = self._store_operations(obj_primitive, obj_path, previous_value)
+            if entry.modify_index is not None:
+                operations.insert(0, self._txn_check_index(entry.key, entry.modify_index))
+
+        async def _on_conflict() -> Optional[ConsulTxnWrite]:
+            current = await refetch()
+            if current is None:
+                return None
+            return await self._update_write(obj_id, current, to_update, refetch)
+
+        return ConsulTxnWrite(obj_id, operations,
+                              partial(self._replica_put, obj_path, obj_primitive), _on_conflict)
+
+    async def _apply_update(self, entry: ConsulEntry, to_update: dict) -> tuple:
+        """
+        Create validated model object from decoded consul entry with applied changes
+
+        :param ConsulEntry entry: decoded consul entry
+        :param dict to_update: dictionary with already converted fields and values
+        :return: updated model object, its consul key and currently stored value of the object
+                 (None if primary key was changed)
+        """
+        previous_value = entry.value
+        model = entry.to_model()
+        # use any to invoke map over each parameter
+        any(map(setattr, (model for _i in range(len(to_update))),
+                to_update.keys(),
+                to_update.values()))
+        await super().store(model)  # Call the generic code
+        obj_path = self._templates.get_object_path(model.primary_key_val).lower()
+        if obj_path != entry.key:
+            previous_value = None  # primary key was changed, so it is a new object
+        return model, obj_path, previous_value
+
+    def _delete_write(self, entry: ConsulEntry) -> ConsulTxnWrite:
+        """
+        Make transactional write which deletes consul entry of the object and its secondary
+        index entries
 
-        for model in base_models:
-            # use any to invoke map over each parameter
-            any(map(setattr, (model for _i in range(len(to_update))),
-                    to_update.keys(),
-                    to_update.values()))
-            await self.store(model)
+        :param ConsulEntry entry: decoded consul entry
+        :return: transactional write of the object
+        """
+        return ConsulTxnWrite(entry.get_native(self.primary_key), self._delete_operations(entry),
+                              partial(self._replica_remove, entry.key))
 
-        return len(base_models)  # return number of entries updated
+    async def _delete_entries(self, entries: List[ConsulEntry]) -> None:
+        """
+        Delete objects with their secondary index entries by consul transactions
+
+        :param list entries: decoded consul entries of the objects
+        :return:
+        """
+        result = BulkWriteResult()
+        await self._execute_transactions([self._delete_write(entry) for entry in entries],
+                                         result)
+        if not result.ok:
+            raise DataAccessExternalError(f"{len(result.succeeded)} objects are deleted, "
+                                          f"failed to delete objects: {result.errors}")
 
     async def delete(self, filter_obj: IFilter) -> int:
         """
@@ -434,41 +1313,394 @@ class ConsulDB(GenericDataBase):
         :param IFilter filter_obj: filter object to perform delete operation
         :return: number of deleted entries
         """
-        raw_data = await self._get_all_raw()
-
-        if not raw_data:
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
             return 0
 
-        # NOTE: use processes for parallel data calculations and make true asynchronous work
-        suitable_models = await self._loop.run_in_executor(self._process_pool,
-                                                           query_converter_build,
-                                                           self._model,
-                                                           filter_obj,
-                                                           raw_data)
-        suitable_models = list(suitable_models)
-        if not suitable_models:
+        plan = ConsulQueryPlanner(self).build(filter_obj)
+        if isinstance(plan, ConsulPrefixScanPlan):
+            return await self._delete_by_prefix(plan.prefix, filter_obj)
+
+        suitable_entries = await self._get_suitable_entries(filter_obj)
+        if not suitable_entries:
             return 0  # No models are deleted
 
-        tasks = [asyncio.ensure_future(
-            self._consul_client.kv.delete(model[ConsulWords.KEY])) for
-                 model in suitable_models]
+        await self._delete_entries(suitable_entries)
+        return len(suitable_entries)
 
-        done, pending = await asyncio.wait(tasks)
+    async def _delete_by_prefix(self, prefix: str, filter_obj: IFilter) -> int:
+        """
+        Delete objects which keys start with the prefix by single recursive request if all of
+        them satisfy the filter
 
-        for task in done:
-            if not task.result():
-                raise DataAccessInternalError(
-                    f"Error happens during object deleting")
+        :param str prefix: consul key prefix inside of the object directory
+        :param IFilter filter_obj: filter object to perform delete operation
+        :return: number of deleted entries
+        """
+        raw_data = await self.get_raw_by_prefix(prefix)
+        suitable_entries = query_converter_build(self._model, filter_obj, raw_data)
+        if not suitable_entries:
+            return 0
 
-        return len(suitable_models)
+        if len(suitable_entries) != len(raw_data) or self._indexes:
+            # NOTE: keys are lowered, so some objects under the prefix can be unsuitable.
+            #  Objects with index entries are deleted together with them by transactions
+            await self._delete_entries(suitable_entries)
+            return len(suitable_entries)
 
-    async def delete_by_id(self, obj_id: Union[int, str]) -> None:
-        obj_path = self._templates.get_object_path(str(obj_id))
-        obj_path = obj_path.lower()
-        response = await self._consul_client.kv.delete(obj_path)
+        response = await self._consul_client.kv.delete(prefix, recurse=True)
         if not response:
             raise DataAccessExternalError(
-                f"Error happens during object deleting with id={obj_id}")
+                f"Error happens during deleting of objects with key prefix={prefix}")
+        if self._replica is not None:
+            self._replica.remove_prefix(prefix)
+
+        return len(suitable_entries)
+
+    async def delete_by_id(self, obj_id: Union[int, str]) -> bool:
+        """
+        Delete object by its primary key value using single key requests
+
+        :param Any obj_id: id of the object to be deleted
+        :return: `True` if object was deleted successfully and `False` otherwise
+        """
+        entry = await self._get_entry_by_id(obj_id)
+        if entry is None:
+            return False
+
+        await self._execute_write(self._delete_write(entry))
+        return True
+
+    @staticmethod
+    def _txn_set(key: str, value: str, modify_index: Optional[int] = None) -> dict:
+        operation = {ConsulWords.VERB: ConsulWords.SET, ConsulWords.KEY: key,
+                     ConsulWords.VALUE: base64.b64encode(value.encode()).decode()}
+        if modify_index is not None:
+            operation[ConsulWords.VERB] = ConsulWords.CAS
+            operation[ConsulWords.INDEX] = modify_index
+        return {ConsulWords.KV: operation}
+
+    @staticmethod
+    def _txn_delete(key: str) -> dict:
+        return {ConsulWords.KV: {ConsulWords.VERB: ConsulWords.DELETE, ConsulWords.KEY: key}}
+
+    @staticmethod
+    def _txn_check_index(key: str, modify_index: int) -> dict:
+        return {ConsulWords.KV: {ConsulWords.VERB: ConsulWords.CHECK_INDEX, ConsulWords.KEY: key,
+                                 ConsulWords.INDEX: modify_index}}
+
+    def _store_operations(self, obj_primitive: dict, obj_path: str,
+                          previous_value: Optional[dict],
+                          modify_index: Optional[int] = None) -> List[dict]:
+        """
+        Get transaction operations which store the object and maintain its secondary index
+        entries. New index entries are put before the object and stale entries are removed
+        after it, though all of them are applied atomically
+
+        :param dict obj_primitive: primitive representation of the object to store
+        :param str obj_path: consul key of the object
+        :param dict previous_value: currently stored value of the object or None
+        :param int modify_index: modify index of the stored object for check-and-set write,
+                                 the object is written unconditionally if it is not set
+        :return: list of consul transaction operations
+        """
+        operations = list()
+        stale_paths = list()
+        obj_id = obj_primitive.get(self._model.primary_key)
+        for field in self._indexes:
+            if previous_value is not None and \
+                    previous_value.get(field) == obj_primitive.get(field):
+                continue
+            index_path = self._get_index_path(field, obj_primitive.get(field), obj_id)
+            operations.append(self._txn_set(index_path, obj_path))
+            if previous_value is not None:
+                stale_path = self._get_index_path(field, previous_value.get(field),
+                                                  previous_value.get(self._model.primary_key))
+                if stale_path != index_path:
+                    stale_paths.append(stale_path)
+        operations.append(self._txn_set(obj_path, json.dumps(obj_primitive), modify_index))
+        operations.extend(self._txn_delete(stale_path) for stale_path in stale_paths)
+        return operations
+
+    def _delete_operations(self, entry: ConsulEntry) -> List[dict]:
+        operations = [self._txn_delete(entry.key)]
+        for field in self._indexes:
+            obj_id = entry.value.get(self._model.primary_key)
+            index_path = self._get_index_path(field, entry.value.get(field), obj_id)
+            operations.append(self._txn_delete(index_path))
+        return operations
+
+    async def _execute_write(self, write: ConsulTxnWrite) -> BulkWriteResult:
+        """
+        Execute write of a single object by consul transaction
+
+        :param ConsulTxnWrite write: transactional write of the object
+        :return: result of the write, object is reported as missing if it was deleted
+                 concurrently
+        """
+        result = BulkWriteResult()
+        await self._execute_transactions([write], result)
+        if not result.ok:
+            raise DataAccessExternalError(f"Failed to write object {write.obj_id}: "
+                                          f"{result.errors[write.obj_id]}")
+        return result
+
+    async def _execute_transactions(self, writes: List[ConsulTxnWrite],
+                                    result: BulkWriteResult) -> None:
+        """
+        Execute object writes by consul transactions. Operations of one object are always put
+        into the same transaction, so each object is written atomically with its index entries.
+        Objects of the failed transaction are retried one by one.
+
+        :param list writes: transactional writes of the objects
+        :param BulkWriteResult result: result to record outcome of the writes
+        :return:
+        """
+        batches = list()
+        batch, batch_size = list(), 0
+        for write in writes:
+            if len(write.operations) > self._txn_max_operations:
+                result.add_error(write.obj_id,
+                                 f"Object write needs {len(write.operations)} operations, "
+                                 f"transaction limit is {self._txn_max_operations}")
+                continue
+            if batch_size + len(write.operations) > self._txn_max_operations:
+                batches.append(batch)
+                batch, batch_size = list(), 0
+            batch.append(write)
+            batch_size += len(write.operations)
+        if batch:
+            batches.append(batch)
+
+        await asyncio.gather(*(self._execute_transaction(batch, result) for batch in batches))
+
+    async def _execute_transaction(self, batch: List[ConsulTxnWrite],
+                                   result: BulkWriteResult) -> None:
+        payload = [operation for write in batch for operation in write.operations]
+        try:
+            response = await self._consul_client.txn.put(payload)
+        except ConsulException as e:
+            failed = self._get_failed_writes(batch, e)
+            if failed:
+                await self._retry_failed_writes(batch, failed, result)
+                return
+            # NOTE: failed transaction is rolled back entirely, so objects of the batch are
+            #  written by separate transactions to find out which of them failed
+            if len(batch) > 1:
+                await asyncio.gather(*(self._execute_transaction([write], result)
+                                       for write in batch))
+                return
+            result.add_error(batch[0].obj_id, f"Consul transaction failed: {e}")
+            return
+        except ClientConnectorError as e:
+            for write in batch:
+                result.add_error(write.obj_id, f"Consul transaction failed: {e}")
+            return
+        index = self._get_transaction_index(response)
+        for write in batch:
+            write.on_success(index)
+            result.add_success(write.obj_id)
+
+    @staticmethod
+    def _get_transaction_index(response: Any) -> Optional[int]:
+        """
+        Get consul index of the committed transaction
+
+        :param response: decoded response of the transaction
+        :return: consul index or None if the response has no results with the index
+        """
+        try:
+            indexes = [item[ConsulWords.KV][ConsulWords.MODIFY_INDEX]
+                       for item in response.get(ConsulWords.RESULTS) or ()]
+        except (TypeError, KeyError, AttributeError):
+            return None
+        return max(indexes) if indexes else None
+
+    @staticmethod
+    def _get_failed_writes(batch: List[ConsulTxnWrite],
+                           error: ConsulException) -> Dict[int, List[str]]:
+        """
+        Find writes which operations failed by the error of the rolled back transaction
+
+        :param list batch: writes of the transaction
+        :param ConsulException error: transaction error
+        :return: dict position of the write in the batch -> descriptions of the failed
+                 operations, it is empty if the error doesn't report failed operations
+        """
+        # NOTE: consul reports failed operations by 409 response, its body is JSON with
+        #  operation indexes and reasons of the failures
+        code, _sep, body = f"{error}".partition(" ")
+        if code != "409":
+            return dict()
+        try:
+            failed_operations = {item[ConsulWords.OP_INDEX]: item.get(ConsulWords.WHAT, "")
+                                 for item in json.loads(body).get(ConsulWords.ERRORS) or ()}
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return dict()
+
+        failed = dict()
+        position = 0
+        for write_position, write in enumerate(batch):
+            for op_index in range(position, position + len(write.operations)):
+                if op_index in failed_operations:
+                    failed.setdefault(write_position, list()).append(failed_operations[op_index])
+            position += len(write.operations)
+        return failed
+
+    async def _retry_failed_writes(self, batch: List[ConsulTxnWrite],
+                                   failed: Dict[int, List[str]],
+                                   result: BulkWriteResult) -> None:
+        """
+        Retry writes of the rolled back transaction. Writes which operations didn't fail are
+        repeated as is, failed check-and-set writes are made again from the current state of
+        the objects.
+
+        :param list batch: writes of the transaction
+        :param dict failed: position of the write in the batch -> descriptions of the failed
+                            operations
+        :param BulkWriteResult result: result to record outcome of the writes
+        :return:
+        """
+        retries = list()
+        conflicts = list()
+        for write_position, write in enumerate(batch):
+            errors = failed.get(write_position)
+            if errors is None:
+                retries.append(write)
+            elif write.on_conflict is None or write.attempt >= self._cas_max_retries:
+                result.add_error(write.obj_id, f"Consul transaction failed: {'; '.join(errors)}")
+            else:
+                conflicts.append(write)
+
+        rewrites = await asyncio.gather(*(write.on_conflict() for write in conflicts),
+                                        return_exceptions=True)
+        for write, rewrite in zip(conflicts, rewrites):
+            if isinstance(rewrite, (DataAccessError, ConsulException, ClientConnectorError)):
+                result.add_error(write.obj_id, f"{rewrite}")
+            elif isinstance(rewrite, BaseException):
+                raise rewrite
+            elif rewrite is None:
+                result.add_missing(write.obj_id)
+            else:
+                rewrite.attempt = write.attempt + 1
+                retries.append(rewrite)
+
+        if retries:
+            await self._execute_transactions(retries, result)
+
+    async def store_many(self, objs: Iterable[BaseModel]) -> BulkWriteResult:
+        """
+        Store objects into Storage by consul transactions
+
+        :param objs: model objects for storing into DB
+        :return: result with ids of stored objects and errors of objects which were not stored
+        """
+        result = BulkWriteResult()
+        to_store = dict()
+        for obj in objs:
+            try:
+                await super().store(obj)  # Call the generic code
+            except DataAccessInternalError as e:
+                result.add_error(obj.primary_key_val, f"{e}")
+                continue
+            obj_path = self._templates.get_object_path(obj.primary_key_val).lower()
+            to_store[obj_path] = obj  # the last object with the same key wins
+
+        previous_values = dict()
+        if self._indexes:
+            raw_data = await self._get_raw_by_keys(set(to_store))
+            previous_values = {entry.key: entry.value
+                               for entry in decode_raw_entries(self._model, raw_data)}
+
+        writes = list()
+        for obj_path, obj in to_store.items():
+            obj_primitive = obj.to_primitive()
+            operations = self._store_operations(obj_primitive, obj_path,
+                                                previous_values.get(obj_path))
+            writes.append(ConsulTxnWrite(obj.primary_key_val, operations,
+                                         partial(self._replica_put, obj_path, obj_primitive)))
+
+        await self._execute_transactions(writes, result)
+        return result
+
+    async def update_many(self, to_update: Dict[Any, dict]) -> BulkWriteResult:
+        """
+        Update objects by their ids using consul transactions
+
+        :param dict to_update: object id -> dictionary with fields and values which should be
+                               updated
+        :return: result with ids of updated and not found objects and errors of objects which
+                 were not updated
+        """
+        result = BulkWriteResult()
+        changes_by_id = dict()
+        for obj_id, changes in to_update.items():
+            changes = dict(changes)
+            try:
+                await super().update(None, changes)  # Call the generic code to convert changes
+            except DataAccessInternalError as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            changes_by_id[obj_id] = changes
+
+        writes = list()
+        for obj_id, entry in await self._get_entries_by_ids(list(changes_by_id), result):
+            try:
+                writes.append(await self._update_write(obj_id, entry, changes_by_id[obj_id],
+                                                       partial(self._get_entry_by_id, obj_id)))
+            except DataAccessInternalError as e:
+                result.add_error(obj_id, f"{e}")
+
+        await self._execute_transactions(writes, result)
+        return result
+
+    async def delete_many(self, obj_ids: Iterable[Any]) -> BulkWriteResult:
+        """
+        Delete objects by their ids using consul transactions
+
+        :param obj_ids: ids of the objects to be deleted
+        :return: result with ids of deleted and not found objects and errors of objects which
+                 were not deleted
+        """
+        result = BulkWriteResult()
+        writes = list()
+        for obj_id, entry in await self._get_entries_by_ids(list(obj_ids), result):
+            writes.append(self._delete_write(entry))
+
+        await self._execute_transactions(writes, result)
+        return result
+
+    async def _get_entries_by_ids(self, obj_ids: List[Any],
+                                  result: BulkWriteResult) -> List[tuple]:
+        """
+        Get decoded consul entries of the objects by their primary key values. Not found objects
+        and wrong ids are recorded to the bulk write result.
+
+        :param list obj_ids: primary key values
+        :param BulkWriteResult result: result to record not found objects and errors
+        :return: list of tuples of object id and decoded consul entry
+        """
+        entries = await asyncio.gather(*(self._get_entry_by_id(obj_id) for obj_id in obj_ids),
+                                       return_exceptions=True)
+        found = list()
+        for obj_id, entry in zip(obj_ids, entries):
+            if isinstance(entry, DataAccessInternalError):
+                result.add_error(obj_id, f"{entry}")
+            elif isinstance(entry, BaseException):
+                raise entry
+            elif entry is None:
+                result.add_missing(obj_id)
+            else:
+                found.append((obj_id, entry))
+        return found
+
+    def _replica_put(self, key: str, value: dict, index: Optional[int] = None) -> None:
+        if self._replica is not None:
+            self._replica.put(key, value, index)
+
+    def _replica_remove(self, key: str, index: Optional[int] = None) -> None:
+        if self._replica is not None:
+            self._replica.remove(key, index)
 
     async def count(self, filter_obj: IFilter = None) -> int:
         """
@@ -477,31 +1709,49 @@ class ConsulDB(GenericDataBase):
         :param IFilter filter_obj: filter to perform count aggregation
         :return: count of entries which satisfy the `filter_obj`
         """
-        raw_data = await self._get_all_raw()
-
-        if not raw_data:
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
             return 0
 
-        if filter_obj is None:
-            return len(raw_data)
+        if self._is_replica_fresh():
+            return len(self._replica.get_entries(filter_obj))
 
-        # NOTE: use processes for parallel data calculations and make true asynchronous work
-        suitable_models = await self._loop.run_in_executor(self._process_pool,
-                                                           query_converter_build,
-                                                           self._model,
-                                                           filter_obj,
-                                                           raw_data)
+        if filter_obj is None:
+            return len(await self._get_all_keys())
 
-        return len(list(suitable_models))
+        suitable_entries = await self._get_suitable_entries(filter_obj)
+        return len(suitable_entries)
 
-    async def count_by_query(self, ext_query: ExtQuery):
+    async def _aggregate(self, function: str, ext_query: ExtQuery) -> Any:
         """
-        Count Aggregation function
+        Perform aggregation in a single pass over decoded values of the suitable entries without
+        creating model objects
 
-        :param ExtQuery ext_query: Extended query which describes to perform count aggregation
-        :return:
+        :param str function: aggregation function name, see `AggregationFunction`
+        :param ExtQuery ext_query: extended query which describes the aggregation
+        :return: aggregated value or dict group value -> aggregated value if group_by is set
         """
-        pass
+        value_field, group_field = get_aggregation_fields(self._model, function, ext_query)
+        aggregator = StreamAggregator(function)
+        filter_obj = self._filter_optimizer.optimize(ext_query.data.filter_by)
+        if not is_contradiction(filter_obj):
+            if self._is_replica_fresh():
+                entries = self._replica.get_entries(filter_obj)
+            else:
+                entries = await self._get_suitable_entries(filter_obj)
+
+            for entry in entries:
+                value = entry.get_native(value_field) if value_field is not None else None
+                if group_field is None:
+                    aggregator.add(value)
+                    continue
+                group = entry.get_native(group_field)
+                if group is not None:
+                    aggregator.add(value, group)
+
+        if group_field is None:
+            return aggregator.get_result()
+        return aggregator.get_grouped_result()
 
     async def get_by_prefix(self):
         """"""
@@ -16,18 +16,23 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 from asyncio import coroutine
+from functools import partial
 from pydoc import locate
 from enum import Enum
-from typing import Type
+from typing import Optional, Type
 
 from schematics import Model
-from schematics.types import DictType, StringType, ListType, ModelType, IntType
+from schematics.types import (DictType, StringType, ListType, ModelType, IntType, BooleanType,
+                              FloatType)
 
-from cortx.utils.data.access import BaseModel
+from cortx.utils.data.access import BaseModel, BulkWriteResult
 from cortx.utils.errors import MalformedConfigurationError, DataAccessInternalError, DataAccessError
 from cortx.utils.data.access import AbstractDataBaseProvider
 
 import cortx.utils.data.db as db_module
+from cortx.utils.data.db.query_cache import StorageReadCache
+from cortx.utils.data.db.single_flight import SingleFlight
+from cortx.utils.data.db.write_behind import FlushCallback, WriteBehindBuffer
 from cortx.utils.synchronization import ThreadSafeEvent
 
 
@@ -50,6 +55,13 @@ class DBSettings(Model):
     login = StringType()
     password = StringType()
     replication = IntType(required=False, default=0)
+    # elasticsearch: perform requests by asyncio client on the event loop instead of synchronous
+    # client in the thread pool
+    async_transport = BooleanType(default=False)
+    # elasticsearch: max number of simultaneously open connections of the asyncio client
+    max_connections = IntType(default=100, min_value=1)
+    # sqlite: path of the database file
+    path = StringType()
 
 
 class DBConfig(Model):
@@ -66,6 +78,46 @@ class ModelSettings(Model):
     Configuration for base model like collection as example
     """
     collection = StringType(required=True)
+    # model fields for which the driver maintains secondary indexes (if it supports them)
+    indexes = ListType(StringType, default=list)
+    # memory: model fields with sorted indexes for range comparisons and ordering
+    sorted_indexes = ListType(StringType, default=list)
+    # consul: serve reads from local collection replica which is updated by blocking queries
+    replica_cache = BooleanType(default=False)
+    # consul: max age in seconds of the last confirmed replica synchronization
+    replica_staleness = FloatType(default=5.0)
+    # elasticsearch: refresh policy of writes: "immediate" refreshes index after every write,
+    # "wait_for" makes write requests wait for the scheduled elasticsearch refresh, "none" relies
+    # on the index refresh settings only and "periodic" makes single delayed refresh for writes
+    # made within refresh interval. Delete by query may fail on conflict with recent writes
+    # which are not refreshed yet if "none" is used
+    refresh_policy = StringType(default="immediate",
+                                choices=["immediate", "wait_for", "none", "periodic"])
+    # elasticsearch: delay in seconds of the index refresh after write for "periodic" policy
+    refresh_interval = FloatType(default=1.0, min_value=0.0)
+
+
+class QueryCacheSettings(Model):
+    """
+    Configuration of the model read cache which memoizes get, get_by_id and count results
+    """
+    enabled = BooleanType(default=False)
+    # max number of cached results, least recently used results are evicted first
+    max_size = IntType(default=1024, min_value=1)
+    # max age in seconds of cached results, it bounds staleness caused by writes made by other
+    # processes. Results never expire if it is 0
+    ttl = FloatType(default=5.0, min_value=0.0)
+
+
+class WriteBehindSettings(Model):
+    """
+    Configuration of the model write-behind buffer which writes store calls by batches
+    """
+    enabled = BooleanType(default=False)
+    # number of buffered objects which triggers the batch write
+    max_batch_size = IntType(default=100, min_value=1)
+    # max time in seconds which stored objects spend in the buffer before the batch write
+    flush_interval = FloatType(default=0.1, min_value=0.0)
 
 
 class DBModelConfig(Model):
@@ -77,6 +129,11 @@ class DBModelConfig(Model):
     database = StringType(required=True)
     # this configuration is specific for each supported by model db driver
     config = DictType(ModelType(ModelSettings), str)
+    cache = ModelType(QueryCacheSettings)
+    # concurrent identical read calls share one database request
+    coalesce_reads = BooleanType(default=False)
+    # store calls return before the write, objects are written later by batches
+    write_behind = ModelType(WriteBehindSettings)
 
 
 class GeneralConfig(Model):
@@ -91,6 +148,9 @@ class GeneralConfig(Model):
 class ProxyStorageCallDecorator:
     """Class to decorate proxy call"""
 
+    # storage calls which return asynchronous iterators instead of coroutines
+    _iterator_calls = frozenset(("iterate",))
+
     def __init__(self, async_storage, model: Type[BaseModel], attr_name: str, event: ThreadSafeEvent):
         self._async_storage = async_storage
         self._model = model
@@ -98,22 +158,54 @@ class ProxyStorageCallDecorator:
         self._event = event
         self._proxy_call_coroutine = None
 
+    async def _get_database(self):
+        # Wait until db will be created
+        while self._async_storage.storage_status != ServiceStatus.READY:
+            if self._async_storage.storage_status == ServiceStatus.NOT_CREATED:
+                # Note: Call create_database one time per Model
+                await self._async_storage.create_database()
+            elif self._async_storage.storage_status == ServiceStatus.IN_PROGRESS:
+                await self._event.wait()
+                self._event.clear()
+
+        database = self._async_storage.get_database()
+        if database is None:
+            raise DataAccessInternalError("Database is not created")
+        return database
+
+    def _get_call(self, database, attr_name: str):
+        attr = database.__getattribute__(attr_name)
+        single_flight = self._async_storage.single_flight
+        if single_flight is not None and single_flight.is_coalesced_call(attr_name):
+            attr = partial(single_flight.call, attr_name, attr)
+        query_cache = self._async_storage.query_cache
+        if query_cache is not None and query_cache.is_cached_call(attr_name):
+            attr = partial(query_cache.call, attr_name, attr)
+        return attr
+
+    async def _iterate(self, *args, **kwargs):
+        database = await self._get_database()
+        write_behind = self._async_storage.write_behind
+        if write_behind is not None:
+            await write_behind.flush()
+        async for obj in database.__getattribute__(self._attr_name)(*args, **kwargs):
+            yield obj
+
     def __call__(self, *args, **kwargs) -> coroutine:
+        if self._attr_name in self._iterator_calls:
+            return self._iterate(*args, **kwargs)
+
         async def async_wrapper():
-            async def _wait_db_creation():
-                while self._async_storage.storage_status != ServiceStatus.READY:
-                    if self._async_storage.storage_status == ServiceStatus.NOT_CREATED:
-                        # Note: Call create_database one time per Model
-                        await self._async_storage.create_database()
-                    elif self._async_storage.storage_status == ServiceStatus.IN_PROGRESS:
-                        await self._event.wait()
-                        self._event.clear()
-
-            await _wait_db_creation()  # Wait until db will be created
-            database = self._async_storage.get_database()
-            if database is None:
-                raise DataAccessInternalError("Database is not created")
-            attr = database.__getattribute__(self._attr_name)
+            database = await self._get_database()
+            write_behind = self._async_storage.write_behind
+            if write_behind is not None:
+                if self._attr_name == "store":
+                    return await write_behind.store(self._get_call(database, "store_many"),
+                                                    *args, **kwargs)
+                # NOTE: other calls are made after the buffered objects are written, so they
+                #  see all stored objects
+                await write_behind.flush()
+            attr = self._get_call(database, self._attr_name)
             if callable(attr):
                 # may be, first call the function and then check whether we need to await it
                 # DD: I think, we assume that all storage API are async
@@ -149,6 +241,17 @@ class AsyncDataBase:
         self._database_status = ServiceStatus.NOT_CREATED
         self._database_module = getattr(db_module, self._db_config.import_path)
         self._database = None
+        self._single_flight = SingleFlight() if model_config.coalesce_reads else None
+        self._query_cache = None
+        cache_settings = model_config.cache
+        if cache_settings is not None and cache_settings.enabled:
+            self._query_cache = StorageReadCache(model, cache_settings.max_size,
+                                                 cache_settings.ttl)
+        self._write_behind = None
+        write_behind_settings = model_config.write_behind
+        if write_behind_settings is not None and write_behind_settings.enabled:
+            self._write_behind = WriteBehindBuffer(write_behind_settings.max_batch_size,
+                                                   write_behind_settings.flush_interval)
 
     def __getattr__(self, attr_name: str) -> coroutine:
         _proxy_call = ProxyStorageCallDecorator(self, self._model, attr_name, self._event)
@@ -159,7 +262,8 @@ class AsyncDataBase:
         try:
             self._database = await self._database_module.create_database(self._db_config.config,
                                                                          self._model_settings.collection,
-                                                                         self._model)
+                                                                         self._model,
+                                                                         self._model_settings)
         except DataAccessError:
             raise
         except Exception as e:
@@ -180,6 +284,43 @@ class AsyncDataBase:
     def storage_status(self):
         return self._database_status
 
+    @property
+    def single_flight(self):
+        # Note: single flight is None if read calls coalescing is disabled for the model
+        return self._single_flight
+
+    @property
+    def query_cache(self):
+        # Note: query cache is None if it is not enabled for the model
+        return self._query_cache
+
+    @property
+    def write_behind(self):
+        # Note: write-behind buffer is None if it is not enabled for the model
+        return self._write_behind
+
+    async def flush(self) -> BulkWriteResult:
+        """
+        Write objects buffered by write-behind store calls and wait until they are written
+
+        :return: result of the batch write, it is empty if write-behind is not enabled
+        """
+        if self._write_behind is None:
+            return BulkWriteResult()
+        return await self._write_behind.flush()
+
+    def set_flush_callback(self, callback: Optional[FlushCallback]) -> None:
+        """
+        Set function which is called with the result of every write-behind batch write. Objects
+        are durable once the result reports them as succeeded.
+
+        :param callback: function which takes `BulkWriteResult` or None to remove the callback
+        :return:
+        """
+        if self._write_behind is None:
+            raise DataAccessInternalError(f"Write-behind is not enabled for {self._model}")
+        self._write_behind.on_flush = callback
+
 
 class DataBaseProvider(AbstractDataBaseProvider):
 
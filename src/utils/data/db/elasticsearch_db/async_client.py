@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import json
+from typing import Any, Iterable, Optional, Tuple, Union
+from urllib.parse import quote
+
+import aiohttp
+from elasticsearch.exceptions import (HTTP_EXCEPTIONS, ConnectionError, ConnectionTimeout,
+                                      TransportError)
+from elasticsearch.serializer import JSONSerializer
+
+
+__all__ = ["AsyncElasticsearch"]
+
+
+def _make_path(*parts) -> str:
+    """
+    Build url path from the parts, empty parts are skipped
+
+    :return: url path
+    """
+    return "/" + "/".join(quote(str(part), safe=",*") for part in parts
+                          if part not in (None, ""))
+
+
+def _escape(value: Any) -> str:
+    """
+    Convert request parameter value into the form expected by elasticsearch
+
+    :param value: parameter value
+    :return: string representation of the value
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(_escape(item) for item in value)
+    return str(value)
+
+
+class AsyncIndicesClient:
+    """Indices API of the asynchronous elasticsearch client"""
+
+    def __init__(self, client: "AsyncElasticsearch"):
+        self._client = client
+
+    async def refresh(self, index: str = None, **params) -> dict:
+        return await self._client.perform_request("POST", _make_path(index, "_refresh"), params)
+
+    async def get_alias(self, index: str = None, name: str = None, **params) -> dict:
+        return await self._client.perform_request("GET", _make_path(index, "_alias", name),
+                                                  params)
+
+    async def create(self, index: str, body: dict = None, **params) -> dict:
+        return await self._client.perform_request("PUT", _make_path(index), params, body)
+
+    async def get(self, index: str, **params) -> dict:
+        return await self._client.perform_request("GET", _make_path(index), params)
+
+
+class AsyncElasticsearch:
+    """
+    Asynchronous elasticsearch client performing requests directly on the event loop.
+
+    It supports the subset of `elasticsearch.Elasticsearch` API used by `ElasticSearchDB`
+    with the same arguments, responses and exceptions. Requests share the pool of keep-alive
+    connections, so the number of concurrent requests is not bounded by the number of threads.
+    """
+
+    _serializer = JSONSerializer()
+
+    def __init__(self, host: str, port: int, http_auth: Optional[Tuple[str, str]] = None,
+                 max_connections: int = 100, timeout: float = 10.0):
+        """
+
+        :param str host: elasticsearch server host
+        :param int port: elasticsearch server port
+        :param tuple http_auth: login and password for basic authentication
+        :param int max_connections: max number of simultaneously open connections
+        :param float timeout: request timeout in seconds
+        """
+        self._base_url = f"http://{host}:{port}"
+        self._auth = aiohttp.BasicAuth(*http_auth) if http_auth else None
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._session = None
+        self.indices = AsyncIndicesClient(self)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # NOTE: session is created on the first request to bind it to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._max_connections)
+            self._session = aiohttp.ClientSession(
+                connector=connector, auth=self._auth,
+                timeout=aiohttp.ClientTimeout(total=self._timeout))
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def perform_request(self, method: str, path: str, params: dict = None,
+                              body: Union[dict, bytes] = None,
+                              ignore: Iterable[int] = ()) -> dict:
+        """
+        Perform request to elasticsearch server
+
+        :param str method: HTTP method
+        :param str path: url path
+        :param dict params: url query parameters
+        :param body: request body, dict is serialized to JSON, bytes are sent as is
+        :param ignore: HTTP statuses of errors which are returned as regular responses
+        :return: deserialized response body
+        """
+        params = {key: _escape(value) for key, value in (params or dict()).items()
+                  if value is not None}
+        headers = dict()
+        data = None
+        if isinstance(body, bytes):
+            data = body
+            headers["Content-Type"] = "application/x-ndjson"
+        elif body is not None:
+            data = self._dumps(body)
+            headers["Content-Type"] = "application/json"
+
+        try:
+            async with self._get_session().request(method, self._base_url + path, params=params,
+                                                   data=data, headers=headers) as response:
+                status = response.status
+                raw_data = await response.text()
+        except asyncio.TimeoutError as e:
+            raise ConnectionTimeout("TIMEOUT", f"{e}", e)
+        except aiohttp.ClientError as e:
+            raise ConnectionError("N/A", f"{e}", e)
+
+        if not 200 <= status < 300 and status not in ignore:
+            self._raise_error(status, raw_data)
+        return self._serializer.loads(raw_data) if raw_data else dict()
+
+    def _dumps(self, data: Any) -> bytes:
+        serialized = self._serializer.dumps(data)
+        return serialized.encode("utf-8") if isinstance(serialized, str) else serialized
+
+    @staticmethod
+    def _raise_error(status: int, raw_data: str) -> None:
+        """Raise the same exception as synchronous client does for the error response"""
+        error_message = raw_data
+        additional_info = None
+        try:
+            if raw_data:
+                additional_info = json.loads(raw_data)
+                error_message = additional_info.get("error", error_message)
+                if isinstance(error_message, dict) and "type" in error_message:
+                    error_message = error_message["type"]
+        except (ValueError, TypeError, AttributeError):
+            pass
+        raise HTTP_EXCEPTIONS.get(status, TransportError)(status, error_message, additional_info)
+
+    async def index(self, index: str, body: dict, doc_type: str = "_doc", id: Any = None,
+                    **params) -> dict:
+        method = "PUT" if id is not None else "POST"
+        return await self.perform_request(method, _make_path(index, doc_type, id), params, body)
+
+    async def bulk(self, body: list, index: str = None, doc_type: str = None, **params) -> dict:
+        body = b"".join(self._dumps(line) + b"\n" for line in body)
+        return await self.perform_request("POST", _make_path(index, doc_type, "_bulk"), params,
+                                          body)
+
+    async def search(self, index: str = None, doc_type: str = None, body: dict = None,
+                     **params) -> dict:
+        return await self.perform_request("POST", _make_path(index, doc_type, "_search"), params,
+                                          body)
+
+    async def scroll(self, scroll_id: str = None, body: dict = None, **params) -> dict:
+        if scroll_id and not body:
+            body = {"scroll_id": scroll_id}
+        return await self.perform_request("POST", "/_search/scroll", params, body)
+
+    async def clear_scroll(self, scroll_id: str = None, body: dict = None,
+                           ignore: Iterable[int] = (), **params) -> dict:
+        if scroll_id and not body:
+            body = {"scroll_id": [scroll_id]}
+        return await self.perform_request("DELETE", "/_search/scroll", params, body, ignore)
+
+    async def mget(self, body: dict, index: str = None, doc_type: str = None,
+                   **params) -> dict:
+        return await self.perform_request("POST", _make_path(index, doc_type, "_mget"), params,
+                                          body)
+
+    async def count(self, index: str = None, doc_type: str = None, body: dict = None,
+                    **params) -> dict:
+        return await self.perform_request("POST", _make_path(index, doc_type, "_count"), params,
+                                          body)
+
+    async def update_by_query(self, index: str, doc_type: str = None, body: dict = None,
+                              **params) -> dict:
+        return await self.perform_request(
+            "POST", _make_path(index, doc_type, "_update_by_query"), params, body)
+
+    async def delete_by_query(self, index: str, body: dict, doc_type: str = None,
+                              **params) -> dict:
+        return await self.perform_request(
+            "POST", _make_path(index, doc_type, "_delete_by_query"), params, body)
@@ -19,13 +19,14 @@ import asyncio
 import multiprocessing
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Type, Union, Any
-from string import Template
+from decimal import Decimal
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import List, Type, Any, AsyncIterator, Dict, Iterable, Tuple
 
 from elasticsearch_dsl import Q, Search, UpdateByQuery
-from elasticsearch_dsl.response import UpdateByQueryResponse
 from elasticsearch import Elasticsearch
-from elasticsearch import ConflictError, ConnectionError
+from elasticsearch import ConflictError, ConnectionError, TransportError
 from schematics.types import (StringType, DecimalType, DateType, IntType, BaseType, BooleanType,
                               DateTimeType, UTCDateTimeType, FloatType, LongType, NumberType,
                               ListType)
@@ -35,10 +36,17 @@ from cortx.utils.errors import InternalError
 from cortx.utils.data.access import Query, SortOrder, IDataBase
 from cortx.utils.data.access import ExtQuery
 from cortx.utils.data.db import GenericDataBase, GenericQueryConverter
-from cortx.utils.data.access import BaseModel
+from cortx.utils.data.access import BaseModel, BulkWriteResult
 from cortx.utils.errors import DataAccessExternalError, DataAccessInternalError
 from cortx.utils.data.access.filters import FilterOperationCompare
 from cortx.utils.data.access.filters import ComparisonOperation, IFilter
+from cortx.utils.data.access.filters import field_to_str
+from cortx.utils.data.access.filters import FilterOperationAnd, FilterOperationOr
+from cortx.utils.data.access.filter_optimizer import FilterOptimizer, is_contradiction
+from cortx.utils.data.access.storage import ITERATION_BATCH_SIZE
+from cortx.utils.data.db.aggregation import (AggregationFunction, StreamAggregator,
+                                             get_aggregation_fields)
+from cortx.utils.data.db.elasticsearch_db.async_client import AsyncElasticsearch
 
 
 __all__ = ["ElasticSearchDB"]
@@ -59,9 +67,52 @@ class ESWords:
     ORDER = "order"
     COUNT = "count"
     DELETED = "deleted"
+    UPDATED = "updated"
     PAINLESS = "painless"
     FIELD_DATA = "fielddata"
     INDEX_SETTINGS = "settings"
+    HITS = "hits"
+    SCROLL_ID = "_scroll_id"
+    ID = "_id"
+    IDS = "ids"
+    DOCS = "docs"
+    FOUND = "found"
+    INDEX = "index"
+    UPDATE = "update"
+    DELETE = "delete"
+    DOC = "doc"
+    ITEMS = "items"
+    STATUS = "status"
+    ERROR = "error"
+    REFRESH = "refresh"
+    DOC_ORDER = "_doc"
+    AGGS = "aggs"
+    AGGREGATIONS = "aggregations"
+    COMPOSITE = "composite"
+    SOURCES = "sources"
+    TERMS = "terms"
+    FIELD = "field"
+    SIZE = "size"
+    GROUP = "group"
+    GROUPS = "groups"
+    BUCKETS = "buckets"
+    KEY = "key"
+    DOC_COUNT = "doc_count"
+    AFTER = "after"
+    AFTER_KEY = "after_key"
+    VALUE = "value"
+    VALUE_AS_STRING = "value_as_string"
+
+
+class ESRefreshPolicy:
+    """Policies of making writes visible for search"""
+
+    IMMEDIATE = "immediate"  # refresh index after every write
+    WAIT_FOR = "wait_for"  # write request waits for the next scheduled refresh of elasticsearch
+    NONE = "none"  # rely on periodic refresh configured in elasticsearch index settings
+    PERIODIC = "periodic"  # single delayed refresh for all writes made within refresh interval
+
+    ALL = frozenset((IMMEDIATE, WAIT_FOR, NONE, PERIODIC))
 
 
 class ESDataType:
@@ -110,21 +161,6 @@ DATA_MAP = {
 }
 
 
-def field_to_str(field: Union[str, BaseType]) -> str:
-    """
-    Convert model field to its string representation
-
-    :param Union[str, BaseType] field:
-    :return: model field string representation
-    """
-    if isinstance(field, str):
-        return field
-    elif isinstance(field, BaseType):
-        return field.name
-    else:
-        raise DataAccessInternalError("Failed to convert field to string representation")
-
-
 class ElasticSearchQueryConverter(GenericQueryConverter):
     """
     Implementation of filter tree visitor that converts the tree into the Query
@@ -137,23 +173,54 @@ class ElasticSearchQueryConverter(GenericQueryConverter):
 
     def __init__(self, model):
         self.comparison_conversion = {
-            ComparisonOperation.OPERATION_EQ: self._match_query,
+            ComparisonOperation.OPERATION_EQ: self._term_query,
+            ComparisonOperation.OPERATION_NE: self._not_term_query,
             ComparisonOperation.OPERATION_LT: self._range_generator('lt'),
             ComparisonOperation.OPERATION_GT: self._range_generator('gt'),
             ComparisonOperation.OPERATION_LEQ: self._range_generator('lte'),
-            ComparisonOperation.OPERATION_GEQ: self._range_generator('gte')
+            ComparisonOperation.OPERATION_GEQ: self._range_generator('gte'),
+            ComparisonOperation.OPERATION_LIKE: self._wildcard_query,
+            ComparisonOperation.OPERATION_STARTS_WITH: self._prefix_query,
+            ComparisonOperation.OPERATION_IN: self._terms_query
         }
         # Needed to perform for type casting if field name is pure string,
         # not of format Model.field
         self._model = model
 
     @staticmethod
-    def _match_query(field: str, target):
-        obj = {
-            field: target
-        }
+    def _normalize(target):
+        # NOTE: normalizer is not applied to term level queries in the same way for all query
+        #  types, so lower string values in the same way as lowercase normalizer of keyword
+        #  fields does it
+        return target.lower() if isinstance(target, str) else target
+
+    @classmethod
+    def _term_query(cls, field: str, target):
+        if target is None:
+            return ~Q("exists", field=field)
+        return Q("term", **{field: cls._normalize(target)})
 
-        return Q("match", **obj)
+    @classmethod
+    def _not_term_query(cls, field: str, target):
+        if target is None:
+            return Q("exists", field=field)
+        return ~Q("term", **{field: cls._normalize(target)})
+
+    @classmethod
+    def _terms_query(cls, field: str, targets):
+        return Q("terms", **{field: [cls._normalize(target) for target in targets]})
+
+    @classmethod
+    def _prefix_query(cls, field: str, target):
+        return Q("prefix", **{field: cls._normalize(target)})
+
+    @classmethod
+    def _wildcard_query(cls, field: str, target):
+        if not isinstance(target, str):
+            raise DataAccessInternalError(f"Like comparison requires string value: {target}")
+        pattern = cls._normalize(target).replace("\\", "\\\\").replace("*", "\\*")
+        pattern = pattern.replace("?", "\\?")
+        return Q("wildcard", **{field: f"*{pattern}*"})
 
     @staticmethod
     def _range_generator(op_string: str):
@@ -169,26 +236,82 @@ class ElasticSearchQueryConverter(GenericQueryConverter):
         return _make_query
 
     def build(self, root: IFilter):
+        """
+        Convert filter into query executed in filter context: objects are not scored and
+        elasticsearch can cache the clauses
+
+        :param IFilter root: filter object
+        :return: bool query with filter clause
+        """
         # TODO: may be, we should move this method to the entity that processes
         # Query objects
-        return root.accept_visitor(self)
+        return Q("bool", filter=[root.accept_visitor(self)])
+
+    def handle_and(self, entry: FilterOperationAnd):
+        operands = entry.get_operands()
+        if len(operands) < 2:
+            raise Exception("Malformed AND operation: fewer than two arguments")
+
+        return Q("bool", filter=[operand.accept_visitor(self) for operand in operands])
+
+    def handle_or(self, entry: FilterOperationOr):
+        operands = entry.get_operands()
+        if len(operands) < 2:
+            raise Exception("Malformed OR operation: fewer than two arguments")
+
+        fields = set()
+        values = list()
+        for operand in operands:
+            if not isinstance(operand, FilterOperationCompare) or \
+                    operand.get_operation() != ComparisonOperation.OPERATION_EQ:
+                break
+            field_str, value = self._convert_operands(operand)
+            if value is None:
+                break
+            fields.add(field_str)
+            values.append(self._normalize(value))
+        else:
+            if len(fields) == 1:
+                # equality comparisons of the same field are checked by single terms query
+                return Q("terms", **{fields.pop(): values})
 
-    def handle_compare(self, entry: FilterOperationCompare):
-        super().handle_compare(entry)  # Call generic code
+        return Q("bool", should=[operand.accept_visitor(self) for operand in operands],
+                 minimum_should_match=1)
 
-        field = entry.get_left_operand()
+    def _convert_operands(self, entry: FilterOperationCompare) -> tuple:
+        """
+        Get field name and native value of the comparison
 
+        :param FilterOperationCompare entry: comparison
+        :return: field name and converted right operand
+        """
+        field = entry.get_left_operand()
         field_str = field_to_str(field)
-
-        op = entry.get_operation()
+        right_operand = entry.get_right_operand()
+        if right_operand is None:
+            return field_str, None
+        if isinstance(field, str):
+            field = getattr(self._model, field_str)
         try:
-            if isinstance(field, str):
-                right_operand = getattr(self._model, field_str).to_native(entry.get_right_operand())
-            else:
-                right_operand = field.to_native(entry.get_right_operand())
+            if entry.get_operation() == ComparisonOperation.OPERATION_IN:
+                if not isinstance(right_operand, (list, tuple)):
+                    raise DataAccessInternalError(
+                        f"In comparison requires list of values: {right_operand}")
+                return field_str, [field.to_native(value) for value in right_operand
+                                   if value is not None]
+            return field_str, field.to_native(right_operand)
         except ConversionError as e:
             raise DataAccessInternalError(f"{e}")
 
+    def handle_compare(self, entry: FilterOperationCompare):
+        super().handle_compare(entry)  # Call generic code
+
+        field_str, right_operand = self._convert_operands(entry)
+        op = entry.get_operation()
+        if right_operand is None and op not in (ComparisonOperation.OPERATION_EQ,
+                                                ComparisonOperation.OPERATION_NE):
+            raise DataAccessInternalError(f"Comparison {op.value} requires not null value")
+
         return self.comparison_conversion[op](field_str, right_operand)
 
 
@@ -254,11 +377,21 @@ class ElasticSearchQueryService:
     """Query service-helper for Elasticsearch"""
 
     def __init__(self, index: str, es_client: Elasticsearch,
-                 query_converter: ElasticSearchQueryConverter, mapping_type: str):
+                 query_converter: ElasticSearchQueryConverter, mapping_type: str,
+                 filter_optimizer: FilterOptimizer, model: Type[BaseModel]):
         self._index = index
         self._es_client = es_client
         self._query_converter = query_converter
         self._mapping_type = mapping_type
+        self._filter_optimizer = filter_optimizer
+        self._model = model
+
+    def _keyset_value(self, field: str, value: Any) -> Any:
+        # NOTE: keywords are sorted by values produced by lowercase normalizer
+        if isinstance(value, str) and DATA_MAP.get(type(self._model.fields.get(field))) \
+                == ESDataType.KEYWORD:
+            return value.lower()
+        return value
 
     def search_by_query(self, query: Query) -> Search:
         """
@@ -271,26 +404,44 @@ class ElasticSearchQueryService:
             return ESWords.ASC if name == SortOrder.ASC else ESWords.DESC
 
         extra_params = dict()
-        sort_by = dict()
         search = Search(index=self._index, doc_type=self._mapping_type, using=self._es_client)
 
         q = query.data
 
-        if q.filter_by is not None:
-            filter_by = self._query_converter.build(q.filter_by)
+        filter_obj = self._filter_optimizer.optimize(q.filter_by)
+        if filter_obj is not None:
+            filter_by = self._query_converter.build(filter_obj)
             search = search.query(filter_by)
 
-        if q.offset is not None:
+        if q.cursor is not None:
+            # NOTE: keyset pagination: page position is set by sort values of the previous
+            #  page last object instead of offset, so deep pages are as cheap as the first one
+            keyset = q.get_keyset(self._model.primary_key)
+            cursor_values = q.get_cursor_values(self._model.primary_key)
+            search = search.sort(*({field: {ESWords.ORDER: convert(order)}}
+                                   for field, order in keyset))
+            if cursor_values is not None:
+                extra_params["search_after"] = [
+                    self._keyset_value(field, value)
+                    for (field, _order), value in zip(keyset, cursor_values)]
+        elif q.offset is not None:
             extra_params["from_"] = q.offset
         if q.limit is not None:
             extra_params["size"] = q.limit
 
-        if any((i is not None for i in (q.offset, q.limit))):
+        if extra_params:
             search = search.extra(**extra_params)
 
-        if q.order_by is not None:
-            sort_by[field_to_str(q.order_by.field)] = {ESWords.ORDER: convert(q.order_by.order)}
-            search = search.sort(sort_by)
+        projection = q.get_projection(self._model)
+        if projection is not None:
+            search = search.source(projection)
+
+        if q.sort_by and q.cursor is None:
+            search = search.sort(*({field: {ESWords.ORDER: convert(order)}}
+                                   for field, order in q.get_sort_keys()))
+        elif q.cursor is None:
+            # NOTE: objects are not scored, index order is the cheapest one
+            search = search.sort(ESWords.DOC_ORDER)
 
         return search
 
@@ -299,19 +450,24 @@ class ElasticSearchDB(GenericDataBase):
     """ElasticSearch Storage Interface Implementation"""
 
     elastic_instance = None
+    async_instance = None
     thread_pool = None
     loop = None
 
-    _default_template = Template("ctx._source.$FIELD_NAME = '$FIELD_VALUE';")
-    _inline_templates = {
-        bool: Template("ctx._source.$FIELD_NAME = $FIELD_VALUE;"),
-        int: Template("ctx._source.$FIELD_NAME = $FIELD_VALUE;"),
-        float: Template("ctx._source.$FIELD_NAME = $FIELD_VALUE;"),
-    }
     _default_date_format = '%Y-%m-%dT%H:%M:%S.%fZ'
+    # search context keep alive time between scroll requests of the iteration
+    _scroll_keep_alive = "1m"
+    # max number of operations in one bulk request
+    _bulk_chunk_size = 500
+    # number of groups fetched by one composite aggregation request
+    _aggregation_page_size = 1000
+    # max number of documents requested by one multi-get request
+    _mget_chunk_size = 1000
 
     def __init__(self, es_client: Elasticsearch, model: Type[BaseModel], collection: str,
-                 thread_pool_exec: ThreadPoolExecutor, loop: asyncio.AbstractEventLoop = None):
+                 thread_pool_exec: ThreadPoolExecutor, loop: asyncio.AbstractEventLoop = None,
+                 refresh_policy: str = ESRefreshPolicy.IMMEDIATE, refresh_interval: float = 1.0,
+                 async_client: AsyncElasticsearch = None):
         """
 
         :param Elasticsearch es_client: elasticsearch client
@@ -319,8 +475,16 @@ class ElasticSearchDB(GenericDataBase):
         :param str collection: string represented collection for `model`
         :param ThreadPoolExecutor thread_pool_exec: thread pool executor
         :param BaseEventLoop loop: asyncio event loop
+        :param str refresh_policy: policy of making writes visible for search, see
+                                   `ESRefreshPolicy`
+        :param float refresh_interval: delay in seconds of the index refresh after write for
+                                       `ESRefreshPolicy.PERIODIC` policy
+        :param AsyncElasticsearch async_client: asynchronous elasticsearch client, requests are
+                                                performed by `es_client` in the thread pool if
+                                                it is not set
         """
         self._es_client = es_client
+        self._async_client = async_client
         self._tread_pool_exec = thread_pool_exec
         self._loop = loop or asyncio.get_event_loop()
         self._mapping_type = collection  # Used as mapping type for particular index
@@ -335,20 +499,30 @@ class ElasticSearchDB(GenericDataBase):
                                           "from cortx.utils.data.access.BaseModel")
         self._model = model  # Needed to build returning objects
 
+        if refresh_policy not in ESRefreshPolicy.ALL:
+            raise DataAccessInternalError(f"Unknown ElasticSearch refresh policy: {refresh_policy}")
+        self._refresh_policy = refresh_policy
+        self._refresh_interval = refresh_interval
+        self._scheduled_refresh = None
+
         self._index_info = None
         self._model_scheme = None
 
+        self._filter_optimizer = FilterOptimizer(model)
         self._query_service = ElasticSearchQueryService(self._index, self._es_client,
-                                                        self._query_converter, self._mapping_type)
+                                                        self._query_converter, self._mapping_type,
+                                                        self._filter_optimizer, self._model)
 
     @classmethod
-    async def create_database(cls, config, collection, model: Type[BaseModel]) -> IDataBase:
+    async def create_database(cls, config, collection, model: Type[BaseModel],
+                              model_settings=None) -> IDataBase:
         """
         Creates new instance of ElasticSearch DB and performs necessary initializations
 
         :param DBSettings config: configuration for elasticsearch server
         :param str collection: collection for storing model onto db
         :param Type[BaseModel] model: model which instances will be stored in DB
+        :param ModelSettings model_settings: model specific settings for elasticsearch
         :return:
         """
         # NOTE: please, be sure that you avoid using this method twice (or more times) for the same
@@ -360,10 +534,21 @@ class ElasticSearchDB(GenericDataBase):
 
             node = {"host": config.host, "port": config.port}
             cls.elastic_instance = Elasticsearch(hosts=[node], http_auth=auth)
-            cls.pool = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
+            cls.thread_pool = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
             cls.loop = asyncio.get_event_loop()
+            # NOTE: asynchronous client owns HTTP session, so it is created once and shared by
+            #  all models
+            if config.async_transport and cls.async_instance is None:
+                cls.async_instance = AsyncElasticsearch(config.host, config.port, http_auth=auth,
+                                                        max_connections=config.max_connections)
 
-        es_db = cls(cls.elastic_instance, model, collection, cls.thread_pool, cls.loop)
+        refresh_options = dict()
+        if model_settings is not None:
+            refresh_options = {"refresh_policy": model_settings.refresh_policy,
+                               "refresh_interval": model_settings.refresh_interval}
+
+        es_db = cls(cls.elastic_instance, model, collection, cls.thread_pool, cls.loop,
+                    async_client=cls.async_instance, **refresh_options)
 
         try:
             await es_db.attach_to_index(config.replication)
@@ -375,22 +560,28 @@ class ElasticSearchDB(GenericDataBase):
 
         return es_db
 
+    async def _call(self, api: str, **kwargs) -> Any:
+        """
+        Perform elasticsearch client API call: natively on the event loop by asynchronous client
+        if it is configured or by synchronous client in the thread pool otherwise
+
+        :param str api: client API method name, e.g. "search" or "indices.refresh"
+        :return: elasticsearch response
+        """
+        if self._async_client is not None:
+            return await attrgetter(api)(self._async_client)(**kwargs)
+
+        es_call = partial(attrgetter(api)(self._es_client), **kwargs)
+        return await self._loop.run_in_executor(self._tread_pool_exec, es_call)
+
     async def attach_to_index(self, replication: int) -> None:
         """
         Provides async method to connect storage to index bound to provided model and collection
         :return:
         """
-        def _get_alias(_index):
-            return self._es_client.indices.get_alias(self._index, ignore_unavailable=True)
-
-        def _create(_index, _body):
-            self._es_client.indices.create(index=_index, body=_body)
-
-        def _get(_index):
-            return self._es_client.indices.get(self._index)
-
         try:
-            indices = await self._loop.run_in_executor(self._tread_pool_exec, _get_alias, self._index)
+            indices = await self._call("indices.get_alias", index=self._index,
+                                       ignore_unavailable=True)
         except ConnectionError as e:
             raise DataAccessExternalError(f"Failed to establish connection to ElasticSearch: {e}")
 
@@ -401,11 +592,9 @@ class ElasticSearchDB(GenericDataBase):
             # self._es_client.indices.create(index=model.__name__, ignore=400, body=mappings_dict)
 
             # NOTE: for newly created indexes ElasticSearch mapping type and index name coincide
-            await self._loop.run_in_executor(self._tread_pool_exec,
-                                             _create, self._index, mappings_dict)
+            await self._call("indices.create", index=self._index, body=mappings_dict)
 
-        self._index_info = await self._loop.run_in_executor(self._tread_pool_exec,
-                                                            _get, self._index)
+        self._index_info = await self._call("indices.get", index=self._index)
 
         # NOTE: if ElasticSearch index was created outside from CSM Agent there
         #  is no guarantee that index name and mapping type coincide
@@ -415,27 +604,13 @@ class ElasticSearchDB(GenericDataBase):
         self._model_scheme = self._index_info[self._index][ESWords.MAPPINGS][self._mapping_type][ESWords.PROPERTIES]
         self._model_scheme = {k.lower(): v for k, v in self._model_scheme.items()}
 
-    async def store(self, obj: BaseModel):
+    def _to_document(self, obj: BaseModel) -> dict:
         """
-        Store object into Storage
-
-        :param BaseModel obj: Arbitrary base object for storing into DB
+        Build elasticsearch document of the object
 
+        :param BaseModel obj: model object
+        :return: dict representation of the object
         """
-        def _store(_id, _doc: dict):
-            """
-            Store particular object into elasticsearch index
-
-            :param dict _doc: dict representation of the object
-            :return: elastic search server response
-            """
-            # TODO: is it needed to use id?
-            _result = self._es_client.index(index=self._index, doc_type=self._mapping_type,
-                                            id=_id, body=_doc)
-            return _result
-
-        await super().store(obj)  # Call generic code
-
         doc = dict()
         for key in self._model_scheme:
             doc[key] = getattr(obj, key)
@@ -448,17 +623,136 @@ class ElasticSearchDB(GenericDataBase):
                         nested_obj[k] = v
                     list_nested.append(nested_obj)
                 doc[key] = list_nested
+        return doc
+
+    async def store(self, obj: BaseModel):
+        """
+        Store object into Storage
+
+        :param BaseModel obj: Arbitrary base object for storing into DB
+
+        """
+        await super().store(obj)  # Call generic code
+
+        doc = self._to_document(obj)
 
         obj_id = str(obj.primary_key_val)  # convert primary key value into string
 
-        # TODO: check future for the error and result
-        # future = self._tread_pool_exec.submit(_store, doc)
-        # result = self._loop.run_until_complete(future)
+        # TODO: check the error and result
+        result = await self._call("index", index=self._index, doc_type=self._mapping_type,
+                                  id=obj_id, body=doc, **self._write_params())
+        await self._refresh_after_write(waited=True)
+        return result
 
-        result = await self._loop.run_in_executor(self._tread_pool_exec, _store, obj_id, doc)
-        # TODO: discuss that. May be better avoid this to increase store performance
-        # NOTE: make refresh to ensure that updated results will be available quickly
-        await self._refresh_index()
+    async def _execute_bulk(self, operations: List[tuple], result: BulkWriteResult) -> None:
+        """
+        Execute bulk operations by chunks and record per-object outcome
+
+        :param list operations: tuples of object id, bulk action and action source (or None)
+        :param BulkWriteResult result: result to record outcome of the operations
+        :return:
+        """
+        for start in range(0, len(operations), self._bulk_chunk_size):
+            chunk = operations[start:start + self._bulk_chunk_size]
+            body = list()
+            for _obj_id, action, source in chunk:
+                body.append(action)
+                if source is not None:
+                    body.append(source)
+
+            try:
+                response = await self._call("bulk", body=body, index=self._index,
+                                            doc_type=self._mapping_type, **self._write_params())
+            except TransportError as e:
+                for obj_id, _action, _source in chunk:
+                    result.add_error(obj_id, f"Bulk request to ElasticSearch failed: {e}")
+                continue
+
+            for (obj_id, _action, _source), item in zip(chunk, response[ESWords.ITEMS]):
+                outcome = next(iter(item.values()))
+                if outcome.get(ESWords.STATUS) == 404:
+                    result.add_missing(obj_id)  # document is missing for update or delete
+                elif ESWords.ERROR in outcome:
+                    result.add_error(obj_id, f"{outcome[ESWords.ERROR]}")
+                else:
+                    result.add_success(obj_id)
+
+    async def store_many(self, objs: Iterable[BaseModel]) -> BulkWriteResult:
+        """
+        Store objects into Storage by bulk requests with single index refresh (if refresh policy
+        requires it)
+
+        :param objs: model objects for storing into DB
+        :return: result with ids of stored objects and errors of objects which were not stored
+        """
+        result = BulkWriteResult()
+        operations = list()
+        for obj in objs:
+            try:
+                await super().store(obj)  # Call generic code to validate the object
+            except DataAccessInternalError as e:
+                result.add_error(obj.primary_key_val, f"{e}")
+                continue
+            action = {ESWords.INDEX: {ESWords.ID: str(obj.primary_key_val)}}
+            operations.append((obj.primary_key_val, action, self._to_document(obj)))
+
+        await self._execute_bulk(operations, result)
+        if result.succeeded:
+            await self._refresh_after_write(waited=True)
+        return result
+
+    async def update_many(self, to_update: Dict[Any, dict]) -> BulkWriteResult:
+        """
+        Update objects by their ids using bulk partial document updates with single index
+        refresh (if refresh policy requires it)
+
+        :param dict to_update: object id -> dictionary with fields and values which should be
+                               updated
+        :return: result with ids of updated and not found objects and errors of objects which
+                 were not updated
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        result = BulkWriteResult()
+        operations = list()
+        for obj_id, changes in to_update.items():
+            changes = dict(changes)
+            try:
+                converted_id = id_field.to_native(obj_id)
+                await super().update(None, changes)  # Call generic code to convert changes
+            except (ConversionError, DataAccessInternalError) as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            action = {ESWords.UPDATE: {ESWords.ID: str(converted_id)}}
+            operations.append((obj_id, action, {ESWords.DOC: changes}))
+
+        await self._execute_bulk(operations, result)
+        if result.succeeded:
+            await self._refresh_after_write(waited=True)
+        return result
+
+    async def delete_many(self, obj_ids: Iterable[Any]) -> BulkWriteResult:
+        """
+        Delete objects by their ids using bulk requests with single index refresh (if refresh
+        policy requires it)
+
+        :param obj_ids: ids of the objects to be deleted
+        :return: result with ids of deleted and not found objects and errors of objects which
+                 were not deleted
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        result = BulkWriteResult()
+        operations = list()
+        for obj_id in obj_ids:
+            try:
+                converted_id = id_field.to_native(obj_id)
+            except ConversionError as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            operations.append((obj_id, {ESWords.DELETE: {ESWords.ID: str(converted_id)}}, None))
+
+        await self._execute_bulk(operations, result)
+        if result.succeeded:
+            await self._refresh_after_write(waited=True)
         return result
 
     async def get(self, query: Query) -> List[BaseModel]:
@@ -468,12 +762,101 @@ class ElasticSearchDB(GenericDataBase):
         :param query:
         :return: empty list or list with objects which satisfy the passed query condition
         """
-        def _get(_query):
-            search = self._query_service.search_by_query(_query)
-            return search.execute()
+        if is_contradiction(self._filter_optimizer.optimize(query.data.filter_by)):
+            return list()
+
+        search = self._query_service.search_by_query(query)
+        response = await self._call("search", index=self._index, doc_type=self._mapping_type,
+                                    body=search.to_dict())
+        return [self._model(hit[ESWords.SOURCE]) for hit in response[ESWords.HITS][ESWords.HITS]]
+
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values using multi-get requests. Multi-get is
+        realtime, so objects are visible right after the write regardless of the refresh policy.
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        converted = self._convert_ids(obj_ids)
+        found = dict()
+        for start in range(0, len(converted), self._mget_chunk_size):
+            chunk = converted[start:start + self._mget_chunk_size]
+            response = await self._call("mget", index=self._index, doc_type=self._mapping_type,
+                                        body={ESWords.IDS: [str(obj_id) for obj_id in chunk]})
+            for obj_id, doc in zip(chunk, response[ESWords.DOCS]):
+                if doc.get(ESWords.FOUND):
+                    found[obj_id] = self._model(doc[ESWords.SOURCE])
+        return found
+
+    async def iterate(self, query: Query,
+                      batch_size: int = ITERATION_BATCH_SIZE) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over objects which satisfy the query. Objects are fetched by scroll requests of
+        `batch_size` hits, so iteration is not limited by the index max result window and sees
+        the index snapshot made by the first request.
 
-        result = await self._loop.run_in_executor(self._tread_pool_exec, _get, query)
-        return [self._model(hit.to_dict()) for hit in result]
+        :param Query query: query object which describes request to Storage
+        :param int batch_size: number of objects fetched from Storage by one request
+        :return: asynchronous iterator over objects
+        """
+        if query.data.cursor is not None:
+            # NOTE: search_after can't be used in scroll context, so keyset pages are requested
+            async for obj in super().iterate(query, batch_size):
+                yield obj
+            return
+
+        if batch_size <= 0:
+            raise DataAccessInternalError(f"Wrong iteration batch size: {batch_size}")
+        if is_contradiction(self._filter_optimizer.optimize(query.data.filter_by)):
+            return
+
+        # NOTE: scroll requests don't support "from" parameter, so offset and limit are applied
+        #  to the scrolled hits
+        offset = query.data.offset or 0
+        remaining = query.data.limit
+        search = self._query_service.search_by_query(
+            Query(query.data.sort_by, query.data.filter_by, fields=query.data.fields))
+
+        response = await self._call("search", index=self._index, doc_type=self._mapping_type,
+                                    body=search.to_dict(), scroll=self._scroll_keep_alive,
+                                    size=batch_size)
+        scroll_id = response.get(ESWords.SCROLL_ID)
+        try:
+            while remaining is None or remaining > 0:
+                hits = response[ESWords.HITS][ESWords.HITS]
+                if not hits:
+                    return
+                if offset >= len(hits):
+                    offset -= len(hits)
+                else:
+                    hits = hits[offset:] if remaining is None else hits[offset:offset + remaining]
+                    offset = 0
+                    if remaining is not None:
+                        remaining -= len(hits)
+                    for hit in hits:
+                        yield self._model(hit[ESWords.SOURCE])
+                    if remaining == 0:
+                        return
+
+                response = await self._call("scroll", scroll_id=scroll_id,
+                                            scroll=self._scroll_keep_alive)
+                scroll_id = response.get(ESWords.SCROLL_ID, scroll_id)
+        finally:
+            if scroll_id is not None:
+                await self._call("clear_scroll", scroll_id=scroll_id, ignore=(404,))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _update_script_source(fields: Tuple[str, ...]) -> str:
+        """
+        Get source of the painless script which sets the fields to the values of script
+        parameters with the same names
+
+        :param tuple fields: sorted names of the updated fields
+        :return: script source
+        """
+        return " ".join(f"ctx._source['{field}'] = params['{field}'];" for field in fields)
 
     async def update(self, filter_obj: IFilter, to_update: dict) -> int:
         """
@@ -483,56 +866,45 @@ class ElasticSearchDB(GenericDataBase):
         :param dict to_update: dictionary with fields and values which should be updated
         :return: number of updated entries
         """
-        def dict_to_source(__to_update: dict) -> str:
+        def _value_converter(_value: Any) -> Any:
             """
-            Convert __to_update dict into elasticsearch source representation
-            :param __to_update: dictionary with fields and values which should be updated
-            :return: elasticsearch inline representation
+            Convert value if it is necessary
+            :param _value:
+            :return:
             """
+            if isinstance(_value, datetime):
+                return _value.strftime(self._default_date_format)
+            elif isinstance(_value, Decimal):
+                return str(_value)  # decimals are stored as keywords
 
-            def _value_converter(_value: Any) -> Any:
-                """
-                Convert value if it is necessary
-                :param _value:
-                :return:
-                """
-                if isinstance(_value, bool):
-                    return str(_value).lower()
-                elif isinstance(_value, datetime):
-                    return _value.strftime(self._default_date_format)
-
-                return _value
-
-            return " ".join(
-                (self._inline_templates.get(type(value), self._default_template).substitute(
-                    FIELD_NAME=key, FIELD_VALUE=_value_converter(value))
-                 for key, value in __to_update.items()))
-
-        def _update(_ubq) -> UpdateByQueryResponse:
-            """
-            Perform Update by Query in separate thread
-            :param UpdateByQuery _ubq: UpdateByQuery instance
-            :return: Response object of ElasticSearch DSL module
-            """
-            return _ubq.execute()
+            return _value
 
         _to_update = to_update.copy()  # Copy because it will be change below
 
         # NOTE: Important: call of the parent update method changes _to_update dict!
         await super().update(filter_obj, _to_update)  # Call the generic code
 
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
         ubq = UpdateByQuery(index=self._index, doc_type=self._mapping_type, using=self._es_client)
 
         filter_by = self._query_converter.build(filter_obj)
         ubq = ubq.query(filter_by)
 
-        source = dict_to_source(_to_update)
-        ubq = ubq.script(inline=source, lang=ESWords.PAINLESS)
+        # NOTE: values are passed as script parameters, so the script is compiled by
+        #  elasticsearch once per set of updated fields instead of once per update
+        source = self._update_script_source(tuple(sorted(_to_update)))
+        params = {key: _value_converter(value) for key, value in _to_update.items()}
+        ubq = ubq.script(source=source, lang=ESWords.PAINLESS, params=params)
 
-        result = await self._loop.run_in_executor(self._tread_pool_exec, _update, ubq)
+        result = await self._call("update_by_query", index=self._index,
+                                  doc_type=self._mapping_type, body=ubq.to_dict())
 
-        await self._refresh_index()  # ensure that updated results will be ready immediately
-        return result.updated
+        # NOTE: update by query does not support waiting for refresh
+        await self._refresh_after_write(waited=False)
+        return result[ESWords.UPDATED]
 
     async def _refresh_index(self):
         """
@@ -540,10 +912,55 @@ class ElasticSearchDB(GenericDataBase):
 
         :return:
         """
-        def _refresh():
-            self._es_client.indices.refresh(index=self._index)
+        await self._call("indices.refresh", index=self._index)
 
-        await self._loop.run_in_executor(self._tread_pool_exec, _refresh)
+    def _write_params(self) -> dict:
+        """
+        Get refresh parameters of index and bulk requests
+
+        :return: dict with request parameters
+        """
+        if self._refresh_policy == ESRefreshPolicy.WAIT_FOR:
+            return {ESWords.REFRESH: ESRefreshPolicy.WAIT_FOR}
+        return dict()
+
+    async def _refresh_after_write(self, waited: bool) -> None:
+        """
+        Make the written changes visible for search according to refresh policy
+
+        :param bool waited: `True` if write request was sent with `_write_params`
+        :return:
+        """
+        if self._refresh_policy == ESRefreshPolicy.IMMEDIATE:
+            await self._refresh_index()
+        elif self._refresh_policy == ESRefreshPolicy.WAIT_FOR and not waited:
+            await self._refresh_index()
+        elif self._refresh_policy == ESRefreshPolicy.PERIODIC and self._scheduled_refresh is None:
+            self._scheduled_refresh = asyncio.ensure_future(self._delayed_refresh(),
+                                                            loop=self._loop)
+
+    async def _delayed_refresh(self) -> None:
+        await asyncio.sleep(self._refresh_interval)
+        # NOTE: writes completed after this point schedule the next refresh
+        self._scheduled_refresh = None
+        try:
+            await self._refresh_index()
+        except TransportError:
+            pass  # changes become visible by the next refresh
+
+    async def _refresh_before_delete(self) -> None:
+        """
+        Refresh index if there can be writes which are not visible for search yet
+
+        :return:
+        """
+        if self._refresh_policy == ESRefreshPolicy.IMMEDIATE:
+            await self._refresh_index()
+        elif self._refresh_policy == ESRefreshPolicy.PERIODIC and \
+                self._scheduled_refresh is not None:
+            self._scheduled_refresh.cancel()
+            self._scheduled_refresh = None
+            await self._refresh_index()
 
     async def delete(self, filter_obj: IFilter) -> int:
         """
@@ -552,17 +969,18 @@ class ElasticSearchDB(GenericDataBase):
         :param IFilter filter_obj: filter object to perform delete operation
         :return: number of deleted entries
         """
-        def _delete(_by_filter):
-            search = Search(index=self._index, doc_type=self._mapping_type, using=self._es_client)
-            search = search.query(_by_filter)
-            return search.delete()
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
 
-        filter_by = self._query_converter.build(filter_obj)
+        search = Search(index=self._index, doc_type=self._mapping_type, using=self._es_client)
+        search = search.query(self._query_converter.build(filter_obj))
         # NOTE: Needed to avoid elasticsearch.ConflictError when we perform delete quickly
         #       after store operation
-        await self._refresh_index()
+        await self._refresh_before_delete()
         try:
-            result = await self._loop.run_in_executor(self._tread_pool_exec, _delete, filter_by)
+            result = await self._call("delete_by_query", index=self._index,
+                                      doc_type=self._mapping_type, body=search.to_dict())
         except ConflictError as e:
             raise DataAccessExternalError(f"{e}")
 
@@ -576,8 +994,9 @@ class ElasticSearchDB(GenericDataBase):
         :return: count of entries which satisfy the `filter_obj`
         """
 
-        def _count(_body):
-            return self._es_client.count(index=self._index, doc_type=self._mapping_type, body=_body)
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
 
         search = Search(index=self._index, doc_type=self._mapping_type, using=self._es_client)
         if filter_obj is not None:
@@ -586,14 +1005,105 @@ class ElasticSearchDB(GenericDataBase):
         else:
             search = search.query()
 
-        result = await self._loop.run_in_executor(self._tread_pool_exec, _count, search.to_dict())
+        result = await self._call("count", index=self._index, doc_type=self._mapping_type,
+                                  body=search.to_dict())
         return result.get(ESWords.COUNT)
 
-    async def count_by_query(self, ext_query: ExtQuery):
+    def _bucket_key(self, field_name: str, key: Any) -> Any:
         """
-        Count Aggregation function
+        Convert group value returned by composite aggregation into native value
 
-        :param ExtQuery ext_query: Extended query which describes to perform count aggregation
-        :return:
+        :param str field_name: group_by field name
+        :param key: bucket key value
+        :return: native group value
+        """
+        field = self._model.fields[field_name]
+        if isinstance(field, (DateType, DateTimeType)) and isinstance(key, (int, float)):
+            key = datetime.utcfromtimestamp(key / 1000)  # dates are grouped by epoch millis
+        try:
+            return field.to_native(key)
+        except ConversionError:
+            return key
+
+    def _metric_value(self, function: str, field_name: str, aggregation: dict) -> Any:
+        """
+        Convert result of metric aggregation into native value
+
+        :param str function: aggregation function name
+        :param str field_name: aggregated field name
+        :param dict aggregation: metric aggregation response
+        :return: native aggregated value
+        """
+        value = aggregation.get(ESWords.VALUE)
+        if value is None:
+            return None
+        field = self._model.fields[field_name]
+        try:
+            if function in (AggregationFunction.MIN, AggregationFunction.MAX) and \
+                    isinstance(field, (DateType, DateTimeType)):
+                return field.to_native(aggregation.get(ESWords.VALUE_AS_STRING, value))
+        except ConversionError:
+            return value
+        if function != AggregationFunction.AVG and isinstance(field, IntType):
+            return int(value)  # elasticsearch returns metrics of integer fields as float
+        return value
+
+    async def _aggregate(self, function: str, ext_query: ExtQuery) -> Any:
+        """
+        Perform aggregation on elasticsearch side: terms (composite) and metric aggregations
+        are requested without hits. Groups are fetched by pages of `_aggregation_page_size`
+        groups, so the number of groups is not limited by elasticsearch buckets limit.
+
+        NOTE: keyword group values are returned as they are indexed, i.e. in lower case
+
+        :param str function: aggregation function name, see `AggregationFunction`
+        :param ExtQuery ext_query: extended query which describes the aggregation
+        :return: aggregated value or dict group value -> aggregated value if group_by is set
         """
-        pass
+        value_field, group_field = get_aggregation_fields(self._model, function, ext_query)
+        filter_obj = self._filter_optimizer.optimize(ext_query.data.filter_by)
+        if is_contradiction(filter_obj):
+            return StreamAggregator(function).get_result() if group_field is None else dict()
+        if function == AggregationFunction.COUNT and group_field is None:
+            return await self.count(filter_obj)
+
+        search = Search(index=self._index, doc_type=self._mapping_type, using=self._es_client)
+        if filter_obj is not None:
+            search = search.query(self._query_converter.build(filter_obj))
+        body = search.extra(size=0).to_dict()
+        metric = {function: {ESWords.FIELD: value_field}} if value_field is not None else None
+
+        if group_field is None:
+            body[ESWords.AGGS] = {ESWords.VALUE: metric}
+            response = await self._call("search", index=self._index, doc_type=self._mapping_type,
+                                        body=body)
+            return self._metric_value(function, value_field,
+                                      response[ESWords.AGGREGATIONS][ESWords.VALUE])
+
+        composite = {
+            ESWords.SIZE: self._aggregation_page_size,
+            ESWords.SOURCES: [{ESWords.GROUP: {ESWords.TERMS: {ESWords.FIELD: group_field}}}]
+        }
+        groups = {ESWords.COMPOSITE: composite}
+        if metric is not None:
+            groups[ESWords.AGGS] = {ESWords.VALUE: metric}
+        body[ESWords.AGGS] = {ESWords.GROUPS: groups}
+
+        result = dict()
+        while True:
+            response = await self._call("search", index=self._index, doc_type=self._mapping_type,
+                                        body=body)
+            aggregation = response[ESWords.AGGREGATIONS][ESWords.GROUPS]
+            for bucket in aggregation[ESWords.BUCKETS]:
+                group = self._bucket_key(group_field, bucket[ESWords.KEY][ESWords.GROUP])
+                if metric is None:
+                    result[group] = bucket[ESWords.DOC_COUNT]
+                else:
+                    result[group] = self._metric_value(function, value_field,
+                                                       bucket[ESWords.VALUE])
+
+            after_key = aggregation.get(ESWords.AFTER_KEY)
+            if len(aggregation[ESWords.BUCKETS]) < self._aggregation_page_size or \
+                    after_key is None:
+                return result
+            composite[ESWords.AFTER] = after_key
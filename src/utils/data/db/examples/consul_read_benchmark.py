@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+"""
+Benchmark of the Consul read path decoding on the collection of raw consul entries.
+
+It compares the previous pipeline, which decoded and hydrated every entry for filtering and
+then decoded and hydrated the suitable entries once again, with the current one, which decodes
+every entry once and creates model objects only for the returned entries.
+
+Usage:
+python3 consul_read_benchmark.py [number of entries]
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+
+from schematics.types import IntType, StringType, BooleanType, DateTimeType
+
+from cortx.utils.data.access import BaseModel, compile_filter
+from cortx.utils.data.access.filters import Compare, And
+from cortx.utils.data.db.consul_db.storage import ConsulWords, query_converter_build
+
+
+class AlertModel(BaseModel):
+
+    """
+    Alert model example
+    """
+
+    _id = "alert_uuid"
+    alert_uuid = StringType()
+    status = StringType()
+    enclosure_id = IntType()
+    module_name = StringType()
+    description = StringType()
+    health = StringType()
+    location = StringType()
+    resolved = BooleanType()
+    severity = StringType()
+    created_time = DateTimeType()
+
+
+def generate_raw_entries(count: int) -> list:
+    raw_data = list()
+    for i in range(count):
+        value = {
+            "alert_uuid": f"alert-{i}",
+            "status": "Failed" if i % 10 == 0 else "Success",
+            "enclosure_id": i % 4,
+            "module_name": "SSPL",
+            "description": "Some Description",
+            "health": "Good",
+            "location": "USA",
+            "resolved": bool(i % 2),
+            "severity": "1",
+            "created_time": datetime.now().isoformat()
+        }
+        raw_data.append({ConsulWords.KEY: f"cortx/base/alert/obj/alert-{i}",
+                         ConsulWords.VALUE: json.dumps(value).encode(),
+                         ConsulWords.MODIFY_INDEX: i})
+    return raw_data
+
+
+def previous_get(filter_obj, raw_data: list) -> list:
+    predicate = compile_filter(AlertModel, filter_obj)
+    keys = set(entry[ConsulWords.KEY] for entry in raw_data
+               if predicate(AlertModel(json.loads(entry[ConsulWords.VALUE]))))
+    return [AlertModel(json.loads(entry[ConsulWords.VALUE])) for entry in raw_data
+            if entry[ConsulWords.KEY] in keys]
+
+
+def previous_count(filter_obj, raw_data: list) -> int:
+    return len(previous_get(filter_obj, raw_data))
+
+
+def current_get(filter_obj, raw_data: list) -> list:
+    return [entry.to_model() for entry in
+            query_converter_build(AlertModel, filter_obj, raw_data)]
+
+
+def current_count(filter_obj, raw_data: list) -> int:
+    return len(query_converter_build(AlertModel, filter_obj, raw_data))
+
+
+def measure(name: str, func, count: int) -> float:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    size = result if isinstance(result, int) else len(result)
+    print(f"{name:<40} {elapsed:8.3f} s {elapsed / count * 1e6:8.2f} us/object "
+          f"({size} results)")
+    return elapsed
+
+
+def benchmark(count: int) -> None:
+    raw_data = generate_raw_entries(count)
+    filter_obj = And(Compare(AlertModel.status, "=", "Failed"),
+                     Compare(AlertModel.enclosure_id, "=", 0))
+    print(f"Collection of {count} entries, filter selects {count // 20} entries")
+
+    for name, previous, current in (
+            ("get with filter", lambda: previous_get(filter_obj, raw_data),
+             lambda: current_get(filter_obj, raw_data)),
+            ("count with filter", lambda: previous_count(filter_obj, raw_data),
+             lambda: current_count(filter_obj, raw_data))):
+        before = measure(f"{name} (previous pipeline)", previous, count)
+        after = measure(f"{name} (current pipeline)", current, count)
+        print(f"{name}: {before / after:.1f}x\n")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
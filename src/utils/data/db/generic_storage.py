@@ -15,17 +15,20 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
-from typing import Any, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Union
 
-from schematics.exceptions import ValidationError, ConversionError
+from schematics.exceptions import ValidationError, ConversionError, DataError
 
-from cortx.utils.errors import DataAccessInternalError
-from cortx.utils.data.access import BaseModel
+from cortx.utils.errors import DataAccessInternalError, DataAccessError
+from cortx.utils.data.access import BaseModel, BulkWriteResult
 from cortx.utils.data.access import IDataBase, Query, IFilterTreeVisitor
 from cortx.utils.data.access import ExtQuery
 from cortx.utils.data.access import IFilter
+from cortx.utils.data.access.storage import ITERATION_BATCH_SIZE
+from cortx.utils.data.db.aggregation import (AggregationFunction, StreamAggregator,
+                                             get_aggregation_fields)
 from cortx.utils.data.access.filters import (FilterOperationCompare, FilterOperationOr,
-                                           FilterOperationAnd, Compare)
+                                           FilterOperationAnd, Compare, In)
 
 
 class GenericDataBase(IDataBase):
@@ -46,6 +49,8 @@ class GenericDataBase(IDataBase):
             raise DataAccessInternalError(f"{e}")
         except ConversionError as e:
             raise DataAccessInternalError(f"{e}")
+        except DataError as e:
+            raise DataAccessInternalError(f"{e}")
 
         if self._model_scheme.keys() - obj.fields.keys():
             missing_keys = self._model_scheme.keys() - obj.fields.keys()
@@ -56,6 +61,66 @@ class GenericDataBase(IDataBase):
             raise DataAccessInternalError(f"Object to store has new model properties:"
                                           f"{','.join([k for k in extra_keys])}")
 
+    async def store_many(self, objs: Iterable[BaseModel]) -> BulkWriteResult:
+        """
+        Store objects into Storage. Generic implementation stores objects one by one
+
+        :param objs: model objects for storing into DB
+        :return: result with ids of stored objects and errors of objects which were not stored
+        """
+        result = BulkWriteResult()
+        for obj in objs:
+            try:
+                await self.store(obj)
+            except DataAccessError as e:
+                result.add_error(obj.primary_key_val, f"{e}")
+            else:
+                result.add_success(obj.primary_key_val)
+        return result
+
+    async def update_many(self, to_update: Dict[Any, dict]) -> BulkWriteResult:
+        """
+        Update objects in Storage by their ids. Generic implementation updates objects one by one
+
+        :param dict to_update: object id -> dictionary with fields and values which should be
+                               updated
+        :return: result with ids of updated and not found objects and errors of objects which
+                 were not updated
+        """
+        result = BulkWriteResult()
+        for obj_id, changes in to_update.items():
+            try:
+                updated = await self.update_by_id(obj_id, dict(changes))
+            except DataAccessError as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            if updated:
+                result.add_success(obj_id)
+            else:
+                result.add_missing(obj_id)
+        return result
+
+    async def delete_many(self, obj_ids: Iterable[Any]) -> BulkWriteResult:
+        """
+        Delete objects by their ids. Generic implementation deletes objects one by one
+
+        :param obj_ids: ids of the objects to be deleted
+        :return: result with ids of deleted and not found objects and errors of objects which
+                 were not deleted
+        """
+        result = BulkWriteResult()
+        for obj_id in obj_ids:
+            try:
+                deleted = await self.delete_by_id(obj_id)
+            except DataAccessError as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            if deleted:
+                result.add_success(obj_id)
+            else:
+                result.add_missing(obj_id)
+        return result
+
     async def get(self, query: Query):
         """
         Get object from Storage by Query
@@ -66,6 +131,43 @@ class GenericDataBase(IDataBase):
         # Put Generic code here. We can't find it
         pass
 
+    async def iterate(self, query: Query,
+                      batch_size: int = ITERATION_BATCH_SIZE) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over objects which satisfy the query. Generic implementation fetches objects by
+        pages of `batch_size` objects. Keyset pagination is used if the query has cursor,
+        otherwise pages are requested by offset and limit, so objects order is stable only if
+        the query has order_by parameter.
+
+        :param Query query: query object which describes request to Storage
+        :param int batch_size: number of objects fetched from Storage by one request
+        :return: asynchronous iterator over objects
+        """
+        if batch_size <= 0:
+            raise DataAccessInternalError(f"Wrong iteration batch size: {batch_size}")
+
+        data = query.data
+        offset = data.offset or 0
+        cursor = data.cursor
+        remaining = data.limit
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            page = Query(data.sort_by, data.filter_by, size, fields=data.fields)
+            if cursor is None:
+                page.offset(offset)
+            else:
+                page.after(cursor)
+            batch = await self.get(page)
+            for obj in batch:
+                yield obj
+            if len(batch) < size:
+                return
+            offset += size
+            if cursor is not None:
+                cursor = page.cursor_of(batch[-1])
+            if remaining is not None:
+                remaining -= size
+
     async def get_by_id(self, obj_id: Any) -> Union[BaseModel, None]:
         """
         Simple implementation of get function.
@@ -97,6 +199,34 @@ class GenericDataBase(IDataBase):
 
         return None
 
+    def _convert_ids(self, obj_ids: Iterable[Any]) -> list:
+        """
+        Convert primary key values into native form, duplicates are removed
+
+        :param obj_ids: primary key values
+        :return: list of unique native primary key values
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        try:
+            converted = [id_field.to_native(obj_id) for obj_id in obj_ids]
+        except ConversionError as e:
+            raise DataAccessInternalError(f"{e}")
+        return list(dict.fromkeys(converted))
+
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values using single query
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        converted = self._convert_ids(obj_ids)
+        if not converted:
+            return dict()
+
+        query = Query(filter_by=In(self._model.primary_key, converted), limit=len(converted))
+        return {obj.primary_key_val: obj for obj in await self.get(query)}
+
     async def delete(self, filter_obj: IFilter) -> int:
         """
         Delete objects in DB by Query
@@ -168,23 +298,49 @@ class GenericDataBase(IDataBase):
 
         return result > 0
 
+    async def _aggregate(self, function: str, ext_query: ExtQuery) -> Any:
+        """
+        Perform aggregation. Generic implementation iterates over objects which satisfy the query
+        filter and aggregates them in a single pass, drivers override it to aggregate objects on
+        the database side.
+
+        :param str function: aggregation function name, see `AggregationFunction`
+        :param ExtQuery ext_query: extended query which describes the aggregation
+        :return: aggregated value or dict group value -> aggregated value if group_by is set
+        """
+        value_field, group_field = get_aggregation_fields(self._model, function, ext_query)
+        aggregator = StreamAggregator(function)
+        fields = [field for field in (value_field, group_field) if field is not None]
+        async for obj in self.iterate(Query(filter_by=ext_query.data.filter_by, fields=fields)):
+            value = getattr(obj, value_field) if value_field is not None else None
+            if group_field is None:
+                aggregator.add(value)
+                continue
+            group = getattr(obj, group_field)
+            if group is not None:
+                aggregator.add(value, group)
+
+        if group_field is None:
+            return aggregator.get_result()
+        return aggregator.get_grouped_result()
+
     async def sum(self, ext_query: ExtQuery):
         """
         Sum Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes how to perform sum aggregation
-        :return:
+        :return: sum of the aggregate field values or dict group value -> sum
         """
-        pass
+        return await self._aggregate(AggregationFunction.SUM, ext_query)
 
     async def avg(self, ext_query: ExtQuery):
         """Average Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes how to perform average
                                    aggregation
-        :return:
+        :return: average of the aggregate field values or dict group value -> average
         """
-        pass
+        return await self._aggregate(AggregationFunction.AVG, ext_query)
 
     async def count(self, filter_obj: IFilter = None) -> int:
         """
@@ -200,27 +356,29 @@ class GenericDataBase(IDataBase):
         Count Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes to perform count aggregation
-        :return:
+        :return: number of objects or dict group value -> number of objects
         """
-        pass
+        if ext_query.data.group_by is None:
+            return await self.count(ext_query.data.filter_by)
+        return await self._aggregate(AggregationFunction.COUNT, ext_query)
 
     async def max(self, ext_query: ExtQuery):
         """
         Max Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes how to perform Max aggregation
-        :return:
+        :return: max of the aggregate field values or dict group value -> max
         """
-        pass
+        return await self._aggregate(AggregationFunction.MAX, ext_query)
 
     async def min(self, ext_query: ExtQuery):
         """
         Min Aggregation function
 
         :param ExtQuery ext_query: Extended query which describes how to perform Min aggregation
-        :return:
+        :return: min of the aggregate field values or dict group value -> min
         """
-        pass
+        return await self._aggregate(AggregationFunction.MIN, ext_query)
 
 
 class GenericQueryConverter(IFilterTreeVisitor):
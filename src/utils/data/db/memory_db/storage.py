@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Type
+
+from schematics.exceptions import ConversionError
+from schematics.types import StringType
+from schematics.types.compound import CompoundType
+
+from cortx.utils.data.access import BaseModel, ExtQuery, IDataBase, Query, SortOrder
+from cortx.utils.data.access import compile_filter
+from cortx.utils.data.access.filters import (ComparisonOperation, FilterOperationAnd,
+                                             FilterOperationCompare, FilterOperationOr, IFilter,
+                                             field_to_str)
+from cortx.utils.data.access.filter_optimizer import FilterOptimizer, is_contradiction
+from cortx.utils.data.access.storage import ITERATION_BATCH_SIZE
+from cortx.utils.data.db import GenericDataBase, GenericQueryConverter
+from cortx.utils.data.db.aggregation import StreamAggregator, get_aggregation_fields
+from cortx.utils.data.db.ordering import make_position_key, make_sort_key, select_ordered
+from cortx.utils.errors import DataAccessInternalError, MalformedQueryError
+
+
+__all__ = ["MemoryDB"]
+
+
+class MemoryHashIndex:
+    """Equality index of the model field: native field value -> primary keys of the objects"""
+
+    def __init__(self):
+        self._keys = dict()
+
+    def add(self, value: Any, obj_id: Any) -> None:
+        self._keys.setdefault(value, set()).add(obj_id)
+
+    def remove(self, value: Any, obj_id: Any) -> None:
+        obj_ids = self._keys.get(value)
+        if obj_ids is not None:
+            obj_ids.discard(obj_id)
+            if not obj_ids:
+                del self._keys[value]
+
+    def lookup(self, value: Any) -> Set[Any]:
+        return set(self._keys.get(value, ()))
+
+
+class MemorySortedIndex:
+    """
+    Sorted index of the model field for range comparisons and ordering. Values are kept in
+    the sort order of `make_sort_key`: strings are lowered, so string lookups return
+    candidates which are checked by the filter afterwards. Objects without value are kept
+    apart, they follow all other objects in any direction.
+    """
+
+    def __init__(self, is_string: bool):
+        """
+
+        :param bool is_string: `True` if the indexed field is a string field
+        """
+        self.is_string = is_string
+        self._values = list()  # sorted distinct normalized values
+        self._keys = dict()  # normalized value -> primary keys of the objects
+        self._missing = set()  # primary keys of the objects without value
+
+    def _normalize(self, value: Any) -> Any:
+        return value.lower() if self.is_string else value
+
+    def add(self, value: Any, obj_id: Any) -> None:
+        if value is None:
+            self._missing.add(obj_id)
+            return
+        value = self._normalize(value)
+        obj_ids = self._keys.get(value)
+        if obj_ids is None:
+            obj_ids = self._keys[value] = set()
+            insort(self._values, value)
+        obj_ids.add(obj_id)
+
+    def remove(self, value: Any, obj_id: Any) -> None:
+        if value is None:
+            self._missing.discard(obj_id)
+            return
+        value = self._normalize(value)
+        obj_ids = self._keys.get(value)
+        if obj_ids is not None:
+            obj_ids.discard(obj_id)
+            if not obj_ids:
+                del self._keys[value]
+                del self._values[bisect_left(self._values, value)]
+
+    def lookup(self, value: Any) -> Set[Any]:
+        if value is None:
+            return set(self._missing)
+        return set(self._keys.get(self._normalize(value), ()))
+
+    def lookup_range(self, lower: Any = None, lower_inclusive: bool = True, upper: Any = None,
+                     upper_inclusive: bool = True) -> Set[Any]:
+        """
+        Get objects which values are within the range, it is used for not string fields only
+
+        :param lower: lower bound or None if the range is not bounded below
+        :param bool lower_inclusive: `True` if lower bound belongs to the range
+        :param upper: upper bound or None if the range is not bounded above
+        :param bool upper_inclusive: `True` if upper bound belongs to the range
+        :return: set of primary keys
+        """
+        start, end = 0, len(self._values)
+        if lower is not None:
+            start = (bisect_left if lower_inclusive else bisect_right)(self._values, lower)
+        if upper is not None:
+            end = (bisect_right if upper_inclusive else bisect_left)(self._values, upper)
+        obj_ids = set()
+        for value in self._values[start:end]:
+            obj_ids.update(self._keys[value])
+        return obj_ids
+
+    def lookup_prefix(self, prefix: str) -> Set[Any]:
+        prefix = self._normalize(prefix)
+        obj_ids = set()
+        for position in range(bisect_left(self._values, prefix), len(self._values)):
+            if not self._values[position].startswith(prefix):
+                break
+            obj_ids.update(self._keys[self._values[position]])
+        return obj_ids
+
+    def iter_groups(self, descending: bool) -> Iterator[Set[Any]]:
+        """
+        Iterate over groups of objects with equal values in the index order
+
+        :param bool descending: `True` to iterate from the greatest value
+        :return: iterator over sets of primary keys
+        """
+        for value in list(reversed(self._values) if descending else self._values):
+            obj_ids = self._keys.get(value)
+            if obj_ids:
+                yield obj_ids
+        if self._missing:
+            yield self._missing
+
+
+class MemoryIndexPlanner(GenericQueryConverter):
+    """
+    Implementation of filter tree visitor which finds candidate objects for the filter by
+    index lookups. Candidates are a superset of objects satisfying the filter, `None` means
+    that indexes can't narrow the set and all objects are candidates.
+
+    Usage:
+    planner = MemoryIndexPlanner(memory_db)
+    candidates = planner.build(filter_root)
+    """
+
+    def __init__(self, memory_db: "MemoryDB"):
+        self._memory_db = memory_db
+
+    def build(self, root: IFilter) -> Optional[Set[Any]]:
+        return root.accept_visitor(self)
+
+    def handle_and(self, entry: FilterOperationAnd):
+        candidates = None
+        for operand in entry.get_operands():
+            obj_ids = operand.accept_visitor(self)
+            if obj_ids is not None:
+                candidates = obj_ids if candidates is None else candidates & obj_ids
+        return candidates
+
+    def handle_or(self, entry: FilterOperationOr):
+        candidates = set()
+        for operand in entry.get_operands():
+            obj_ids = operand.accept_visitor(self)
+            if obj_ids is None:
+                return None
+            candidates |= obj_ids
+        return candidates
+
+    def handle_compare(self, entry: FilterOperationCompare):
+        super().handle_compare(entry)  # Call the generic code
+
+        return self._memory_db.lookup(field_to_str(entry.get_left_operand()),
+                                      entry.get_operation(), entry.get_right_operand())
+
+
+class MemoryDB(GenericDataBase):
+    """
+    In-memory Storage Interface Implementation. Objects are kept in the dict by primary key
+    values, filters are evaluated by index lookups before the check of candidate objects.
+    Stored and returned objects are copies, so callers can't change the storage content.
+    """
+
+    _RANGE_OPERATIONS = {
+        ComparisonOperation.OPERATION_GT: (False, None),
+        ComparisonOperation.OPERATION_GEQ: (True, None),
+        ComparisonOperation.OPERATION_LT: (None, False),
+        ComparisonOperation.OPERATION_LEQ: (None, True),
+    }
+
+    def __init__(self, model: Type[BaseModel], collection: str,
+                 hash_indexes: Optional[List[str]] = None,
+                 sorted_indexes: Optional[List[str]] = None):
+        """
+
+        :param Type[BaseModel] model: model (class object) of the stored objects
+        :param str collection: collection name for `model`
+        :param list hash_indexes: model fields with equality indexes
+        :param list sorted_indexes: model fields with sorted indexes for range comparisons and
+                                    ordering
+        """
+        if not isinstance(model, type) or not issubclass(model, BaseModel):
+            raise DataAccessInternalError("Model parameter is not a Class object or not inherited "
+                                          "from cortx.utils.data.access.BaseModel")
+        self._model = model
+        self._collection = collection
+        self._model_scheme = dict.fromkeys(model.fields.keys())
+        self._objects = dict()
+        self._positions = dict()  # primary key -> position of the object in insertion order
+        self._next_position = count()
+
+        self._hash_indexes = {field: MemoryHashIndex() for field in hash_indexes or ()}
+        self._sorted_indexes = {
+            field: MemorySortedIndex(isinstance(model.fields.get(field), StringType))
+            for field in sorted_indexes or ()}
+        for field in list(self._hash_indexes) + list(self._sorted_indexes):
+            if field not in model.fields:
+                raise DataAccessInternalError(
+                    f"Model {model.__name__} doesn't have indexed field '{field}'")
+            if isinstance(model.fields[field], CompoundType):
+                raise DataAccessInternalError(f"Compound field '{field}' can't be indexed")
+
+        key_fields = [model.primary_key] + list(self._hash_indexes) + list(self._sorted_indexes)
+        self._filter_optimizer = FilterOptimizer(model, list(dict.fromkeys(key_fields)))
+        self._planner = MemoryIndexPlanner(self)
+
+    @classmethod
+    async def create_database(cls, config, collection: str, model: Type[BaseModel],
+                              model_settings=None) -> IDataBase:
+        """
+        Creates new instance of in-memory DB
+
+        :param DBSettings config: database configuration, it is not used by in-memory DB
+        :param str collection: collection name
+        :param Type[BaseModel] model: model which instances will be stored in DB
+        :param ModelSettings model_settings: model specific settings like indexed fields
+        :return:
+        """
+        if model_settings is None:
+            return cls(model, collection)
+        return cls(model, collection, model_settings.indexes, model_settings.sorted_indexes)
+
+    def _copy(self, obj: BaseModel, fields: Optional[List[str]] = None) -> BaseModel:
+        """
+        Create copy of the object
+
+        :param BaseModel obj: model object
+        :param list fields: names of the fields to be copied, all fields are copied if not set
+        :return: new model object
+        """
+        native = obj.to_native()
+        if fields is not None:
+            native = {field: native.get(field) for field in fields}
+        return self._model(native)
+
+    def _put(self, obj: BaseModel) -> None:
+        obj_id = obj.primary_key_val
+        self._remove(obj_id)
+        self._objects[obj_id] = obj
+        self._positions[obj_id] = next(self._next_position)
+        for field, index in self._indexes():
+            index.add(getattr(obj, field), obj_id)
+
+    def _remove(self, obj_id: Any) -> bool:
+        obj = self._objects.pop(obj_id, None)
+        if obj is None:
+            return False
+        del self._positions[obj_id]
+        for field, index in self._indexes():
+            index.remove(getattr(obj, field), obj_id)
+        return True
+
+    def _indexes(self) -> Iterator:
+        yield from self._hash_indexes.items()
+        yield from self._sorted_indexes.items()
+
+    def lookup(self, field_str: str, op: ComparisonOperation, value: Any) -> Optional[Set[Any]]:
+        """
+        Find candidate objects for the comparison by primary key or by field indexes
+
+        :param str field_str: field name
+        :param ComparisonOperation op: comparison operation
+        :param value: right operand of the comparison
+        :return: set of primary keys of candidates or None if indexes can't be used
+        """
+        field = self._model.fields.get(field_str)
+        if field is None:
+            return None  # NOTE: unknown field is reported by the filter compilation
+        try:
+            if op == ComparisonOperation.OPERATION_IN:
+                if not isinstance(value, (list, tuple)):
+                    return None
+                values = [field.to_native(item) for item in value if item is not None]
+            elif value is not None:
+                value = field.to_native(value)
+        except ConversionError:
+            return None
+
+        if field_str == self._model.primary_key:
+            if op == ComparisonOperation.OPERATION_EQ:
+                return {value} if value in self._objects else set()
+            if op == ComparisonOperation.OPERATION_IN:
+                return {item for item in values if item in self._objects}
+
+        index = self._hash_indexes.get(field_str) or self._sorted_indexes.get(field_str)
+        if index is None:
+            return None
+        if op == ComparisonOperation.OPERATION_EQ:
+            return index.lookup(value)
+        if op == ComparisonOperation.OPERATION_IN:
+            return set().union(*(index.lookup(item) for item in values))
+
+        index = self._sorted_indexes.get(field_str)
+        if index is None or value is None:
+            return None
+        if op == ComparisonOperation.OPERATION_STARTS_WITH and index.is_string:
+            return index.lookup_prefix(value)
+        if op in self._RANGE_OPERATIONS and not index.is_string:
+            # NOTE: strings are indexed lowered, so their ranges are checked by the filter
+            lower_inclusive, upper_inclusive = self._RANGE_OPERATIONS[op]
+            if lower_inclusive is not None:
+                return index.lookup_range(lower=value, lower_inclusive=lower_inclusive)
+            return index.lookup_range(upper=value, upper_inclusive=upper_inclusive)
+        return None
+
+    def _get_candidates(self, filter_obj: Optional[IFilter]) -> Optional[Set[Any]]:
+        if filter_obj is None:
+            return None
+        return self._planner.build(filter_obj)
+
+    def _get_suitable(self, filter_obj: Optional[IFilter]) -> List[BaseModel]:
+        """
+        Get stored objects which satisfy the filter in insertion order. Objects are shared, so
+        they must not be changed.
+
+        :param IFilter filter_obj: optimized filter object or None
+        :return: list of model objects
+        """
+        candidates = self._get_candidates(filter_obj)
+        if candidates is None:
+            objects = self._objects.values()
+        else:
+            # NOTE: candidates are sets, keep the order of the full scan, so unordered pages
+            #  are consistent
+            objects = (self._objects[obj_id]
+                       for obj_id in sorted(candidates, key=self._positions.__getitem__))
+        if filter_obj is None:
+            return list(objects)
+        predicate = compile_filter(self._model, filter_obj)
+        return [obj for obj in objects if predicate(obj)]
+
+    def _select_by_index(self, index: MemorySortedIndex, descending: bool,
+                         filter_obj: Optional[IFilter], candidates: Optional[Set[Any]],
+                         count: int) -> List[BaseModel]:
+        """
+        Select suitable objects in the order of the sorted index of the first sort key until
+        `count` objects are found. Objects with equal first sort key are taken completely, so
+        selected objects contain `count` first objects of the whole ordered result.
+
+        :param MemorySortedIndex index: sorted index of the first sort key
+        :param bool descending: `True` if the first sort key is in descending order
+        :param IFilter filter_obj: optimized filter object or None
+        :param set candidates: primary keys of candidates found by index lookups or None
+        :param int count: number of needed objects
+        :return: list of model objects in unspecified order
+        """
+        predicate = compile_filter(self._model, filter_obj) if filter_obj is not None else None
+        selected = list()
+        for obj_ids in index.iter_groups(descending):
+            for obj_id in obj_ids:
+                if candidates is not None and obj_id not in candidates:
+                    continue
+                obj = self._objects[obj_id]
+                if predicate is None or predicate(obj):
+                    selected.append(obj)
+            if len(selected) >= count:
+                break
+        return selected
+
+    def _select(self, query: Query.Data) -> List[BaseModel]:
+        """
+        Get stored objects which satisfy the query, ordered and sliced by the query parameters
+
+        :param Query.Data query: query parameters
+        :return: list of shared model objects
+        """
+        filter_obj = self._filter_optimizer.optimize(query.filter_by)
+        if is_contradiction(filter_obj):
+            return list()
+
+        if query.cursor is not None:
+            return self._select_keyset_page(query, self._get_suitable(filter_obj))
+
+        offset = query.offset or 0
+        if offset < 0 or (query.limit is not None and query.limit < 0):
+            raise DataAccessInternalError(
+                "Wrong offset and limit parameters of Query object: "
+                f"offset={query.offset}, limit={query.limit}")
+
+        # NOTE: if offset parameter is set in Query then ordering by primary key is enabled
+        #  automatically
+        sort_keys = query.get_sort_keys()
+        if not sort_keys and query.offset:
+            sort_keys = [(self._model.primary_key, SortOrder.ASC)]
+        if not sort_keys:
+            objects = self._get_suitable(filter_obj)
+            return objects[:query.limit] if query.limit is not None else objects
+
+        sort_key = make_sort_key(self._model, sort_keys)
+        index = self._sorted_indexes.get(sort_keys[0][0])
+        if index is not None and query.limit is not None:
+            candidates = self._get_candidates(filter_obj)
+            if candidates is None or len(candidates) > offset + query.limit:
+                objects = self._select_by_index(index, sort_keys[0][1] == SortOrder.DESC,
+                                                filter_obj, candidates, offset + query.limit)
+                return select_ordered(objects, sort_key, offset, query.limit)
+
+        return select_ordered(self._get_suitable(filter_obj), sort_key, offset, query.limit)
+
+    def _select_keyset_page(self, query: Query.Data,
+                            objects: List[BaseModel]) -> List[BaseModel]:
+        """
+        Select objects of the keyset pagination page: objects which follow the cursor position
+        in order of the query keyset
+
+        :param Query.Data query: query parameters with cursor
+        :param list objects: objects which satisfy the query filter
+        :return: list of objects of the page
+        """
+        keyset = query.get_keyset(self._model.primary_key)
+        cursor_values = query.get_cursor_values(self._model.primary_key)
+        if query.limit is not None and query.limit < 0:
+            raise DataAccessInternalError(
+                f"Wrong limit parameter of Query object: limit={query.limit}")
+
+        sort_key = make_sort_key(self._model, keyset)
+        if cursor_values is not None:
+            try:
+                position = make_position_key(self._model, keyset, cursor_values)
+            except ConversionError as e:
+                raise MalformedQueryError(f"Invalid query cursor: {e}")
+            objects = [obj for obj in objects if position < sort_key(obj)]
+
+        return select_ordered(objects, sort_key, limit=query.limit)
+
+    async def store(self, obj: BaseModel):
+        """
+        Store object into Storage, object with the same primary key value is replaced
+
+        :param Model obj: Arbitrary base object for storing into DB
+
+        """
+        await super().store(obj)  # Call generic code
+
+        self._put(self._copy(obj))
+
+    async def get(self, query: Query) -> List[BaseModel]:
+        """
+        Get object from Storage by Query
+
+        :param query:
+        :return: empty list or list with objects which satisfy the passed query condition
+        """
+        projection = query.data.get_projection(self._model)
+        return [self._copy(obj, projection) for obj in self._select(query.data)]
+
+    async def iterate(self, query: Query,
+                      batch_size: int = ITERATION_BATCH_SIZE) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over objects which satisfy the query. Objects are selected at once, so
+        iteration sees the storage content at the moment of the call.
+
+        :param Query query: query object which describes request to Storage
+        :param int batch_size: it is not used by in-memory storage
+        :return: asynchronous iterator over objects
+        """
+        if batch_size <= 0:
+            raise DataAccessInternalError(f"Wrong iteration batch size: {batch_size}")
+
+        for obj in await self.get(query):
+            yield obj
+
+    async def get_by_id(self, obj_id: Any) -> Optional[BaseModel]:
+        """
+        Get object by its primary key value
+
+        :param Any obj_id: primary key value
+        :return: BaseModel if object was found by its id and None otherwise
+        """
+        obj = self._objects.get(self._convert_ids([obj_id])[0])
+        return self._copy(obj) if obj is not None else None
+
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        found = dict()
+        for obj_id in self._convert_ids(obj_ids):
+            obj = self._objects.get(obj_id)
+            if obj is not None:
+                found[obj_id] = self._copy(obj)
+        return found
+
+    async def update(self, filter_obj: IFilter, to_update: dict) -> int:
+        """
+        Update object in Storage by filter
+
+        :param IFilter filter_obj: filter which specifies what objects need to update
+        :param dict to_update: dictionary with fields and values which should be updated
+        :return: number of entries updated
+        """
+        await super().update(filter_obj, to_update)  # Call generic code
+
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
+        suitable = self._get_suitable(filter_obj)
+        for obj in suitable:
+            self._remove(obj.primary_key_val)
+            for field, value in to_update.items():
+                setattr(obj, field, value)
+            self._put(obj)
+        return len(suitable)
+
+    async def delete(self, filter_obj: IFilter) -> int:
+        """
+        Delete objects in DB by Query
+
+        :param IFilter filter_obj: filter object to perform delete operation
+        :return: number of deleted entries
+        """
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
+        suitable = self._get_suitable(filter_obj)
+        for obj in suitable:
+            self._remove(obj.primary_key_val)
+        return len(suitable)
+
+    async def count(self, filter_obj: IFilter = None) -> int:
+        """
+        Returns count of entities for given filter_obj
+
+        :param filter_obj: filter object to perform count operation
+        :return: count of entries
+        """
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if filter_obj is None:
+            return len(self._objects)
+        if is_contradiction(filter_obj):
+            return 0
+        return len(self._get_suitable(filter_obj))
+
+    async def _aggregate(self, function: str, ext_query: ExtQuery) -> Any:
+        """
+        Perform aggregation in a single pass over the suitable objects without copying them
+
+        :param str function: aggregation function name, see `AggregationFunction`
+        :param ExtQuery ext_query: extended query which describes the aggregation
+        :return: aggregated value or dict group value -> aggregated value if group_by is set
+        """
+        value_field, group_field = get_aggregation_fields(self._model, function, ext_query)
+        aggregator = StreamAggregator(function)
+        filter_obj = self._filter_optimizer.optimize(ext_query.data.filter_by)
+        if not is_contradiction(filter_obj):
+            for obj in self._get_suitable(filter_obj):
+                value = getattr(obj, value_field) if value_field is not None else None
+                if group_field is None:
+                    aggregator.add(value)
+                    continue
+                group = getattr(obj, group_field)
+                if group is not None:
+                    aggregator.add(value, group)
+
+        if group_field is None:
+            return aggregator.get_result()
+        return aggregator.get_grouped_result()
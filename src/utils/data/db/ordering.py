@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import heapq
+from functools import total_ordering
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Type
+
+from schematics.types import StringType
+
+from cortx.utils.data.access import BaseModel, SortOrder
+
+
+@total_ordering
+class SortKey:
+    """
+    Sort key of the object for ordering by several fields with own directions. Strings are
+    compared case insensitively, missing (None) values follow all other values in any direction.
+    """
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: Sequence[Any], descending: Sequence[bool]):
+        """
+
+        :param values: values of the sort fields
+        :param descending: flags of descending order of the sort fields
+        """
+        self.values = values
+        self.descending = descending
+
+    def __eq__(self, other: "SortKey") -> bool:
+        return self.values == other.values
+
+    def __lt__(self, other: "SortKey") -> bool:
+        for value, other_value, descending in zip(self.values, other.values, self.descending):
+            if value == other_value:
+                continue
+            if value is None:
+                return False
+            if other_value is None:
+                return True
+            return value > other_value if descending else value < other_value
+        return False
+
+
+def make_sort_key(model: Type[BaseModel], keys: List[Tuple[str, SortOrder]],
+                  value_getter: Callable[[Any, str], Any] = getattr) -> Callable[[Any], SortKey]:
+    """
+    Make key function for ordering of objects by the fields
+
+    :param Type[BaseModel] model: model of the ordered objects
+    :param list keys: field names with sort orders, the first field is the most significant
+    :param value_getter: function which returns native field value of the object by name
+    :return: function which takes object and returns its sort key
+    """
+    fields = [field for field, _order in keys]
+    descending = tuple(order == SortOrder.DESC for _field, order in keys)
+    strings = [isinstance(model.fields[field], StringType) for field in fields]
+
+    def _normalize(_value: Any, _is_string: bool) -> Any:
+        return _value.lower() if _is_string and _value is not None else _value
+
+    def _key(_obj: Any) -> SortKey:
+        return SortKey(tuple(_normalize(value_getter(_obj, field), is_string)
+                             for field, is_string in zip(fields, strings)), descending)
+
+    return _key
+
+
+def make_position_key(model: Type[BaseModel], keys: List[Tuple[str, SortOrder]],
+                      values: Sequence[Any]) -> SortKey:
+    """
+    Make sort key of the position given by field values, e.g. decoded cursor values
+
+    :param Type[BaseModel] model: model of the ordered objects
+    :param list keys: field names with sort orders
+    :param values: primitive field values
+    :return: sort key
+    """
+    native = dict()
+    for (field, _order), value in zip(keys, values):
+        native[field] = model.fields[field].to_native(value) if value is not None else None
+    return make_sort_key(model, keys, lambda _values, field: _values[field])(native)
+
+
+def select_ordered(objects: Iterable[Any], sort_key: Callable[[Any], SortKey],
+                   offset: int = 0, limit: Optional[int] = None) -> List[Any]:
+    """
+    Select slice of ordered objects. Only `offset + limit` first objects are kept during
+    selection if limit is set, so the whole collection is not sorted for small pages.
+
+    :param objects: objects to be ordered
+    :param sort_key: key function made by `make_sort_key`
+    :param int offset: number of skipped first objects
+    :param int limit: max number of returned objects
+    :return: list of ordered objects
+    """
+    if limit is None:
+        return sorted(objects, key=sort_key)[offset:]
+    return heapq.nsmallest(offset + limit, objects, key=sort_key)[offset:]
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Tuple, Type
+
+from schematics.exceptions import ConversionError
+
+from cortx.utils.data.access import BaseModel, ExtQuery, IFilter, Query
+
+
+_MISSING = object()
+
+# Cache key kinds
+_BY_ID = "get_by_id"
+_MANY_BY_ID = "get_many_by_id"
+_GET = "get"
+_COUNT = "count"
+_AGGREGATIONS = frozenset(("count_by_query", "sum", "avg", "min", "max"))
+
+# read calls which results can be identified by read_call_key
+KEYED_READ_CALLS = frozenset((_GET, _BY_ID, _MANY_BY_ID, _COUNT)) | _AGGREGATIONS
+WRITE_CALLS = frozenset(("store", "update", "update_by_id", "delete", "delete_by_id",
+                         "store_many", "update_many", "delete_many"))
+
+
+def read_call_key(call_name: str, *args, **kwargs) -> Optional[Tuple]:
+    """
+    Get key of the read storage call. Calls with equal keys return the same result if there were
+    no writes between them.
+
+    :param str call_name: name of the storage API call
+    :return: call key or `None` if the call is not a read call or its arguments are not supported
+    """
+    try:
+        if call_name == _BY_ID:
+            obj_id = args[0] if args else kwargs["obj_id"]
+            hash(obj_id)
+            return _BY_ID, obj_id
+        if call_name == _MANY_BY_ID:
+            obj_ids = args[0] if args else kwargs["obj_ids"]
+            # NOTE: iterators can't be read twice, so only calls with collections are keyed
+            if not isinstance(obj_ids, (list, tuple, set, frozenset)):
+                return None
+            return _MANY_BY_ID, frozenset(obj_ids)
+        if call_name == _GET:
+            query = args[0] if args else kwargs["query"]
+            return (_GET, query.fingerprint()) if isinstance(query, Query) else None
+        if call_name == _COUNT:
+            filter_obj = args[0] if args else kwargs.get("filter_obj")
+            if filter_obj is None:
+                return _COUNT, None
+            return (_COUNT, filter_obj.fingerprint()) if isinstance(filter_obj, IFilter) else None
+        if call_name in _AGGREGATIONS:
+            ext_query = args[0] if args else kwargs["ext_query"]
+            return (call_name, ext_query.fingerprint()) if isinstance(ext_query, ExtQuery) \
+                else None
+    except (IndexError, KeyError, TypeError, ValueError):
+        # NOTE: calls with unexpected arguments or with constants which can't be serialized
+        #  are passed to the storage as is
+        return None
+    return None
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return type(value)(value.to_native())
+    return value
+
+
+def copy_result(result: Any) -> Any:
+    """
+    Make copy of the shared read call result, so callers can't change it for each other
+
+    :param result: result of the storage call
+    :return: copy of model objects and of list and dict results with copies of their model
+             objects, other results as is
+    """
+    if isinstance(result, list):
+        return [_copy_value(value) for value in result]
+    if isinstance(result, dict):
+        return {key: _copy_value(value) for key, value in result.items()}
+    return _copy_value(result)
+
+
+class TTLCache:
+    """Thread-safe LRU cache with optional expiration of entries"""
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+
+        :param int max_size: max number of entries, least recently used entries are evicted first
+        :param float ttl: entry time to live in seconds, entries never expire if not set
+        :param clock: monotonic time source
+        """
+        self._max_size = max_size
+        self._ttl = ttl or None
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = self._clock() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_if(self, condition: Callable[[Hashable], bool]) -> None:
+        """
+        Remove all entries which keys satisfy the condition
+
+        :param condition: function which takes entry key
+        :return:
+        """
+        with self._lock:
+            for key in [key for key in self._entries if condition(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class StorageReadCache:
+    """
+    Read cache of storage calls for a single model.
+
+    Results of `get`, `get_by_id`, `get_many_by_id` and `count` are memoized by query (filter)
+    fingerprint and object ids. Writes issued through the cache invalidate affected entries:
+    `*_by_id` writes and `store` drop cached results of that object and all query results,
+    `update` and `delete` by filter and bulk writes drop everything. Writes made by other
+    processes become visible after TTL only.
+
+    Object ids are converted to native primary key values, so reads and writes of the same
+    object by ids of different types affect the same entry. Every caller gets own copies of
+    the cached model objects.
+    """
+
+    READ_CALLS = frozenset((_GET, _BY_ID, _MANY_BY_ID, _COUNT))
+    WRITE_CALLS = WRITE_CALLS
+
+    def __init__(self, model: Type[BaseModel], max_size: int, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+
+        :param Type[BaseModel] model: model of the cached objects
+        :param int max_size: max number of cached results
+        :param float ttl: max age of cached results in seconds, results never expire if it is
+                          not set
+        :param clock: function which returns current time in seconds
+        """
+        self._model = model
+        self._entries = TTLCache(max_size, ttl, clock)
+        # NOTE: generation is increased by every write, read results obtained while a write was
+        #  in progress are not stored because they may be stale
+        self._generation = 0
+
+    def is_cached_call(self, call_name: str) -> bool:
+        return call_name in self.READ_CALLS or call_name in self.WRITE_CALLS
+
+    async def call(self, call_name: str, storage_call: Callable, *args, **kwargs) -> Any:
+        """
+        Perform storage call through the cache
+
+        :param str call_name: name of the storage API call
+        :param storage_call: bound storage coroutine function
+        :return: result of the storage call
+        """
+        if call_name in self.WRITE_CALLS:
+            return await self._write(call_name, storage_call, *args, **kwargs)
+
+        key = read_call_key(call_name, *args, **kwargs) if call_name in self.READ_CALLS else None
+        if key is not None and key[0] == _BY_ID:
+            obj_id = self._to_native_id(key[1])
+            key = (_BY_ID, obj_id) if obj_id is not _MISSING else None
+        if key is None:
+            return await storage_call(*args, **kwargs)
+
+        result = self._entries.get(key, _MISSING)
+        if result is not _MISSING:
+            return copy_result(result)
+
+        generation = self._generation
+        result = await storage_call(*args, **kwargs)
+        if generation == self._generation:
+            self._entries.put(key, copy_result(result))
+        return result
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    async def _write(self, call_name: str, storage_call: Callable, *args, **kwargs) -> Any:
+        obj_id = self._get_written_id(call_name, *args, **kwargs)
+        self._invalidate_written(obj_id)
+        try:
+            return await storage_call(*args, **kwargs)
+        finally:
+            # NOTE: reads started during the write may have cached the previous state
+            self._invalidate_written(obj_id)
+
+    def _invalidate_written(self, obj_id: Any) -> None:
+        self._generation += 1
+        if obj_id is _MISSING:
+            self._entries.clear()
+        else:
+            by_id_key = (_BY_ID, obj_id)
+            self._entries.discard_if(lambda key: key[0] != _BY_ID or key == by_id_key)
+
+    def _to_native_id(self, obj_id: Any) -> Any:
+        """
+        Convert object id to native primary key value
+
+        :param obj_id: object id
+        :return: native primary key value or `_MISSING` if id can't be converted
+        """
+        try:
+            obj_id = self._model.fields[self._model.primary_key].to_native(obj_id)
+            hash(obj_id)
+        except (ConversionError, TypeError):
+            return _MISSING
+        return obj_id
+
+    def _get_written_id(self, call_name: str, *args, **kwargs) -> Any:
+        """
+        Get id of the single object changed by the write call
+
+        :return: native object id or `_MISSING` if a set of changed objects is not known
+        """
+        try:
+            if call_name == "store":
+                obj = args[0] if args else kwargs["obj"]
+                obj_id = obj.primary_key_val if isinstance(obj, BaseModel) else _MISSING
+            elif call_name in ("update_by_id", "delete_by_id"):
+                obj_id = args[0] if args else kwargs["obj_id"]
+            else:
+                return _MISSING
+        except (IndexError, KeyError):
+            return _MISSING
+        # NOTE: writes of objects which ids can't be converted invalidate everything
+        return self._to_native_id(obj_id) if obj_id is not _MISSING else _MISSING
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable
+
+from cortx.utils.data.db.query_cache import (read_call_key, copy_result, KEYED_READ_CALLS,
+                                             WRITE_CALLS)
+
+
+class SingleFlight:
+    """
+    Deduplication of concurrent identical read storage calls for a single model.
+
+    Read calls with the same key (see `read_call_key`) which are issued while an equal call is in
+    progress wait for that call and receive its result (or exception) instead of sending one more
+    request to the database. A write issued through the same instance detaches the calls in
+    progress, so reads started after the write never receive a result obtained before it.
+
+    Every waiting caller gets own copy of the shared result including its model objects.
+    """
+
+    def __init__(self):
+        self._flights = dict()
+        self._calls = 0
+        self._coalesced = 0
+
+    def is_coalesced_call(self, call_name: str) -> bool:
+        return call_name in KEYED_READ_CALLS or call_name in WRITE_CALLS
+
+    async def call(self, call_name: str, storage_call: Callable, *args, **kwargs) -> Any:
+        """
+        Perform storage call, join the equal call in progress if there is one
+
+        :param str call_name: name of the storage API call
+        :param storage_call: bound storage coroutine function
+        :return: result of the storage call
+        """
+        if call_name in WRITE_CALLS:
+            self._flights.clear()
+            try:
+                return await storage_call(*args, **kwargs)
+            finally:
+                # NOTE: reads started during the write may return the previous state
+                self._flights.clear()
+
+        key = read_call_key(call_name, *args, **kwargs)
+        if key is None:
+            return await storage_call(*args, **kwargs)
+
+        # NOTE: futures are bound to event loop, calls from different loops are never joined
+        key = (asyncio.get_event_loop(), key)
+        self._calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(storage_call(*args, **kwargs))
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _flight: self._land(key, _flight))
+        else:
+            self._coalesced += 1
+
+        # NOTE: cancellation of one caller must not cancel the request of others
+        result = await asyncio.shield(flight)
+        return copy_result(result)
+
+    def _land(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # Mark exception as retrieved: all waiting callers could have been cancelled
+            flight.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get coalescing metrics
+
+        :return: dict with number of read calls, number of calls which joined a call in progress
+                 and number of calls in progress
+        """
+        return {
+            "calls": self._calls,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._flights)
+        }
@@ -0,0 +1,812 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import json
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from schematics.exceptions import ConversionError
+from schematics.types import (BaseType, BooleanType, DateTimeType, DateType, DecimalType,
+                              FloatType, IntType, NumberType, StringType)
+from schematics.types.compound import CompoundType
+
+from cortx.utils.data.access import BaseModel, BulkWriteResult, ExtQuery, IDataBase, Query
+from cortx.utils.data.access import SortOrder
+from cortx.utils.data.access.filters import (ComparisonOperation, FilterOperationAnd,
+                                             FilterOperationCompare, FilterOperationOr, IFilter,
+                                             field_to_str)
+from cortx.utils.data.access.filter_optimizer import FilterOptimizer, is_contradiction
+from cortx.utils.data.db import GenericDataBase, GenericQueryConverter
+from cortx.utils.data.db.aggregation import (AggregationFunction, StreamAggregator,
+                                             get_aggregation_fields)
+from cortx.utils.errors import DataAccessExternalError, DataAccessInternalError
+
+
+__all__ = ["SQLiteDB"]
+
+
+# NOTE: decimal values are stored as text to keep their precision, so they are compared as
+#  strings in the same way as elasticsearch keyword fields are
+SQL_TYPE_MAP = {
+    StringType: "TEXT",
+    IntType: "INTEGER",
+    BooleanType: "INTEGER",
+    FloatType: "REAL",
+    DecimalType: "TEXT",
+    NumberType: "NUMERIC",
+    DateType: "TEXT",
+    DateTimeType: "TEXT",
+}
+
+# Column type of the fields which types are not listed in SQL_TYPE_MAP
+DEFAULT_SQL_TYPE = "TEXT"
+
+SQL_AGGREGATE_FUNCTIONS = {
+    AggregationFunction.COUNT: "COUNT(*)",
+    AggregationFunction.SUM: "COALESCE(SUM({column}), 0)",
+    AggregationFunction.AVG: "AVG({column})",
+    AggregationFunction.MIN: "MIN({column})",
+    AggregationFunction.MAX: "MAX({column})",
+}
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote SQL identifier (table, column or index name)
+
+    :param str name: identifier
+    :return: quoted identifier which can be safely used in SQL statement
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def get_column_type(field: BaseType) -> str:
+    """
+    Get SQLite column type of the model field
+
+    :param BaseType field: model field
+    :return: SQL column type
+    """
+    for field_type in type(field).__mro__:
+        if field_type in SQL_TYPE_MAP:
+            return SQL_TYPE_MAP[field_type]
+    return DEFAULT_SQL_TYPE
+
+
+def to_column_value(field: BaseType, value: Any) -> Any:
+    """
+    Convert native field value into the value stored in the table column. Dates are stored in
+    ISO format, so they are ordered chronologically, compound values are stored as JSON
+
+    :param BaseType field: model field
+    :param value: native field value
+    :return: column value
+    """
+    if value is None:
+        return None
+    if isinstance(field, BooleanType):
+        return int(value)
+    if isinstance(field, (StringType, IntType, FloatType)):
+        return value
+    primitive = field.to_primitive(value)
+    return json.dumps(primitive) if isinstance(field, CompoundType) else primitive
+
+
+def from_column_value(field: BaseType, value: Any) -> Any:
+    """
+    Convert value stored in the table column into native field value
+
+    :param BaseType field: model field
+    :param value: column value
+    :return: native field value
+    """
+    if value is None:
+        return None
+    if isinstance(field, CompoundType):
+        value = json.loads(value)
+    return field.to_native(value)
+
+
+class SQLiteQueryConverter(GenericQueryConverter):
+    """
+    Implementation of filter tree visitor that converts the tree into WHERE clause of SQL
+    statement with parameters. Constants are never put into SQL text, so statements are not
+    vulnerable to injections and are cached by sqlite3 module.
+
+    Usage:
+    converter = SQLiteQueryConverter(model)
+    where, params = converter.build(filter_root)
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.comparison_conversion = {
+            ComparisonOperation.OPERATION_EQ: self._equal,
+            ComparisonOperation.OPERATION_NE: self._not_equal,
+            ComparisonOperation.OPERATION_LT: self._binary_generator("<"),
+            ComparisonOperation.OPERATION_GT: self._binary_generator(">"),
+            ComparisonOperation.OPERATION_LEQ: self._binary_generator("<="),
+            ComparisonOperation.OPERATION_GEQ: self._binary_generator(">="),
+            ComparisonOperation.OPERATION_LIKE: self._like,
+            ComparisonOperation.OPERATION_STARTS_WITH: self._starts_with,
+            ComparisonOperation.OPERATION_IN: self._in
+        }
+        self._model = model
+
+    @staticmethod
+    def _equal(column: str, target) -> Tuple[str, list]:
+        if target is None:
+            return f"{column} IS NULL", []
+        return f"{column} = ?", [target]
+
+    @staticmethod
+    def _not_equal(column: str, target) -> Tuple[str, list]:
+        # NOTE: "IS NOT" is null-safe, so absent values satisfy comparison with a value
+        return f"{column} IS NOT ?", [target]
+
+    @staticmethod
+    def _binary_generator(op_string: str):
+        def _make_clause(column: str, target) -> Tuple[str, list]:
+            return f"{column} {op_string} ?", [target]
+
+        return _make_clause
+
+    @staticmethod
+    def _like(column: str, target) -> Tuple[str, list]:
+        if not isinstance(target, str):
+            raise DataAccessInternalError(f"Like comparison requires string value: {target}")
+        # NOTE: LIKE operator of sqlite ignores case, substring search is case-sensitive as
+        #  the other comparisons and like comparison of other drivers
+        return f"instr({column}, ?) > 0", [target]
+
+    @staticmethod
+    def _starts_with(column: str, target) -> Tuple[str, list]:
+        if not isinstance(target, str):
+            raise DataAccessInternalError(f"Prefix comparison requires string value: {target}")
+        if not target:
+            return f"{column} IS NOT NULL", []
+        # NOTE: prefix is turned into the range of values, so the column index can be used
+        try:
+            upper = target[:-1] + chr(ord(target[-1]) + 1)
+        except ValueError:
+            return f"substr({column}, 1, ?) = ?", [len(target), target]
+        return f"({column} >= ? AND {column} < ?)", [target, upper]
+
+    @staticmethod
+    def _in(column: str, targets) -> Tuple[str, list]:
+        if not targets:
+            return "0", []
+        return f"{column} IN ({', '.join('?' * len(targets))})", list(targets)
+
+    def build(self, root: IFilter) -> Tuple[str, list]:
+        """
+        Convert filter into SQL condition
+
+        :param IFilter root: filter object
+        :return: SQL condition and list of its parameters
+        """
+        return root.accept_visitor(self)
+
+    def _join(self, operation: str, operands: Sequence[IFilter]) -> Tuple[str, list]:
+        clauses, params = list(), list()
+        for operand in operands:
+            clause, clause_params = operand.accept_visitor(self)
+            clauses.append(clause)
+            params.extend(clause_params)
+        return "(" + f" {operation} ".join(clauses) + ")", params
+
+    def handle_and(self, entry: FilterOperationAnd):
+        operands = entry.get_operands()
+        if len(operands) < 2:
+            raise Exception("Malformed AND operation: fewer than two arguments")
+
+        return self._join("AND", operands)
+
+    def handle_or(self, entry: FilterOperationOr):
+        operands = entry.get_operands()
+        if len(operands) < 2:
+            raise Exception("Malformed OR operation: fewer than two arguments")
+
+        return self._join("OR", operands)
+
+    def handle_compare(self, entry: FilterOperationCompare):
+        super().handle_compare(entry)  # Call generic code
+
+        field_str = field_to_str(entry.get_left_operand())
+        field = self._model.fields.get(field_str)
+        if field is None:
+            raise DataAccessInternalError(f"Model {self._model.__name__} has no field {field_str}")
+
+        op = entry.get_operation()
+        right_operand = entry.get_right_operand()
+        try:
+            if op == ComparisonOperation.OPERATION_IN:
+                if not isinstance(right_operand, (list, tuple)):
+                    raise DataAccessInternalError(
+                        f"In comparison requires list of values: {right_operand}")
+                right_operand = [to_column_value(field, field.to_native(value))
+                                 for value in right_operand if value is not None]
+            elif right_operand is not None:
+                right_operand = to_column_value(field, field.to_native(right_operand))
+        except ConversionError as e:
+            raise DataAccessInternalError(f"{e}")
+
+        if right_operand is None and op not in (ComparisonOperation.OPERATION_EQ,
+                                                ComparisonOperation.OPERATION_NE):
+            raise DataAccessInternalError(f"Comparison {op.value} requires not null value")
+
+        return self.comparison_conversion[op](quote_identifier(field_str), right_operand)
+
+
+class SQLiteConnections:
+    """
+    Connections to the database file. Each worker thread uses its own connection, so requests
+    of different threads run in parallel: WAL journal lets readers work concurrently with
+    the writer.
+    """
+
+    def __init__(self, path: str, timeout: float):
+        """
+
+        :param str path: path of the database file
+        :param float timeout: time in seconds to wait for the lock held by other connection
+        """
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Get connection of the current thread, it is opened on the first call
+
+        :return: database connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # NOTE: connection works in autocommit mode, transactions are started explicitly
+            connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # NOTE: in WAL mode commits stay durable against application crashes without
+            #  waiting for fsync of every transaction
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+
+class SQLiteDB(GenericDataBase):
+    """SQLite Storage Interface Implementation"""
+
+    thread_pool = None
+    loop = None
+    connections = dict()  # database file path -> SQLiteConnections
+
+    # time in seconds to wait for the database lock held by other connection
+    _busy_timeout = 10.0
+    # max number of parameters in one statement, it is below SQLite default limit
+    _max_variables = 500
+
+    def __init__(self, connections: SQLiteConnections, model: Type[BaseModel], collection: str,
+                 thread_pool: ThreadPoolExecutor, loop: asyncio.AbstractEventLoop = None,
+                 indexes: Optional[List[str]] = None):
+        """
+
+        :param SQLiteConnections connections: connections to the database file
+        :param Type[BaseModel] model: model (class object) to associate it with the table
+        :param str collection: table name for `model`
+        :param ThreadPoolExecutor thread_pool: thread pool which performs database requests
+        :param BaseEventLoop loop: asyncio event loop
+        :param list indexes: model fields for which table indexes are created
+        """
+        if not isinstance(model, type) or not issubclass(model, BaseModel):
+            raise DataAccessInternalError("Model parameter is not a Class object or not inherited "
+                                          "from cortx.utils.data.access.BaseModel")
+        self._model = model
+        self._connections = connections
+        self._thread_pool = thread_pool
+        self._loop = loop or asyncio.get_event_loop()
+        self._collection = collection
+        self._table = quote_identifier(collection)
+
+        self._indexes = list(indexes or [])
+        unknown = [field for field in self._indexes if field not in model.fields]
+        if unknown:
+            raise DataAccessInternalError(f"Model {model.__name__} doesn't have indexed fields: "
+                                          f"{', '.join(unknown)}")
+
+        self._model_scheme = dict.fromkeys(model.fields.keys())
+        self._columns = list(model.fields.keys())
+        self._query_converter = SQLiteQueryConverter(model)
+        self._filter_optimizer = FilterOptimizer(model, [model.primary_key] + self._indexes)
+
+    @classmethod
+    async def create_database(cls, config, collection: str, model: Type[BaseModel],
+                              model_settings=None) -> IDataBase:
+        """
+        Creates new instance of SQLite DB and creates the table of the model if it doesn't exist
+
+        :param DBSettings config: configuration with path of the database file
+        :param str collection: table name for storing model onto db
+        :param Type[BaseModel] model: model which instances will be stored in DB
+        :param ModelSettings model_settings: model specific settings like indexed fields
+        :return:
+        """
+        if not config.path:
+            raise DataAccessInternalError("Path of SQLite database file is not specified")
+
+        if not all((cls.thread_pool, cls.loop)):
+            cls.loop = asyncio.get_event_loop()
+            cls.thread_pool = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
+        connections = cls.connections.get(config.path)
+        if connections is None:
+            connections = SQLiteConnections(config.path, cls._busy_timeout)
+            cls.connections[config.path] = connections
+
+        indexes = model_settings.indexes if model_settings is not None else None
+        sqlite_db = cls(connections, model, collection, cls.thread_pool, cls.loop, indexes)
+        await sqlite_db.create_table()
+        return sqlite_db
+
+    async def _execute(self, request: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Perform request with the connection of the worker thread
+
+        :param request: function which takes database connection and returns request result
+        :return: request result
+        """
+        return await self._loop.run_in_executor(self._thread_pool,
+                                                partial(self._run_request, request))
+
+    def _run_request(self, request: Callable[[sqlite3.Connection], Any]) -> Any:
+        try:
+            return request(self._connections.get())
+        except sqlite3.OperationalError as e:
+            # NOTE: database is locked for too long, disk I/O errors and so on
+            raise DataAccessExternalError(f"SQLite request failed: {e}")
+        except sqlite3.Error as e:
+            raise DataAccessInternalError(f"SQLite request failed: {e}")
+
+    @staticmethod
+    def _fetch_all(sql: str, params: Sequence, connection: sqlite3.Connection) -> List[tuple]:
+        return connection.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _execute_one(sql: str, params: Sequence, connection: sqlite3.Connection) -> int:
+        return connection.execute(sql, params).rowcount
+
+    @staticmethod
+    def _execute_transaction(statements: Iterable[Tuple[str, Sequence]],
+                             connection: sqlite3.Connection) -> List[int]:
+        """
+        Execute statements in single transaction
+
+        :param statements: SQL statements with their parameters
+        :param sqlite3.Connection connection: database connection
+        :return: number of rows changed by each statement
+        """
+        # NOTE: write lock is taken at once, so the transaction never fails on lock upgrade
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            counts = [connection.execute(sql, params).rowcount for sql, params in statements]
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return counts
+
+    async def create_table(self) -> None:
+        """
+        Create the table of the model and its indexes if they don't exist. Columns of model
+        fields which were added after the table creation are added to the table.
+
+        :return:
+        """
+        def _create_table(_connection: sqlite3.Connection) -> None:
+            columns = list()
+            for name, field in self._model.fields.items():
+                column = f"{quote_identifier(name)} {get_column_type(field)}"
+                if name == self._model.primary_key:
+                    column += " PRIMARY KEY"
+                columns.append(column)
+            _connection.execute(f"CREATE TABLE IF NOT EXISTS {self._table} "
+                                f"({', '.join(columns)})")
+
+            existing = {row[1] for row in _connection.execute(
+                f"PRAGMA table_info({self._table})")}
+            for name, field in self._model.fields.items():
+                if name not in existing:
+                    _connection.execute(f"ALTER TABLE {self._table} ADD COLUMN "
+                                        f"{quote_identifier(name)} {get_column_type(field)}")
+
+            for name in self._indexes:
+                index = quote_identifier(f"{self._collection}_{name}_idx")
+                _connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {self._table} "
+                                    f"({quote_identifier(name)})")
+
+        await self._execute(_create_table)
+
+    def _to_row(self, obj: BaseModel) -> list:
+        return [to_column_value(field, getattr(obj, name))
+                for name, field in self._model.fields.items()]
+
+    def _to_model(self, columns: Sequence[str], row: Sequence[Any]) -> BaseModel:
+        """
+        Create model object from the table row
+
+        :param columns: names of the selected columns
+        :param row: column values
+        :return: model object
+        """
+        raw = dict()
+        for name, value in zip(columns, row):
+            field = self._model.fields[name]
+            if value is not None and isinstance(field, CompoundType):
+                value = json.loads(value)
+            # NOTE: primitive column values are converted by the model itself
+            raw[field.serialized_name or name] = value
+        return self._model(raw)
+
+    def _where(self, filter_obj: Optional[IFilter]) -> Tuple[str, list]:
+        """
+        Build WHERE clause of the filter
+
+        :param IFilter filter_obj: optimized filter object or None
+        :return: WHERE clause (empty if filter is not set) and list of its parameters
+        """
+        if filter_obj is None:
+            return "", []
+        condition, params = self._query_converter.build(filter_obj)
+        return f" WHERE {condition}", params
+
+    def _sort_column(self, field: str) -> str:
+        # NOTE: strings are ordered case insensitively as other storages do it
+        column = quote_identifier(field)
+        if isinstance(self._model.fields[field], StringType):
+            return f"{column} COLLATE NOCASE"
+        return column
+
+    def _order_by(self, keys: List[Tuple[str, SortOrder]]) -> str:
+        # NOTE: SQLite puts NULL first in ascending order, but missing values follow all other
+        #  values in any direction in other storages
+        terms = list()
+        for field, order in keys:
+            direction = "ASC" if order == SortOrder.ASC else "DESC"
+            terms.append(f"{quote_identifier(field)} IS NULL, {self._sort_column(field)} "
+                         f"{direction}")
+        return " ORDER BY " + ", ".join(terms)
+
+    def _keyset_condition(self, keyset: List[Tuple[str, SortOrder]],
+                          values: List[Any]) -> Tuple[str, list]:
+        """
+        Build condition selecting rows which follow the cursor position in the keyset order
+
+        :param list keyset: field names with sort orders
+        :param list values: primitive keyset values of the cursor
+        :return: SQL condition and list of its parameters
+        """
+        alternatives, params = list(), list()
+        equal, equal_params = list(), list()
+        for (field_str, order), value in zip(keyset, values):
+            field = self._model.fields[field_str]
+            column = quote_identifier(field_str)
+            if value is None:
+                # missing values are the last ones, so nothing follows them in this field
+                equal.append(f"{column} IS NULL")
+                continue
+            try:
+                value = to_column_value(field, field.to_native(value))
+            except ConversionError as e:
+                raise DataAccessInternalError(f"{e}")
+            op = ">" if order == SortOrder.ASC else "<"
+            alternatives.append(" AND ".join(
+                equal + [f"({self._sort_column(field_str)} {op} ? OR {column} IS NULL)"]))
+            params.extend(equal_params + [value])
+            equal.append(f"{self._sort_column(field_str)} = ?")
+            equal_params.append(value)
+
+        if not alternatives:
+            return "0", []
+        return "(" + " OR ".join(f"({alternative})" for alternative in alternatives) + ")", params
+
+    def _select_statement(self, query: Query, filter_obj: Optional[IFilter]) \
+            -> Tuple[str, list, List[str]]:
+        """
+        Build SELECT statement of the query
+
+        :param Query query: query object
+        :param IFilter filter_obj: optimized filter of the query
+        :return: SQL statement, list of its parameters and names of the selected columns
+        """
+        data = query.data
+        columns = data.get_projection(self._model) or self._columns
+        where, params = self._where(filter_obj)
+
+        if data.cursor is not None:
+            keyset = data.get_keyset(self._model.primary_key)
+            cursor_values = data.get_cursor_values(self._model.primary_key)
+            if cursor_values is not None:
+                condition, condition_params = self._keyset_condition(keyset, cursor_values)
+                where = f"{where} AND {condition}" if where else f" WHERE {condition}"
+                params.extend(condition_params)
+            order_by = self._order_by(keyset)
+        else:
+            order_by = self._order_by(data.get_sort_keys()) if data.sort_by else ""
+
+        sql = f"SELECT {', '.join(map(quote_identifier, columns))} FROM {self._table}" \
+              f"{where}{order_by}"
+        if data.limit is not None or data.offset:
+            # NOTE: negative limit means no limit in SQLite, OFFSET requires LIMIT clause
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([data.limit if data.limit is not None else -1, data.offset or 0])
+        return sql, params, columns
+
+    def _insert_statement(self) -> str:
+        columns = ", ".join(map(quote_identifier, self._columns))
+        placeholders = ", ".join("?" * len(self._columns))
+        return f"INSERT OR REPLACE INTO {self._table} ({columns}) VALUES ({placeholders})"
+
+    def _update_statement(self, fields: Iterable[str], where: str) -> str:
+        assignments = ", ".join(f"{quote_identifier(field)} = ?" for field in fields)
+        return f"UPDATE {self._table} SET {assignments}{where}"
+
+    def _id_condition(self) -> str:
+        return f" WHERE {quote_identifier(self._model.primary_key)} = ?"
+
+    async def store(self, obj: BaseModel):
+        """
+        Store object into Storage, object with the same primary key value is replaced
+
+        :param Model obj: Arbitrary base object for storing into DB
+
+        """
+        await super().store(obj)  # Call generic code
+
+        await self._execute(partial(self._execute_one, self._insert_statement(),
+                                    self._to_row(obj)))
+
+    async def store_many(self, objs: Iterable[BaseModel]) -> BulkWriteResult:
+        """
+        Store objects into Storage in single transaction
+
+        :param objs: model objects for storing into DB
+        :return: result with ids of stored objects and errors of objects which were not stored
+        """
+        result = BulkWriteResult()
+        obj_ids, statements = list(), list()
+        insert = self._insert_statement()
+        for obj in objs:
+            try:
+                await super().store(obj)  # Call generic code to validate the object
+            except DataAccessInternalError as e:
+                result.add_error(obj.primary_key_val, f"{e}")
+                continue
+            obj_ids.append(obj.primary_key_val)
+            statements.append((insert, self._to_row(obj)))
+
+        await self._execute_many(obj_ids, statements, result)
+        return result
+
+    async def _execute_many(self, obj_ids: List[Any], statements: List[Tuple[str, Sequence]],
+                            result: BulkWriteResult) -> None:
+        """
+        Execute statements of the objects in single transaction and record per-object outcome
+
+        :param list obj_ids: ids of the objects
+        :param list statements: SQL statement with parameters of each object
+        :param BulkWriteResult result: result to record outcome of the statements
+        :return:
+        """
+        if not statements:
+            return
+        try:
+            counts = await self._execute(partial(self._execute_transaction, statements))
+        except (DataAccessExternalError, DataAccessInternalError) as e:
+            for obj_id in obj_ids:
+                result.add_error(obj_id, f"{e}")
+            return
+
+        for obj_id, count in zip(obj_ids, counts):
+            if count > 0:
+                result.add_success(obj_id)
+            else:
+                result.add_missing(obj_id)
+
+    async def update_many(self, to_update: Dict[Any, dict]) -> BulkWriteResult:
+        """
+        Update objects by their ids in single transaction
+
+        :param dict to_update: object id -> dictionary with fields and values which should be
+                               updated
+        :return: result with ids of updated and not found objects and errors of objects which
+                 were not updated
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        result = BulkWriteResult()
+        obj_ids, statements = list(), list()
+        for obj_id, changes in to_update.items():
+            changes = dict(changes)
+            try:
+                converted_id = id_field.to_native(obj_id)
+                await super().update(None, changes)  # Call generic code to convert changes
+            except (ConversionError, DataAccessInternalError) as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            if not changes:
+                changes = {self._model.primary_key: converted_id}
+            params = [to_column_value(self._model.fields[field], value)
+                      for field, value in changes.items()]
+            params.append(to_column_value(id_field, converted_id))
+            obj_ids.append(obj_id)
+            statements.append((self._update_statement(changes, self._id_condition()), params))
+
+        await self._execute_many(obj_ids, statements, result)
+        return result
+
+    async def delete_many(self, obj_ids: Iterable[Any]) -> BulkWriteResult:
+        """
+        Delete objects by their ids in single transaction
+
+        :param obj_ids: ids of the objects to be deleted
+        :return: result with ids of deleted and not found objects and errors of objects which
+                 were not deleted
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        result = BulkWriteResult()
+        deleted_ids, statements = list(), list()
+        delete = f"DELETE FROM {self._table}{self._id_condition()}"
+        for obj_id in obj_ids:
+            try:
+                converted_id = id_field.to_native(obj_id)
+            except ConversionError as e:
+                result.add_error(obj_id, f"{e}")
+                continue
+            deleted_ids.append(obj_id)
+            statements.append((delete, [to_column_value(id_field, converted_id)]))
+
+        await self._execute_many(deleted_ids, statements, result)
+        return result
+
+    async def get(self, query: Query) -> List[BaseModel]:
+        """
+        Get object from Storage by Query
+
+        :param query:
+        :return: empty list or list with objects which satisfy the passed query condition
+        """
+        filter_obj = self._filter_optimizer.optimize(query.data.filter_by)
+        if is_contradiction(filter_obj):
+            return list()
+
+        sql, params, columns = self._select_statement(query, filter_obj)
+        rows = await self._execute(partial(self._fetch_all, sql, params))
+        return [self._to_model(columns, row) for row in rows]
+
+    async def get_many_by_id(self, obj_ids: Iterable[Any]) -> Dict[Any, BaseModel]:
+        """
+        Get several objects by their primary key values using primary key index lookups
+
+        :param obj_ids: primary key values
+        :return: dict primary key value -> BaseModel, objects which are not found are absent
+        """
+        id_field = getattr(self._model, self._model.primary_key)
+        converted = self._convert_ids(obj_ids)
+        found = dict()
+        for start in range(0, len(converted), self._max_variables):
+            chunk = [to_column_value(id_field, obj_id)
+                     for obj_id in converted[start:start + self._max_variables]]
+            sql = f"SELECT {', '.join(map(quote_identifier, self._columns))} " \
+                  f"FROM {self._table} WHERE {quote_identifier(self._model.primary_key)} " \
+                  f"IN ({', '.join('?' * len(chunk))})"
+            for row in await self._execute(partial(self._fetch_all, sql, chunk)):
+                obj = self._to_model(self._columns, row)
+                found[obj.primary_key_val] = obj
+        return found
+
+    async def update(self, filter_obj: IFilter, to_update: dict) -> int:
+        """
+        Update object in Storage by filter
+
+        :param IFilter filter_obj: filter which specifies what objects need to update
+        :param dict to_update: dictionary with fields and values which should be updated
+        :return: number of entries updated
+        """
+        await super().update(filter_obj, to_update)  # Call generic code
+        if not to_update:
+            return await self.count(filter_obj)
+
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
+        where, where_params = self._where(filter_obj)
+        params = [to_column_value(self._model.fields[field], value)
+                  for field, value in to_update.items()]
+        sql = self._update_statement(to_update, where)
+        return await self._execute(partial(self._execute_one, sql, params + where_params))
+
+    async def delete(self, filter_obj: IFilter) -> int:
+        """
+        Delete objects in DB by Query
+
+        :param IFilter filter_obj: filter object to perform delete operation
+        :return: number of deleted entries
+        """
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
+        where, params = self._where(filter_obj)
+        return await self._execute(partial(self._execute_one,
+                                           f"DELETE FROM {self._table}{where}", params))
+
+    async def count(self, filter_obj: IFilter = None) -> int:
+        """
+        Returns count of entities for given filter_obj
+
+        :param filter_obj: filter object to perform count operation
+        :return: count of entries
+        """
+        filter_obj = self._filter_optimizer.optimize(filter_obj)
+        if is_contradiction(filter_obj):
+            return 0
+
+        where, params = self._where(filter_obj)
+        rows = await self._execute(partial(self._fetch_all,
+                                           f"SELECT COUNT(*) FROM {self._table}{where}", params))
+        return rows[0][0]
+
+    async def _aggregate(self, function: str, ext_query: ExtQuery) -> Any:
+        """
+        Perform aggregation by aggregate functions of SQLite, groups are built by GROUP BY
+
+        :param str function: aggregation function name, see `AggregationFunction`
+        :param ExtQuery ext_query: extended query which describes the aggregation
+        :return: aggregated value or dict group value -> aggregated value if group_by is set
+        """
+        value_field, group_field = get_aggregation_fields(self._model, function, ext_query)
+        value_column = quote_identifier(value_field) if value_field is not None else None
+        aggregate = SQL_AGGREGATE_FUNCTIONS[function].format(column=value_column)
+
+        def _value(_value: Any) -> Any:
+            # NOTE: min and max keep the field type, e.g. dates, sum and avg are numbers
+            if value_field is not None and function in (AggregationFunction.MIN,
+                                                        AggregationFunction.MAX):
+                return from_column_value(self._model.fields[value_field], _value)
+            return _value
+
+        filter_obj = self._filter_optimizer.optimize(ext_query.data.filter_by)
+        if is_contradiction(filter_obj):
+            aggregator = StreamAggregator(function)
+            return aggregator.get_result() if group_field is None else dict()
+        where, params = self._where(filter_obj)
+
+        if group_field is None:
+            rows = await self._execute(partial(
+                self._fetch_all, f"SELECT {aggregate} FROM {self._table}{where}", params))
+            return _value(rows[0][0])
+
+        group_column = quote_identifier(group_field)
+        not_null = f"{group_column} IS NOT NULL"
+        where = f"{where} AND {not_null}" if where else f" WHERE {not_null}"
+        rows = await self._execute(partial(
+            self._fetch_all, f"SELECT {group_column}, {aggregate} FROM {self._table}{where} "
+                             f"GROUP BY {group_column}", params))
+        group_type = self._model.fields[group_field]
+        return {from_column_value(group_type, group): _value(value) for group, value in rows}
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from schematics.exceptions import ConversionError, DataError, ValidationError
+
+from cortx.utils.data.access import BaseModel, BulkWriteResult
+from cortx.utils.errors import DataAccessInternalError
+
+
+FlushCallback = Callable[[BulkWriteResult], Any]
+StoreManyCall = Callable[[Iterable[BaseModel]], Any]
+
+
+class WriteBehindBuffer:
+    """
+    Write-behind buffer of `store` calls for a single model.
+
+    Stored objects are validated and kept in the buffer, the call returns without waiting for
+    the database. Buffered objects are written by one `store_many` call when the buffer holds
+    `max_batch_size` objects or `flush_interval` seconds after the first buffered object.
+    Repeated stores of the object with the same primary key before the flush are coalesced,
+    only the last version is written. Batches are written one after another in order of
+    buffering, so the last stored version of the object wins in the database too.
+
+    Buffered objects are not durable: they are lost if the process stops before the flush.
+    Outcome of every batch write is passed to the flush callback, `flush` returns it as well.
+    """
+
+    def __init__(self, max_batch_size: int, flush_interval: float,
+                 on_flush: Optional[FlushCallback] = None):
+        """
+
+        :param int max_batch_size: number of buffered objects which triggers the flush
+        :param float flush_interval: max time in seconds which objects spend in the buffer
+        :param on_flush: function which is called with `BulkWriteResult` of every batch write
+        """
+        if max_batch_size < 1:
+            raise DataAccessInternalError(f"Wrong write-behind batch size: {max_batch_size}")
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self.on_flush = on_flush
+        self._pending = OrderedDict()  # primary key -> last stored version of the object
+        self._store_many = None
+        self._timer = None
+        self._flushing = None  # task of the last started flush
+        self._stored = 0
+        self._coalesced = 0
+        self._batches = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    async def store(self, store_many: StoreManyCall, obj: BaseModel) -> None:
+        """
+        Put object into the buffer, flush the buffer if it is full
+
+        :param store_many: bound storage coroutine function which writes the batch
+        :param BaseModel obj: model object for storing into DB
+        :return:
+        """
+        try:
+            obj.validate()
+        except (ValidationError, ConversionError, DataError) as e:
+            raise DataAccessInternalError(f"{e}")
+
+        # NOTE: the copy keeps the buffered version safe from changes made by the caller
+        obj = type(obj)(obj.to_native())
+        obj_id = obj.primary_key_val
+        if self._pending.pop(obj_id, None) is not None:
+            self._coalesced += 1
+        self._pending[obj_id] = obj
+        self._store_many = store_many
+        self._stored += 1
+
+        if len(self._pending) >= self._max_batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(self._flush_interval,
+                                                              self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        flush = asyncio.ensure_future(self.flush())
+        # NOTE: errors of the batch write are reported to the flush callback, only errors of
+        #  the callback itself get here and nobody waits for them
+        flush.add_done_callback(lambda _flush: _flush.cancelled() or _flush.exception())
+
+    async def flush(self) -> BulkWriteResult:
+        """
+        Write all buffered objects and wait until the writes of the previous flushes are done
+
+        :return: result of the batch write of this flush
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending and (self._flushing is None or self._flushing.done()):
+            return BulkWriteResult()
+
+        batch = list(self._pending.values())
+        self._pending = OrderedDict()
+        self._flushing = asyncio.ensure_future(self._write(self._flushing, batch))
+        # NOTE: cancellation of the caller must not interrupt the batch write
+        return await asyncio.shield(self._flushing)
+
+    async def _write(self, previous: Optional[asyncio.Future],
+                     objs: List[BaseModel]) -> BulkWriteResult:
+        """
+        Write the batch after the batch of the previous flush
+
+        :param previous: task of the previous flush or None
+        :param list objs: objects of the batch
+        :return: result of the batch write
+        """
+        if previous is not None:
+            try:
+                await previous
+            except Exception:
+                pass  # NOTE: the error of the previous flush is reported to its callers
+        if not objs:
+            return BulkWriteResult()
+
+        self._batches += 1
+        try:
+            result = await self._store_many(objs)
+        except Exception as e:
+            result = BulkWriteResult()
+            for obj in objs:
+                result.add_error(obj.primary_key_val, f"{e}")
+        if self.on_flush is not None:
+            self.on_flush(result)
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffering metrics
+
+        :return: dict with number of buffered store calls, number of stores which replaced the
+                 buffered version of the same object, number of batch writes and number of
+                 objects waiting for the flush
+        """
+        return {
+            "stored": self._stored,
+            "coalesced": self._coalesced,
+            "batches": self._batches,
+            "pending": len(self._pending)
+        }
@@ -53,10 +53,10 @@ class DecisionMonitor:
 
         async def get(self, **resource_key):
             """
-            Get consul data else raise error
+            Get latest consul data else raise error
             """
             return await asyncio.wait_for(self._decisiondb.get_event_time(**resource_key,
-                    sort_by=SortBy(DecisionModel.alert_time, SortOrder.DESC)),
+                    sort_by=SortBy(DecisionModel.alert_time, SortOrder.DESC), limit=1),
                     timeout=self._consul_timeout)
 
         async def delete(self, **resource_key):
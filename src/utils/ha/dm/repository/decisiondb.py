@@ -20,7 +20,7 @@ import os
 from cortx.utils.schema.payload import Json
 from cortx.utils.ha.hac import const
 from cortx.utils.data.access import Query
-from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.access.filters import Compare, StartsWith
 from cortx.utils.data.db.db_provider import DataBaseProvider, GeneralConfig
 from cortx.utils.ha.dm.models.decisiondb import DecisionModel
 from cortx.utils.log import Log
@@ -99,6 +99,8 @@ class DecisionDB:
         :param entity_id: Entity Id :type: Str
         :param component: Component Name :type: Str
         :param component_id: Component Id :type: Str
+        :param sort_by: Ordering of the events :type: SortBy
+        :param limit: Max number of returned events :type: Int
         :return:
         """
         # Generate Key
@@ -107,10 +109,12 @@ class DecisionDB:
         Log.debug(f"Fetch event time for {decision_id}")
         # Create Query
         query = Query().filter_by(
-            Compare(DecisionModel.decision_id, 'like', decision_id))
+            StartsWith(DecisionModel.decision_id, decision_id))
 
         if kwargs.get("sort_by"):
             query.order_by(kwargs["sort_by"].field, kwargs['sort_by'].order)
+        if kwargs.get("limit"):
+            query.limit(kwargs["limit"])
 
         return await self.storage(DecisionModel).get(query)
 
@@ -129,4 +133,4 @@ class DecisionDB:
         Log.debug(f"Deleting event for {decision_id}")
         # Delete all the Decisions Related to The Event.
         await self.storage(DecisionModel).delete(
-            Compare(DecisionModel.decision_id, 'like', decision_id))
+            StartsWith(DecisionModel.decision_id, decision_id))
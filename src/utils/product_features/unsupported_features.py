@@ -21,6 +21,7 @@ from cortx.utils.data.access.filters import Compare, And
 from cortx.utils.data.db.db_provider import DataBaseProvider, GeneralConfig
 from cortx.utils import const
 from cortx.utils.log import Log
+from cortx.utils.errors import DataAccessExternalError
 from cortx.utils.schema import database
 from cortx.utils.schema.payload import Json
 from cortx.utils.product_features.model import UnsupportedFeaturesModel
@@ -62,11 +63,12 @@ class UnsupportedFeaturesDB:
         query = Query()
         # Generate Key
         if component_name:
-            query.filter_by(Compare(
-                UnsupportedFeaturesModel.component_name, "=", component_name))
+            conditions = [Compare(
+                UnsupportedFeaturesModel.component_name, "=", component_name)]
             if feature_name:
-                query.filter_by(And(Compare(
-                    UnsupportedFeaturesModel.feature_name, "=", feature_name)))
+                conditions.append(Compare(
+                    UnsupportedFeaturesModel.feature_name, "=", feature_name))
+            query.filter_by(And(*conditions))
 
         feature_details = await self.storage(UnsupportedFeaturesModel).get(
             query)
@@ -101,5 +103,15 @@ class UnsupportedFeaturesDB:
         if not isinstance(features, list):
             raise TypeError("Unsupported Type for features.")
 
+        feature_objects = []
         for each_feature in features:
-            await self.store_unsupported_feature(component_name, each_feature)
+            feature_id = UnsupportedFeaturesModel.create_feature_id(component_name,
+                                                                    const.UNSUPPORTED_FEATURE,
+                                                                    each_feature)
+            feature_objects.append(UnsupportedFeaturesModel.instantiate_decision(
+                feature_id, each_feature, component_name))
+        # Save Data by bulk requests.
+        result = await self.storage(UnsupportedFeaturesModel).store_many(feature_objects)
+        if not result.ok:
+            raise DataAccessExternalError(f"Failed to store unsupported features: "
+                                          f"{result.errors}")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, ExtQuery, Query
+from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.access.filter_compiler import compile_filter
+from cortx.utils.data.db import GenericDataBase
+from cortx.utils.data.db.aggregation import AggregationFunction, StreamAggregator
+from cortx.utils.errors import DataAccessInternalError
+
+
+class AlertModel(BaseModel):
+    _id = "alert_id"
+    alert_id = StringType()
+    severity = StringType()
+    size = IntType()
+
+
+class AlertPagesDataBase(GenericDataBase):
+    """Storage of alerts which serves only filtered pages used by the generic aggregation"""
+
+    def __init__(self, alerts):
+        self._model = AlertModel
+        self._alerts = alerts
+
+    def _filter(self, filter_obj):
+        if filter_obj is None:
+            return self._alerts
+        return list(filter(compile_filter(AlertModel, filter_obj), self._alerts))
+
+    async def get(self, query: Query):
+        query = query.data
+        offset = query.offset or 0
+        return self._filter(query.filter_by)[offset:offset + query.limit]
+
+    async def update(self, filter_obj, to_update):
+        raise NotImplementedError("Aggregation must not update alerts")
+
+    async def count(self, filter_obj=None):
+        return len(self._filter(filter_obj))
+
+
+class TestStreamAggregator(unittest.TestCase):
+
+    def test_functions(self):
+        values = [3, None, 1, 2]
+        expected = {
+            AggregationFunction.COUNT: 4,
+            AggregationFunction.SUM: 6,
+            AggregationFunction.AVG: 2,
+            AggregationFunction.MIN: 1,
+            AggregationFunction.MAX: 3,
+        }
+        for function, result in expected.items():
+            aggregator = StreamAggregator(function)
+            for value in values:
+                aggregator.add(value)
+            self.assertEqual(aggregator.get_result(), result, function)
+
+    def test_empty(self):
+        self.assertEqual(StreamAggregator(AggregationFunction.SUM).get_result(), 0)
+        self.assertIsNone(StreamAggregator(AggregationFunction.AVG).get_result())
+        self.assertEqual(StreamAggregator(AggregationFunction.COUNT).get_grouped_result(), {})
+
+
+class TestGenericAggregation(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        severities = ["critical", "warning", "warning", "info", "warning"]
+        self.storage = AlertPagesDataBase([
+            AlertModel({"alert_id": f"alert-{i}", "severity": severity, "size": i})
+            for i, severity in enumerate(severities)])
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def test_count_by_group(self):
+        ext_query = ExtQuery().group_by(AlertModel.severity)
+        self.assertEqual(self._run(self.storage.count_by_query(ext_query)),
+                         {"critical": 1, "warning": 3, "info": 1})
+
+    def test_metrics(self):
+        ext_query = ExtQuery().aggregate(AlertModel.size)
+        self.assertEqual(self._run(self.storage.sum(ext_query)), 10)
+        self.assertEqual(self._run(self.storage.avg(ext_query)), 2)
+        self.assertEqual(self._run(self.storage.min(ext_query)), 0)
+        self.assertEqual(self._run(self.storage.max(ext_query)), 4)
+
+    def test_filtered_group_metric(self):
+        ext_query = ExtQuery().filter_by(Compare(AlertModel.size, ">", 1))
+        ext_query.aggregate("size").group_by("severity")
+        self.assertEqual(self._run(self.storage.max(ext_query)), {"warning": 4, "info": 3})
+
+    def test_aggregate_field_is_required(self):
+        with self.assertRaises(DataAccessInternalError):
+            self._run(self.storage.sum(ExtQuery().group_by(AlertModel.severity)))
+        with self.assertRaises(DataAccessInternalError):
+            self._run(self.storage.sum(ExtQuery().aggregate("weight")))
+
+    def test_ext_query_serialization(self):
+        ext_query = ExtQuery().aggregate(AlertModel.size).group_by(AlertModel.severity)
+        restored = ExtQuery.from_json(ext_query.to_json())
+        self.assertEqual(restored.to_primitive(), {"aggregate": "size", "group_by": "severity"})
+        self.assertNotEqual(ext_query.fingerprint(),
+                            ExtQuery().group_by(AlertModel.severity).fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel
+from cortx.utils.data.db import GenericDataBase
+
+
+class BulkModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    size = IntType()
+
+
+class DictDataBase(GenericDataBase):
+    """Storage which keeps objects in the dict"""
+
+    def __init__(self):
+        self._model = BulkModel
+        self._model_scheme = {"node_id": {}, "size": {}}
+        self.objects = dict()
+
+    async def store(self, obj):
+        await super().store(obj)
+        self.objects[obj.node_id] = obj
+
+    async def update_by_id(self, obj_id, to_update):
+        await super().update(None, to_update)
+        if obj_id not in self.objects:
+            return False
+        for key, value in to_update.items():
+            setattr(self.objects[obj_id], key, value)
+        return True
+
+    async def delete_by_id(self, obj_id):
+        return self.objects.pop(obj_id, None) is not None
+
+    async def update(self, filter_obj, to_update):
+        pass
+
+    async def count(self, filter_obj=None):
+        pass
+
+
+class TestGenericBulkWrite(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.storage = DictDataBase()
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def test_store_many(self):
+        invalid = BulkModel({"node_id": "node-2", "size": 2})
+        invalid.size = "large"
+        result = self._run(self.storage.store_many(
+            [BulkModel({"node_id": "node-1", "size": 1}), invalid]))
+        self.assertEqual(result.succeeded, ["node-1"])
+        self.assertEqual(list(result.errors), ["node-2"])
+        self.assertFalse(result.ok)
+        self.assertEqual(list(self.storage.objects), ["node-1"])
+
+    def test_update_and_delete_many(self):
+        self._run(self.storage.store_many([BulkModel({"node_id": f"node-{i}", "size": i})
+                                           for i in range(3)]))
+        changes = {"size": "10"}
+        result = self._run(self.storage.update_many({"node-0": changes, "node-5": changes,
+                                                     "node-1": {"color": "red"}}))
+        self.assertEqual(result.succeeded, ["node-0"])
+        self.assertEqual(result.missing, ["node-5"])
+        self.assertEqual(list(result.errors), ["node-1"])
+        self.assertEqual(self.storage.objects["node-0"].size, 10)
+        self.assertEqual(changes, {"size": "10"})
+
+        result = self._run(self.storage.delete_many(["node-1", "node-7"]))
+        self.assertTrue(result.ok)
+        self.assertEqual(result.succeeded, ["node-1"])
+        self.assertEqual(result.missing, ["node-7"])
+
+
+if __name__ == '__main__':
+    unittest.main()
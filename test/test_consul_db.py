@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import base64
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from consul.base import ClientError
+from schematics.types import StringType, IntType
+from cortx.utils.data.access.filters import Compare, Or, StartsWith
+from cortx.utils.data.access import BaseModel, Query
+from cortx.utils.data.db.consul_db import ConsulDB
+from cortx.utils.data.db.consul_db.storage import ConsulCollectionReplica
+from cortx.utils.errors import DataAccessExternalError
+
+
+class ConsulKeys:
+    KEY = "Key"
+    VALUE = "Value"
+    KV = "KV"
+    VERB = "Verb"
+    INDEX = "Index"
+
+
+class FakeConsulKV:
+
+    def __init__(self, consul):
+        self._consul = consul
+
+    async def get(self, key, index=None, recurse=False, wait=None, keys=False, **_kwargs):
+        await asyncio.sleep(0)
+        while index is not None and int(index) == self._consul.index:
+            await asyncio.sleep(0.01)  # blocking query returns after the next change
+        if recurse or keys:
+            found = [self._consul.get_raw(item) for item in sorted(self._consul.data)
+                     if item.startswith(key)]
+            if keys:
+                found = [raw[ConsulKeys.KEY] for raw in found]
+            return self._consul.index, found or None
+        if key not in self._consul.data:
+            return self._consul.index, None
+        return self._consul.index, self._consul.get_raw(key)
+
+    async def put(self, key, value):
+        await asyncio.sleep(0)
+        self._consul.set(key, value)
+        return True
+
+    async def delete(self, key, recurse=False):
+        await asyncio.sleep(0)
+        for item in [item for item in self._consul.data
+                     if item == key or (recurse and item.startswith(key))]:
+            self._consul.delete(item)
+        return True
+
+
+class FakeConsulTxn:
+
+    def __init__(self, consul):
+        self._consul = consul
+        self.payloads = list()
+        self.before_apply = None  # function which is called before every transaction
+
+    async def put(self, payload):
+        await asyncio.sleep(0)
+        self.payloads.append(payload)
+        if self.before_apply is not None:
+            self.before_apply()
+        errors = list()
+        for op_index, operation in enumerate(payload):
+            kv = operation[ConsulKeys.KV]
+            if kv[ConsulKeys.VERB] in ("cas", "check-index"):
+                current = self._consul.data.get(kv[ConsulKeys.KEY], (None, 0))[1]
+                if current != kv[ConsulKeys.INDEX]:
+                    errors.append({"OpIndex": op_index,
+                                   "What": f"index of {kv[ConsulKeys.KEY]} is stale"})
+        if errors:
+            raise ClientError("409 " + json.dumps({"Results": None, "Errors": errors}))
+        results = list()
+        for operation in payload:
+            kv = operation[ConsulKeys.KV]
+            if kv[ConsulKeys.VERB] in ("set", "cas"):
+                self._consul.set(kv[ConsulKeys.KEY],
+                                 base64.b64decode(kv[ConsulKeys.VALUE]).decode())
+                results.append({ConsulKeys.KV: {ConsulKeys.KEY: kv[ConsulKeys.KEY],
+                                                "ModifyIndex": self._consul.index}})
+            elif kv[ConsulKeys.VERB] == "delete":
+                self._consul.delete(kv[ConsulKeys.KEY])
+        return {"Results": results, "Errors": None}
+
+
+class FakeConsul:
+    """In-memory implementation of consul.aio client calls used by ConsulDB"""
+
+    def __init__(self):
+        self.data = dict()  # key -> (value, modify index)
+        self.index = 1
+        self.kv = FakeConsulKV(self)
+        self.txn = FakeConsulTxn(self)
+
+    def set(self, key, value):
+        self.index += 1
+        self.data[key] = (value, self.index)
+
+    def delete(self, key):
+        self.index += 1
+        self.data.pop(key, None)
+
+    def get_raw(self, key):
+        value, modify_index = self.data[key]
+        return {"Key": key, "Value": value.encode(), "ModifyIndex": modify_index}
+
+    def get_value(self, key):
+        return json.loads(self.data[key][0])
+
+    def keys_under(self, prefix):
+        return sorted(key for key in self.data if key.startswith(prefix))
+
+
+class ConsulNodeModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    status = StringType()
+    counter = IntType()
+
+
+def make_node(i: int, status: str = "ok") -> ConsulNodeModel:
+    return ConsulNodeModel({"node_id": f"node-{i}", "status": status, "counter": i})
+
+
+class ConsulDBTestCase(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+    _thread_pool = ThreadPoolExecutor(max_workers=1)
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.storage = self._create_storage(["status"])
+
+    def _create_storage(self, indexes):
+        storage = ConsulDB(self.consul, ConsulNodeModel, "nodes", self._thread_pool,
+                           self._loop, indexes)
+        self._run(storage.create_object_root())
+        self._run(storage.create_indexes())
+        return storage
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def _index_keys(self, status=""):
+        return self.consul.keys_under(f"cortx/base/nodes/prop/status/{status}")
+
+
+class TestConsulIndexes(ConsulDBTestCase):
+
+    def test_index_entries_follow_values(self):
+        self._run(self.storage.store(make_node(1)))
+        self._run(self.storage.store(make_node(2)))
+        self.assertEqual(self._index_keys("ok/"), ["cortx/base/nodes/prop/status/ok/node-1",
+                                                   "cortx/base/nodes/prop/status/ok/node-2"])
+        self.assertEqual(self.consul.data["cortx/base/nodes/prop/status/ok/node-1"][0],
+                         "cortx/base/nodes/obj/node-1")
+
+        self._run(self.storage.store(make_node(1, "failed")))
+        self._run(self.storage.update(Compare("node_id", "=", "node-2"), {"status": "offline"}))
+        self.assertEqual(self._index_keys("ok/"), [])
+        self.assertEqual(self._index_keys("failed/"),
+                         ["cortx/base/nodes/prop/status/failed/node-1"])
+        self.assertEqual(self._index_keys("offline/"),
+                         ["cortx/base/nodes/prop/status/offline/node-2"])
+        found = self._run(self.storage.get_by_id("node-2"))
+        self.assertEqual(found.status, "offline")
+
+        self._run(self.storage.delete(Compare("status", "=", "failed")))
+        self.assertTrue(self._run(self.storage.delete_by_id("node-2")))
+        self.assertEqual(self._index_keys(), [])
+
+    def test_prefix_delete_removes_index_entries(self):
+        self._run(self.storage.store_many([make_node(1), make_node(2), make_node(10)]))
+        self.assertEqual(self._run(self.storage.delete(StartsWith("node_id", "node-1"))), 2)
+        self.assertEqual(self._index_keys(), ["cortx/base/nodes/prop/status/ok/node-2"])
+
+    def test_store_is_single_transaction(self):
+        self._run(self.storage.store(make_node(1)))
+        self._run(self.storage.store(make_node(1, "failed")))
+        payload = self.consul.txn.payloads[-1]
+        self.assertEqual([(op["KV"]["Verb"], op["KV"]["Key"]) for op in payload],
+                         [("set", "cortx/base/nodes/prop/status/failed/node-1"),
+                          ("set", "cortx/base/nodes/obj/node-1"),
+                          ("delete", "cortx/base/nodes/prop/status/ok/node-1")])
+
+    def test_failed_store_leaves_no_index_entries(self):
+        def _fail():
+            raise ClientError("500 consul is not available")
+
+        self.consul.txn.before_apply = _fail
+        with self.assertRaises(DataAccessExternalError):
+            self._run(self.storage.store(make_node(1)))
+        self.assertEqual(self._index_keys(), [])
+
+    def test_index_is_built_for_stored_objects(self):
+        self.consul = FakeConsul()
+        storage = self._create_storage([])
+        self._run(storage.store_many([make_node(1), make_node(2, "failed")]))
+        storage = self._create_storage(["status"])
+        self.assertEqual(self._index_keys("failed/"),
+                         ["cortx/base/nodes/prop/status/failed/node-2"])
+        found = self._run(storage.count(Compare("status", "=", "ok")))
+        self.assertEqual(found, 1)
+
+    def test_index_lookup_order_is_deterministic(self):
+        statuses = ("ok", "failed", "offline")
+        self._run(self.storage.store_many([make_node(i, statuses[i % 3]) for i in range(12)]))
+        query = Query().filter_by(Or(Compare("status", "=", "failed"),
+                                     Compare("status", "=", "offline")))
+        found = self._run(self.storage.get(query))
+        self.assertEqual([node.node_id for node in found],
+                         sorted(f"node-{i}" for i in range(12) if i % 3))
+        found = self._run(self.storage.get(Query().filter_by(Compare("status", "=", "ok"))))
+        self.assertEqual([node.node_id for node in found],
+                         ["node-0", "node-3", "node-6", "node-9"])
+
+
+class TestConsulTransactions(ConsulDBTestCase):
+    _OBJ_KEY = "cortx/base/nodes/obj/node-1"
+
+    def _change_node(self, counter):
+        value = self.consul.get_value(self._OBJ_KEY)
+        value["counter"] = counter
+        self.consul.set(self._OBJ_KEY, json.dumps(value))
+
+    def test_conflicting_update_is_retried(self):
+        self._run(self.storage.store_many([make_node(1), make_node(2)]))
+        payloads_before = len(self.consul.txn.payloads)
+
+        def _change_once():
+            self.consul.txn.before_apply = None
+            self._change_node(100)
+
+        self.consul.txn.before_apply = _change_once
+        result = self._run(self.storage.update_many({"node-1": {"status": "failed"},
+                                                     "node-2": {"status": "failed"}}))
+        self.assertTrue(result.ok)
+        self.assertEqual(sorted(result.succeeded), ["node-1", "node-2"])
+        # NOTE: the whole transaction is rolled back, then it is made again from the
+        #  current state, so the concurrent change is kept
+        self.assertEqual(len(self.consul.txn.payloads) - payloads_before, 2)
+        self.assertEqual(self.consul.get_value(self._OBJ_KEY),
+                         {"node_id": "node-1", "status": "failed", "counter": 100})
+        self.assertEqual(self._index_keys("failed/"),
+                         ["cortx/base/nodes/prop/status/failed/node-1",
+                          "cortx/base/nodes/prop/status/failed/node-2"])
+
+    def test_large_batch_is_split(self):
+        nodes = [make_node(i) for i in range(100)]
+        result = self._run(self.storage.store_many(nodes))
+        self.assertEqual(len(result.succeeded), 100)
+        payloads = self.consul.txn.payloads
+        # NOTE: every object is written with its index entry, 2 operations per object
+        self.assertEqual([len(payload) for payload in payloads], [64, 64, 64, 8])
+        for payload in payloads:
+            keys = [operation["KV"]["Key"] for operation in payload]
+            self.assertEqual(len(keys), 2 * len([key for key in keys if "/obj/" in key]))
+        self.assertEqual(self._run(self.storage.count()), 100)
+
+    def test_retries_are_exhausted(self):
+        self._run(self.storage.store(make_node(1)))
+        payloads_before = len(self.consul.txn.payloads)
+        self.consul.txn.before_apply = lambda: self._change_node(self.consul.index)
+
+        result = self._run(self.storage.update_many({"node-1": {"status": "failed"}}))
+        self.assertEqual(list(result.errors), ["node-1"])
+        self.assertEqual(result.succeeded, [])
+        self.assertEqual(len(self.consul.txn.payloads) - payloads_before,
+                         1 + self.storage._cas_max_retries)
+        self.assertEqual(self.consul.get_value(self._OBJ_KEY)["status"], "ok")
+        self.assertEqual(self._index_keys("failed/"), [])
+
+        with self.assertRaises(DataAccessExternalError):
+            self._run(self.storage.update(Compare("node_id", "=", "node-1"),
+                                          {"status": "failed"}))
+
+
+class TestConsulReplica(ConsulDBTestCase):
+    _OBJ_DIR = "cortx/base/nodes/obj/"
+
+    def _create_replica(self):
+        return ConsulCollectionReplica(self.consul, ConsulNodeModel, self._OBJ_DIR, 10,
+                                       self._loop)
+
+    def _raw_nodes(self):
+        return [self.consul.get_raw(key) for key in self.consul.keys_under(self._OBJ_DIR)]
+
+    def _wait_for(self, condition):
+        async def _wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+
+        self._run(asyncio.wait_for(_wait(), 1))
+
+    def _replica_status(self, replica, i):
+        entry = replica.get_entry(f"{self._OBJ_DIR}node-{i}")
+        return None if entry is None else entry.value["status"]
+
+    def test_watch_loads_and_refreshes(self):
+        self._run(self.storage.store_many([make_node(1), make_node(2)]))
+        self.storage.start_replica(10)
+        try:
+            self._wait_for(self.storage._is_replica_fresh)
+            self.assertEqual(self._run(self.storage.count()), 2)
+
+            # NOTE: change made by other process is applied by the next blocking query
+            self.consul.set(f"{self._OBJ_DIR}node-3", json.dumps(make_node(3).to_primitive()))
+            self._wait_for(lambda: len(self.storage._replica.get_entries(None)) == 3)
+            found = self._run(self.storage.get_by_id("node-3"))
+            self.assertEqual(found.counter, 3)
+        finally:
+            self._run(self.storage.stop_replica())
+
+    def test_in_flight_response_keeps_local_write(self):
+        self._run(self.storage.store_many([make_node(1), make_node(2)]))
+        replica = self._create_replica()
+        stale_index, stale_data = self.consul.index, self._raw_nodes()
+        replica._load(stale_data, stale_index, 0)
+
+        self.consul.set(f"{self._OBJ_DIR}node-1",
+                        json.dumps(make_node(1, "failed").to_primitive()))
+        replica.put(f"{self._OBJ_DIR}node-1", make_node(1, "failed").to_primitive(),
+                    self.consul.index)
+        self.consul.delete(f"{self._OBJ_DIR}node-2")
+        replica.remove(f"{self._OBJ_DIR}node-2")
+
+        # NOTE: response of the request made before the writes doesn't undo them
+        replica._load(stale_data, stale_index, 0)
+        self.assertEqual(self._replica_status(replica, 1), "failed")
+        self.assertIsNone(self._replica_status(replica, 2))
+
+        # NOTE: response which contains the writes replaces local state
+        self.consul.set(f"{self._OBJ_DIR}node-1", json.dumps(make_node(1, "ok").to_primitive()))
+        replica._load(self._raw_nodes(), self.consul.index, 0)
+        self.assertEqual(self._replica_status(replica, 1), "ok")
+        self.assertIsNone(self._replica_status(replica, 2))
+
+    def test_local_write_without_index(self):
+        self._run(self.storage.store(make_node(1)))
+        replica = self._create_replica()
+        stale_index, stale_data = self.consul.index, self._raw_nodes()
+        replica._load(stale_data, stale_index, 0)
+        replica.put(f"{self._OBJ_DIR}node-1", make_node(1, "failed").to_primitive())
+
+        replica._load(stale_data, stale_index + 1, 0)
+        self.assertEqual(self._replica_status(replica, 1), "failed")
+        # NOTE: request made after the write gets the actual state
+        replica._load(stale_data, stale_index + 2, 1)
+        self.assertEqual(self._replica_status(replica, 1), "ok")
+
+    def test_store_is_visible_in_replica(self):
+        self._run(self.storage.store(make_node(1)))
+        self.storage.start_replica(10)
+        try:
+            self._wait_for(self.storage._is_replica_fresh)
+            replica = self.storage._replica
+            stale_index, stale_data = self.consul.index, self._raw_nodes()
+            self._run(self.storage.store(make_node(1, "failed")))
+            replica._load(stale_data, stale_index, 0)
+            found = self._run(self.storage.get_by_id("node-1"))
+            self.assertEqual(found.status, "failed")
+        finally:
+            self._run(self.storage.stop_replica())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import json
+import unittest
+import elasticsearch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from elasticsearch.exceptions import (ConflictError, ConnectionError, ConnectionTimeout,
+                                      NotFoundError, TransportError)
+from cortx.utils.data.db.elasticsearch_db.async_client import AsyncElasticsearch
+
+
+# NOTE: the client raises exceptions of elasticsearch 6.x package, exception classes of
+#  elasticsearch 8 package have different constructors
+skip_unless_legacy_exceptions = unittest.skipIf(
+    elasticsearch.VERSION[0] >= 8, "exceptions of elasticsearch 6.x package are required")
+
+class RecordedRequest:
+
+    def __init__(self, method, path, query, content_type, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.content_type = content_type
+        self.body = body
+
+
+class FakeESServer:
+    """HTTP server which records requests and replies with configured responses"""
+
+    def __init__(self):
+        self.requests = list()
+        self.status = 200
+        self.response = "{}"
+        self.delay = 0
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self.server = TestServer(app)
+
+    async def _handle(self, request):
+        body = await request.read()
+        self.requests.append(RecordedRequest(request.method, request.raw_path.split("?")[0],
+                                             dict(request.query), request.content_type, body))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return web.Response(status=self.status, text=self.response,
+                            content_type="application/json")
+
+
+class TestAsyncElasticsearch(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.es_server = FakeESServer()
+        self._run(self.es_server.server.start_server())
+        self.client = AsyncElasticsearch("127.0.0.1", self.es_server.server.port, timeout=1)
+
+    def tearDown(self):
+        self._run(self.client.close())
+        self._run(self.es_server.server.close())
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def _last_request(self):
+        return self.es_server.requests[-1]
+
+    def test_index(self):
+        self.es_server.response = '{"result": "created", "_id": "node 1"}'
+        response = self._run(self.client.index(index="nodes", doc_type="nodes", id="node 1",
+                                               body={"status": "ok"}, refresh="wait_for"))
+        self.assertEqual(response, {"result": "created", "_id": "node 1"})
+        request = self._last_request()
+        self.assertEqual((request.method, request.path), ("PUT", "/nodes/nodes/node%201"))
+        self.assertEqual(request.query, {"refresh": "wait_for"})
+        self.assertEqual(request.content_type, "application/json")
+        self.assertEqual(json.loads(request.body), {"status": "ok"})
+
+        self._run(self.client.index(index="nodes", body={"status": "ok"}))
+        self.assertEqual((self._last_request().method, self._last_request().path),
+                         ("POST", "/nodes/_doc"))
+
+    def test_bulk_is_ndjson(self):
+        actions = [{"index": {"_id": "1"}}, {"status": "ok"}, {"delete": {"_id": "2"}}]
+        self._run(self.client.bulk(actions, index="nodes", doc_type="nodes"))
+        request = self._last_request()
+        self.assertEqual((request.method, request.path), ("POST", "/nodes/nodes/_bulk"))
+        self.assertEqual(request.content_type, "application/x-ndjson")
+        self.assertTrue(request.body.endswith(b"\n"))
+        self.assertEqual([json.loads(line) for line in request.body.splitlines()], actions)
+
+    def test_params_are_escaped(self):
+        self._run(self.client.search(index="nodes", body={"query": {"match_all": {}}},
+                                     _source=["status", "counter"], allow_no_indices=True,
+                                     ignore_unavailable=False, size=10, routing=None))
+        request = self._last_request()
+        self.assertEqual((request.method, request.path), ("POST", "/nodes/_search"))
+        self.assertEqual(request.query, {"_source": "status,counter", "allow_no_indices": "true",
+                                         "ignore_unavailable": "false", "size": "10"})
+
+    def test_indices_and_scroll_paths(self):
+        self._run(self.client.indices.refresh(index="nodes"))
+        self.assertEqual(self._last_request().path, "/nodes/_refresh")
+        self._run(self.client.indices.get_alias(index="nodes", ignore_unavailable=True))
+        self.assertEqual(self._last_request().path, "/nodes/_alias")
+        self._run(self.client.scroll(scroll_id="abc", scroll="1m"))
+        request = self._last_request()
+        self.assertEqual((request.path, request.query), ("/_search/scroll", {"scroll": "1m"}))
+        self.assertEqual(json.loads(request.body), {"scroll_id": "abc"})
+
+    def test_empty_response(self):
+        self.es_server.response = ""
+        self.assertEqual(self._run(self.client.indices.refresh(index="nodes")), dict())
+
+    @skip_unless_legacy_exceptions
+    def test_error_types(self):
+        info = {"error": {"type": "index_not_found_exception", "reason": "no such index"},
+                "status": 404}
+        for status, response, exception_type, expected_info in (
+                (404, json.dumps(info), NotFoundError, info),
+                (409, '{"error": "version_conflict"}', ConflictError,
+                 {"error": "version_conflict"}),
+                (500, "Internal error", TransportError, None),
+                (503, '["unavailable"]', TransportError, ["unavailable"])):
+            self.es_server.status = status
+            self.es_server.response = response
+            with self.assertRaises(exception_type) as error:
+                self._run(self.client.search(index="nodes"))
+            self.assertEqual(error.exception.args[0], status)
+            self.assertEqual(error.exception.info, expected_info)
+
+    @skip_unless_legacy_exceptions
+    def test_error_arguments(self):
+        self.es_server.status = 404
+        self.es_server.response = json.dumps({"error": {"type": "index_not_found_exception"}})
+        with self.assertRaises(NotFoundError) as error:
+            self._run(self.client.search(index="nodes"))
+        self.assertEqual(error.exception.args[:2], (404, "index_not_found_exception"))
+        self.es_server.response = '{"error": "no handler"}'
+        with self.assertRaises(NotFoundError) as error:
+            self._run(self.client.search(index="nodes"))
+        self.assertEqual(error.exception.args[:2], (404, "no handler"))
+
+    def test_ignored_statuses(self):
+        self.es_server.status = 404
+        self.es_server.response = '{"succeeded": true, "num_freed": 0}'
+        response = self._run(self.client.clear_scroll(scroll_id="abc", ignore=(404,)))
+        self.assertEqual(response, {"succeeded": True, "num_freed": 0})
+        request = self._last_request()
+        self.assertEqual((request.method, json.loads(request.body)),
+                         ("DELETE", {"scroll_id": ["abc"]}))
+        with self.assertRaises(NotFoundError):
+            self._run(self.client.clear_scroll(scroll_id="abc"))
+
+    @skip_unless_legacy_exceptions
+    def test_timeout(self):
+        self.client = AsyncElasticsearch("127.0.0.1", self.es_server.server.port, timeout=0.1)
+        self.es_server.delay = 0.5
+        with self.assertRaises(ConnectionTimeout):
+            self._run(self.client.count(index="nodes"))
+
+    @skip_unless_legacy_exceptions
+    def test_connection_error(self):
+        self._run(self.es_server.server.close())
+        with self.assertRaises(ConnectionError):
+            self._run(self.client.count(index="nodes"))
+
+
+if __name__ == '__main__':
+    unittest.main()
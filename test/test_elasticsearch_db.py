@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access.filters import And, Compare, In, Or, StartsWith
+from cortx.utils.data.access import BaseModel
+from cortx.utils.data.db.elasticsearch_db.storage import (ElasticSearchDB,
+                                                          ElasticSearchQueryConverter,
+                                                          ESRefreshPolicy)
+from cortx.utils.errors import DataAccessInternalError
+
+
+class ESNodeModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    status = StringType()
+    counter = IntType()
+
+
+class FakeESIndices:
+
+    def __init__(self, client):
+        self._client = client
+        self._indexes = dict()  # index name -> body of the index creation request
+
+    async def get_alias(self, index, **_kwargs):
+        return {index: dict()} if index in self._indexes else dict()
+
+    async def create(self, index, body):
+        self._indexes[index] = body
+
+    async def get(self, index):
+        return {index: self._indexes[index]}
+
+    async def refresh(self, **kwargs):
+        self._client.calls.append(("indices.refresh", kwargs))
+
+
+class FakeAsyncES:
+    """Asynchronous elasticsearch client which records requests"""
+
+    def __init__(self):
+        self.calls = list()
+        self.indices = FakeESIndices(self)
+
+    async def index(self, **kwargs):
+        self.calls.append(("index", kwargs))
+        return {"result": "created"}
+
+    async def update_by_query(self, **kwargs):
+        self.calls.append(("update_by_query", kwargs))
+        return {"updated": 3}
+
+
+class TestElasticSearchQueryConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.converter = ElasticSearchQueryConverter(ESNodeModel)
+
+    def _build(self, filter_obj):
+        return self.converter.build(filter_obj).to_dict()
+
+    def test_filter_context(self):
+        self.assertEqual(self._build(Compare("status", "=", "OK")),
+                         {"bool": {"filter": [{"term": {"status": "ok"}}]}})
+        self.assertEqual(self._build(Compare(ESNodeModel.counter, "=", "5")),
+                         {"bool": {"filter": [{"term": {"counter": 5}}]}})
+
+    def test_and(self):
+        body = self._build(And(Compare("status", "=", "ok"), Compare("counter", ">", 1)))
+        self.assertEqual(body, {"bool": {"filter": [
+            {"bool": {"filter": [{"term": {"status": "ok"}},
+                                 {"range": {"counter": {"gt": 1}}}]}}]}})
+
+    def test_terms(self):
+        expected = {"bool": {"filter": [{"terms": {"status": ["ok", "failed"]}}]}}
+        self.assertEqual(self._build(In("status", ["OK", "failed"])), expected)
+        self.assertEqual(self._build(Or(Compare("status", "=", "ok"),
+                                        Compare("status", "=", "FAILED"))), expected)
+
+    def test_or_of_different_fields(self):
+        body = self._build(Or(Compare("status", "=", "ok"), Compare("counter", "=", 1)))
+        self.assertEqual(body, {"bool": {"filter": [
+            {"bool": {"should": [{"term": {"status": "ok"}}, {"term": {"counter": 1}}],
+                      "minimum_should_match": 1}}]}})
+
+    def test_prefix(self):
+        self.assertEqual(self._build(StartsWith("node_id", "Node-1")),
+                         {"bool": {"filter": [{"prefix": {"node_id": "node-1"}}]}})
+
+    def test_exists(self):
+        self.assertEqual(self._build(Compare("status", "=", None)),
+                         {"bool": {"filter": [
+                             {"bool": {"must_not": [{"exists": {"field": "status"}}]}}]}})
+        self.assertEqual(self._build(Compare("status", "!=", None)),
+                         {"bool": {"filter": [{"exists": {"field": "status"}}]}})
+
+    def test_wrong_values(self):
+        with self.assertRaises(DataAccessInternalError):
+            self._build(Compare("counter", "=", "many"))
+        with self.assertRaises(DataAccessInternalError):
+            self._build(Compare("counter", ">", None))
+
+
+class ElasticSearchDBTestCase(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.es_client = FakeAsyncES()
+        self.storage = self._create_storage(ESRefreshPolicy.IMMEDIATE)
+
+    def _create_storage(self, refresh_policy, refresh_interval=1.0):
+        storage = ElasticSearchDB(None, ESNodeModel, "nodes", None, self._loop,
+                                  refresh_policy=refresh_policy,
+                                  refresh_interval=refresh_interval,
+                                  async_client=self.es_client)
+        self._loop.run_until_complete(storage.attach_to_index(1))
+        return storage
+
+    def _apis(self):
+        return [api for api, _kwargs in self.es_client.calls]
+
+
+class TestElasticSearchRefreshPolicy(ElasticSearchDBTestCase):
+
+    def _store(self, storage):
+        node = ESNodeModel({"node_id": "node-1", "status": "ok", "counter": 1})
+        self._loop.run_until_complete(storage.store(node))
+
+    def test_immediate(self):
+        self._store(self.storage)
+        self.assertEqual(self._apis(), ["index", "indices.refresh"])
+        self.assertNotIn("refresh", self.es_client.calls[0][1])
+
+    def test_wait_for(self):
+        self._store(self._create_storage(ESRefreshPolicy.WAIT_FOR))
+        self.assertEqual(self._apis(), ["index"])
+        self.assertEqual(self.es_client.calls[0][1]["refresh"], "wait_for")
+
+    def test_none(self):
+        self._store(self._create_storage(ESRefreshPolicy.NONE))
+        self.assertEqual(self._apis(), ["index"])
+        self.assertNotIn("refresh", self.es_client.calls[0][1])
+
+    def test_periodic(self):
+        storage = self._create_storage(ESRefreshPolicy.PERIODIC, 0.05)
+        for _ in range(3):
+            self._store(storage)
+        self.assertEqual(self._apis(), ["index"] * 3)
+        # NOTE: all writes made within refresh interval are made visible by single refresh
+        self._loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(self._apis(), ["index"] * 3 + ["indices.refresh"])
+
+
+class TestElasticSearchUpdate(ElasticSearchDBTestCase):
+
+    def test_update_script_params(self):
+        updated = self._loop.run_until_complete(
+            self.storage.update(Compare("status", "=", "ok"), {"status": "failed",
+                                                               "counter": "5"}))
+        self.assertEqual(updated, 3)
+        api, kwargs = self.es_client.calls[0]
+        self.assertEqual(api, "update_by_query")
+        self.assertEqual(kwargs["body"], {
+            "query": {"bool": {"filter": [{"term": {"status": "ok"}}]}},
+            "script": {
+                "source": "ctx._source['counter'] = params['counter']; "
+                          "ctx._source['status'] = params['status'];",
+                "lang": "painless",
+                "params": {"status": "failed", "counter": 5}}})
+        self.assertEqual(self._apis(), ["update_by_query", "indices.refresh"])
+
+    def test_update_script_source_is_shared(self):
+        for counter in range(3):
+            self._loop.run_until_complete(
+                self.storage.update(Compare("status", "=", "ok"), {"counter": counter}))
+        scripts = [kwargs["body"]["script"] for api, kwargs in self.es_client.calls
+                   if api == "update_by_query"]
+        self.assertEqual(set(script["source"] for script in scripts),
+                         {"ctx._source['counter'] = params['counter'];"})
+        self.assertEqual([script["params"] for script in scripts],
+                         [{"counter": 0}, {"counter": 1}, {"counter": 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, compile_filter
+from cortx.utils.data.access.filters import And, Or, Compare, StartsWith, In
+from cortx.utils.errors import DataAccessInternalError
+
+
+class FilterCompilerModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    status = StringType()
+    size = IntType()
+
+
+NODES = [FilterCompilerModel({"node_id": f"node-{i}", "status": "ok" if i % 2 else "failed",
+                              "size": i}) for i in range(10)]
+
+
+class TestFilterCompiler(unittest.TestCase):
+
+    def _filter(self, filter_obj):
+        predicate = compile_filter(FilterCompilerModel, filter_obj)
+        return [node.size for node in NODES if predicate(node)]
+
+    def test_compare(self):
+        self.assertEqual(self._filter(Compare(FilterCompilerModel.size, ">", 7)), [8, 9])
+        self.assertEqual(self._filter(Compare("size", "<=", 1)), [0, 1])
+        self.assertEqual(self._filter(Compare("size", "!=", 0)), list(range(1, 10)))
+        self.assertEqual(self._filter(Compare("node_id", "like", "-3")), [3])
+        self.assertEqual(self._filter(StartsWith("node_id", "node-1")), [1])
+
+    def test_constants_are_converted(self):
+        self.assertEqual(self._filter(Compare("size", "=", "5")), [5])
+
+    def test_logical_operations(self):
+        filter_obj = Or(And(Compare("status", "=", "ok"), Compare("size", "<", 4)),
+                        Compare("size", "=", 8))
+        self.assertEqual(self._filter(filter_obj), [1, 3, 8])
+
+    def test_absent_value(self):
+        node = FilterCompilerModel({"node_id": "node"})
+        self.assertFalse(compile_filter(FilterCompilerModel, Compare("size", ">", 1))(node))
+        self.assertTrue(compile_filter(FilterCompilerModel, Compare("size", "=", None))(node))
+
+    def test_cache(self):
+        first = compile_filter(FilterCompilerModel, Compare("size", ">", 1))
+        second = compile_filter(FilterCompilerModel, Compare(FilterCompilerModel.size, ">", 1))
+        self.assertIs(first, second)
+        self.assertIsNot(first, compile_filter(FilterCompilerModel, Compare("size", ">", 2)))
+
+    def test_value_getter(self):
+        predicate = compile_filter(FilterCompilerModel, Compare("size", ">=", 2),
+                                   lambda obj, field: obj[field])
+        self.assertTrue(predicate({"size": 3}))
+        self.assertFalse(predicate({"size": 1}))
+
+    def test_wrong_field(self):
+        with self.assertRaises(DataAccessInternalError):
+            compile_filter(FilterCompilerModel, Compare("unknown", "=", 1))
+
+    def test_in(self):
+        self.assertEqual(self._filter(In(FilterCompilerModel.size, [7, "2", None, 12])), [2, 7])
+        self.assertEqual(self._filter(Compare("node_id", "in", ["node-1", "Node-3"])), [1])
+        self.assertEqual(self._filter(In("size", [])), [])
+        self.assertIs(compile_filter(FilterCompilerModel, In("size", [1, 2])),
+                      compile_filter(FilterCompilerModel, In("size", (1, 2))))
+        with self.assertRaises(DataAccessInternalError):
+            compile_filter(FilterCompilerModel, Compare("size", "in", 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
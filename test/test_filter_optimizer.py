@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, FilterOptimizer, is_contradiction
+from cortx.utils.data.access.filters import (And, Or, Compare, StartsWith, In,
+                                             FilterOperationAnd, FilterOperationOr,
+                                             ComparisonOperation)
+
+
+class FilterOptimizerModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    status = StringType()
+    size = IntType()
+
+
+class TestFilterOptimizer(unittest.TestCase):
+    _optimizer = FilterOptimizer(FilterOptimizerModel, ["node_id", "status"])
+
+    def _leaves(self, filter_obj):
+        return [(leaf.get_left_operand() if isinstance(leaf.get_left_operand(), str)
+                 else leaf.get_left_operand().name, leaf.get_operation().value,
+                 leaf.get_right_operand()) for leaf in filter_obj.get_operands()
+                if not isinstance(leaf, (FilterOperationAnd, FilterOperationOr))]
+
+    def test_flatten_and_duplicates(self):
+        filter_obj = self._optimizer.optimize(
+            And(And(Compare("size", ">", 1), Compare("status", "=", "ok")),
+                Compare("status", "=", "ok"), Or(Compare("size", "=", 1),
+                                                 Or(Compare("size", "=", 2),
+                                                    Compare("size", "=", 1)))))
+        self.assertIsInstance(filter_obj, FilterOperationAnd)
+        self.assertEqual(self._leaves(filter_obj)[:2], [("status", "=", "ok"), ("size", ">", 1)])
+        nested = filter_obj.get_operands()[2]
+        self.assertIsInstance(nested, FilterOperationOr)
+        self.assertEqual(self._leaves(nested), [("size", "=", 1), ("size", "=", 2)])
+
+    def test_ranges_are_merged(self):
+        filter_obj = self._optimizer.optimize(
+            And(Compare("size", ">", 1), Compare("size", ">=", 3), Compare("size", "<", 8),
+                Compare("size", "<=", 9)))
+        self.assertEqual(self._leaves(filter_obj), [("size", ">=", 3), ("size", "<", 8)])
+
+        filter_obj = self._optimizer.optimize(And(Compare("size", ">=", 3),
+                                                  Compare("size", "<=", "3")))
+        self.assertEqual(filter_obj.get_operation(), ComparisonOperation.OPERATION_EQ)
+
+    def test_contradictions(self):
+        for filter_obj in (And(Compare("size", ">", 5), Compare("size", "<", 5)),
+                           And(Compare("size", "=", 1), Compare("size", "=", 2)),
+                           And(Compare("size", "=", 1), Compare("size", ">", 1)),
+                           Or(And(Compare("size", ">=", 5), Compare("size", "<", 5)),
+                              And(Compare("size", "=", 1), Compare("size", "=", 2))),
+                           And(In("node_id", []), Compare("size", "=", 1))):
+            self.assertTrue(is_contradiction(self._optimizer.optimize(filter_obj)))
+
+        filter_obj = self._optimizer.optimize(
+            Or(And(Compare("size", ">", 5), Compare("size", "<", 5)), Compare("size", "=", 2)))
+        self.assertEqual(filter_obj.get_right_operand(), 2)
+
+    def test_key_fields_first(self):
+        filter_obj = self._optimizer.optimize(
+            And(Compare("size", ">", 1), Compare("status", "=", "ok"),
+                StartsWith("node_id", "node")))
+        self.assertEqual([leaf[0] for leaf in self._leaves(filter_obj)],
+                         ["node_id", "status", "size"])
+
+
+if __name__ == '__main__':
+    unittest.main()
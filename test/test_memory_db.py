@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType, ListType
+from cortx.utils.data.access import BaseModel, ExtQuery, Query, SortOrder
+from cortx.utils.data.access.filters import (And, Compare, ComparisonOperation, In, Or,
+                                             StartsWith)
+from cortx.utils.data.db.db_provider import ModelSettings
+from cortx.utils.data.db.memory_db import MemoryDB
+from cortx.utils.errors import DataAccessInternalError
+
+
+class DiskModel(BaseModel):
+    _id = "disk_id"
+    disk_id = StringType()
+    node = StringType()
+    label = StringType()
+    capacity = IntType()
+    tags = ListType(StringType)
+
+
+LABELS = ["Data", "data", None, "boot", "Backup", "swap"]
+
+
+def make_disk(i: int, capacity: int = None) -> DiskModel:
+    return DiskModel({"disk_id": f"disk-{i}", "node": f"node-{i % 2}", "label": LABELS[i % 6],
+                      "capacity": i * 10 if capacity is None else capacity,
+                      "tags": [f"slot-{i}"]})
+
+
+def disk_ids(*numbers) -> set:
+    return {f"disk-{i}" for i in numbers}
+
+
+class TestMemoryDB(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        model_settings = ModelSettings({"collection": "disks", "indexes": ["node"],
+                                        "sorted_indexes": ["capacity", "label"]})
+        self.storage = self._run(MemoryDB.create_database(None, "disks", DiskModel,
+                                                          model_settings))
+        self._run(self.storage.store_many(make_disk(i) for i in range(6)))
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def _numbers(self, query):
+        return [obj.capacity // 10 for obj in self._run(self.storage.get(query))]
+
+    def test_wrong_indexes(self):
+        with self.assertRaises(DataAccessInternalError):
+            MemoryDB(DiskModel, "disks", ["serial"])
+        with self.assertRaises(DataAccessInternalError):
+            MemoryDB(DiskModel, "disks", sorted_indexes=["tags"])
+
+    def test_objects_are_copies(self):
+        disk = make_disk(7)
+        self._run(self.storage.store(disk))
+        disk.capacity = 1
+        found = self._run(self.storage.get_by_id("disk-7"))
+        self.assertEqual(found.capacity, 70)
+        found.tags.append("slot-0")
+        self.assertEqual(self._run(self.storage.get_by_id("disk-7")).tags, ["slot-7"])
+
+    def test_index_planning(self):
+        lookup = self.storage.lookup
+        # NOTE: primary key and hash index serve equality only
+        self.assertEqual(lookup("disk_id", ComparisonOperation.OPERATION_EQ, "disk-3"),
+                         disk_ids(3))
+        self.assertEqual(lookup("disk_id", ComparisonOperation.OPERATION_IN,
+                                ["disk-1", "disk-9"]), disk_ids(1))
+        self.assertEqual(lookup("node", ComparisonOperation.OPERATION_EQ, "node-1"),
+                         disk_ids(1, 3, 5))
+        self.assertIsNone(lookup("node", ComparisonOperation.OPERATION_GT, "node-0"))
+        self.assertIsNone(lookup("node", ComparisonOperation.OPERATION_STARTS_WITH, "node"))
+        # NOTE: sorted index serves ranges of not string values, string values are indexed
+        #  lowered, so their lookups return candidates for the filter check
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_GEQ, "30"),
+                         disk_ids(3, 4, 5))
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_LT, 20),
+                         disk_ids(0, 1))
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_EQ, "data"),
+                         disk_ids(0, 1))
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_STARTS_WITH, "B"),
+                         disk_ids(3, 4))
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_EQ, None), disk_ids(2))
+        self.assertIsNone(lookup("label", ComparisonOperation.OPERATION_GT, "a"))
+        self.assertIsNone(lookup("tags", ComparisonOperation.OPERATION_EQ, "slot-1"))
+
+        planner = self.storage._planner
+        self.assertEqual(planner.build(And(Compare("node", "=", "node-1"),
+                                           Compare("capacity", ">", 10))), disk_ids(3, 5))
+        self.assertEqual(planner.build(Or(Compare("node", "=", "node-0"),
+                                          In("label", ["swap"]))), disk_ids(0, 2, 4, 5))
+        self.assertIsNone(planner.build(Or(Compare("node", "=", "node-0"),
+                                           Compare("tags", "like", "slot"))))
+
+        self.assertEqual(self._numbers(Query().filter_by(Compare("label", "=", "data"))), [1])
+        self.assertEqual(self._numbers(Query().filter_by(StartsWith("label", "b"))), [3])
+        self.assertEqual(self._numbers(Query().filter_by(
+            And(Compare("node", "=", "node-0"), Compare("capacity", "<=", 40),
+                Compare("label", "!=", None)))), [0, 4])
+
+    def test_index_maintenance(self):
+        lookup = self.storage.lookup
+        self.assertEqual(self._run(self.storage.update(Compare("node", "=", "node-1"),
+                                                       {"node": "node-2", "capacity": 5,
+                                                        "label": "Swap"})), 3)
+        self.assertEqual(lookup("node", ComparisonOperation.OPERATION_EQ, "node-1"), set())
+        self.assertEqual(lookup("node", ComparisonOperation.OPERATION_EQ, "node-2"),
+                         disk_ids(1, 3, 5))
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_LT, 10),
+                         disk_ids(0, 1, 3, 5))
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_GT, 35),
+                         disk_ids(4))
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_EQ, "swap"),
+                         disk_ids(1, 3, 5))
+
+        # NOTE: stored object replaces the values of the previous version in the indexes
+        self._run(self.storage.store(make_disk(4, capacity=7)))
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_GT, 35), set())
+        self.assertEqual(self._numbers(Query().filter_by(Compare("capacity", "=", 7))), [0])
+
+        self.assertEqual(self._run(self.storage.delete(Compare("node", "=", "node-2"))), 3)
+        self.assertTrue(self._run(self.storage.delete_by_id("disk-2")))
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_EQ, "swap"), set())
+        self.assertEqual(lookup("label", ComparisonOperation.OPERATION_EQ, None), set())
+        self.assertEqual(lookup("capacity", ComparisonOperation.OPERATION_GEQ, 0),
+                         disk_ids(0, 4))
+        self.assertEqual(self._run(self.storage.count(Compare("node", "=", "node-0"))), 2)
+
+    def _count_index_groups(self, field):
+        index = self.storage._sorted_indexes[field]
+        iter_groups = index.iter_groups
+        groups = list()
+
+        def _counting_iter_groups(descending):
+            for group in iter_groups(descending):
+                groups.append(group)
+                yield group
+
+        index.iter_groups = _counting_iter_groups
+        return groups
+
+    def test_top_k_stops_early(self):
+        self._run(self.storage.store_many(make_disk(i) for i in range(6, 100)))
+        groups = self._count_index_groups("capacity")
+
+        query = Query().order_by(DiskModel.capacity).limit(3)
+        self.assertEqual(self._numbers(query), [0, 1, 2])
+        self.assertEqual(len(groups), 3)
+
+        groups.clear()
+        query = Query().filter_by(Compare("node", "=", "node-1")).order_by(
+            DiskModel.capacity, SortOrder.DESC).offset(2).limit(2)
+        self.assertEqual(self._numbers(query), [95, 93])
+        # NOTE: capacities from 990 down to 930 are checked to find 4 disks of node-1
+        self.assertEqual(len(groups), 7)
+
+        # NOTE: the index is not used if candidates found by other indexes are few
+        groups.clear()
+        query = Query().filter_by(In("disk_id", ["disk-5", "disk-50"])).order_by(
+            DiskModel.capacity).limit(5)
+        self.assertEqual(self._numbers(query), [5, 50])
+        self.assertEqual(groups, [])
+
+    def test_index_ordering_matches_sort(self):
+        plain_storage = MemoryDB(DiskModel, "disks")
+        self._run(plain_storage.store_many(make_disk(i) for i in range(6)))
+        groups = self._count_index_groups("label")
+        for order in (SortOrder.ASC, SortOrder.DESC):
+            query = Query().order_by(DiskModel.label, order).order_by(DiskModel.capacity)
+            query.limit(4)
+            expected = [obj.disk_id for obj in self._run(plain_storage.get(query))]
+            found = [obj.disk_id for obj in self._run(self.storage.get(query))]
+            self.assertEqual(found, expected)
+        self.assertTrue(groups)
+        # NOTE: objects without value follow all other objects in any direction
+        self.assertEqual(expected[-1], "disk-3")
+
+    def test_index_results_keep_insertion_order(self):
+        storage = MemoryDB(DiskModel, "disks", ["node"], ["capacity"])
+        order = [7, 2, 9, 0, 5, 3, 8, 1, 6, 4]
+        self._run(storage.store_many(make_disk(i) for i in order))
+        found = self._run(storage.get(Query().filter_by(Compare("node", "=", "node-0"))))
+        self.assertEqual([obj.capacity // 10 for obj in found], [i for i in order if i % 2 == 0])
+        found = self._run(storage.get(Query().filter_by(Compare("capacity", ">", 30)).limit(3)))
+        self.assertEqual([obj.capacity // 10 for obj in found], [7, 9, 5])
+
+    def test_aggregations_use_indexes(self):
+        ext_query = ExtQuery().filter_by(Compare("node", "=", "node-1")).aggregate(
+            DiskModel.capacity)
+        self.assertEqual(self._run(self.storage.sum(ext_query)), 90)
+        ext_query = ExtQuery().filter_by(Compare("capacity", ">", 0)).group_by(DiskModel.label)
+        # NOTE: objects without value of the group field are not counted
+        self.assertEqual(self._run(self.storage.count_by_query(ext_query)),
+                         {"data": 1, "boot": 1, "Backup": 1, "swap": 1})
+        ext_query = ExtQuery().filter_by(And(Compare("capacity", ">", 10),
+                                             Compare("capacity", "<", 10))).aggregate("capacity")
+        self.assertIsNone(self._run(self.storage.max(ext_query)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import random
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, Query, SortOrder
+from cortx.utils.data.db.ordering import make_position_key, make_sort_key, select_ordered
+
+
+class OrderModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    severity = StringType()
+    size = IntType()
+
+
+class TestMultiKeyOrdering(unittest.TestCase):
+
+    def setUp(self):
+        self.objects = [
+            OrderModel({"node_id": f"node-{i}", "severity": severity, "size": i % 4})
+            for i, severity in enumerate(["b", "A", "a", "C", "b", None, "c", "B"])]
+        random.Random(1).shuffle(self.objects)
+
+    def test_mixed_directions(self):
+        keys = [("severity", SortOrder.ASC), ("size", SortOrder.DESC)]
+        ordered = select_ordered(self.objects, make_sort_key(OrderModel, keys))
+        self.assertEqual([(obj.severity, obj.size) for obj in ordered],
+                         [("a", 2), ("A", 1), ("B", 3), ("b", 0), ("b", 0), ("C", 3), ("c", 2),
+                          (None, 1)])
+
+    def test_top_k_matches_full_sort(self):
+        keys = [("size", SortOrder.DESC), ("node_id", SortOrder.ASC)]
+        sort_key = make_sort_key(OrderModel, keys)
+        expected = sorted(self.objects, key=sort_key)
+        self.assertEqual(select_ordered(self.objects, sort_key, offset=2, limit=3), expected[2:5])
+        self.assertEqual(select_ordered(self.objects, sort_key, limit=1), expected[:1])
+
+    def test_position_key(self):
+        keys = [("size", SortOrder.DESC), ("node_id", SortOrder.DESC)]
+        sort_key = make_sort_key(OrderModel, keys)
+        position = make_position_key(OrderModel, keys, [2, "node-6"])
+        following = [obj.node_id for obj in sorted(self.objects, key=sort_key)
+                     if position < sort_key(obj)]
+        self.assertEqual(following, ["node-2", "node-5", "node-1", "node-4", "node-0"])
+
+
+class TestQuerySortKeys(unittest.TestCase):
+
+    def test_chained_order_by(self):
+        query = Query().order_by(OrderModel.severity, SortOrder.DESC).order_by(OrderModel.size)
+        self.assertEqual(query.data.get_sort_keys(),
+                         [("severity", SortOrder.DESC), ("size", SortOrder.ASC)])
+        self.assertEqual(query.data.order_by.field, OrderModel.severity)
+        self.assertEqual(query.data.get_keyset("node_id"),
+                         [("severity", SortOrder.DESC), ("size", SortOrder.ASC),
+                          ("node_id", SortOrder.ASC)])
+
+    def test_json_round_trip(self):
+        query = Query().order_by(OrderModel.severity, SortOrder.DESC).order_by("size")
+        restored = Query.from_json(query.to_json())
+        self.assertEqual(restored.to_primitive()["order_by"], [["severity", "desc"],
+                                                               ["size", "asc"]])
+        self.assertEqual(restored, query)
+        single = Query().order_by(OrderModel.size)
+        self.assertEqual(single.to_primitive()["order_by"], ["size", "asc"])
+        self.assertEqual(Query.from_json(single.to_json()), single)
+
+
+if __name__ == '__main__':
+    unittest.main()
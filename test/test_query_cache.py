@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, Query
+from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.db.query_cache import StorageReadCache, TTLCache
+
+
+class CacheModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    size = IntType()
+
+
+class IntKeyModel(BaseModel):
+    _id = "key"
+    key = IntType()
+    size = IntType()
+
+
+class CountingStorage:
+
+    def __init__(self):
+        self.objects = {f"node-{i}": CacheModel({"node_id": f"node-{i}", "size": i})
+                        for i in range(5)}
+        self.calls = 0
+
+    async def get(self, query):
+        self.calls += 1
+        return list(self.objects.values())
+
+    async def get_by_id(self, obj_id):
+        self.calls += 1
+        return self.objects.get(obj_id)
+
+    async def get_many_by_id(self, obj_ids):
+        self.calls += 1
+        return {obj_id: self.objects[obj_id] for obj_id in obj_ids if obj_id in self.objects}
+
+    async def count(self, filter_obj=None):
+        self.calls += 1
+        return len(self.objects)
+
+    async def store(self, obj):
+        self.objects[obj.primary_key_val] = obj
+
+    async def delete_by_id(self, obj_id):
+        return self.objects.pop(obj_id, None) is not None
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = TTLCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_expiration(self):
+        now = [0.0]
+        cache = TTLCache(10, ttl=5.0, clock=lambda: now[0])
+        cache.put("a", 1)
+        now[0] = 4.0
+        self.assertEqual(cache.get("a"), 1)
+        now[0] = 5.0
+        self.assertIsNone(cache.get("a"))
+
+
+class TestStorageReadCache(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.storage = CountingStorage()
+        self.cache = StorageReadCache(CacheModel, 100)
+
+    def _call(self, call_name, *args, **kwargs):
+        storage_call = getattr(self.storage, call_name)
+        return self._loop.run_until_complete(
+            self.cache.call(call_name, storage_call, *args, **kwargs))
+
+    def test_repeated_reads_are_cached(self):
+        self._call("get", Query().filter_by(Compare(CacheModel.size, ">", 1)))
+        self._call("get", Query().filter_by(Compare("size", ">", 1)))
+        self._call("count")
+        self._call("count", filter_obj=None)
+        self._call("get_by_id", "node-1")
+        self._call("get_by_id", obj_id="node-1")
+        self.assertEqual(self.storage.calls, 3)
+
+    def test_missing_object_is_cached(self):
+        self.assertIsNone(self._call("get_by_id", "node-9"))
+        self.assertIsNone(self._call("get_by_id", "node-9"))
+        self.assertEqual(self.storage.calls, 1)
+
+    def test_store_invalidates_affected_entries(self):
+        self._call("get_by_id", "node-1")
+        self._call("get_by_id", "node-2")
+        self._call("count")
+        self._call("store", CacheModel({"node_id": "node-7", "size": 7}))
+        self.assertEqual(self._call("count"), 6)
+        self._call("get_by_id", "node-1")
+        self.assertEqual(self.storage.calls, 4)
+        self.assertEqual(self._call("get_by_id", "node-7").size, 7)
+
+    def test_delete_by_id_invalidates_object(self):
+        self._call("get_by_id", "node-1")
+        self.assertTrue(self._call("delete_by_id", "node-1"))
+        self.assertIsNone(self._call("get_by_id", "node-1"))
+
+    def test_cached_list_is_not_shared(self):
+        query = Query()
+        result = self._call("get", query)
+        result.clear()
+        self.assertEqual(len(self._call("get", query)), 5)
+        self.assertEqual(self.storage.calls, 1)
+
+    def test_cached_objects_are_not_shared(self):
+        self._call("get_by_id", "node-1")
+        self._call("get", Query())
+        self._call("get_by_id", "node-1").size = 100
+        self._call("get", Query())[1].size = 100
+        self.assertEqual(self._call("get_by_id", "node-1").size, 1)
+        self.assertEqual(self._call("get", Query())[1].size, 1)
+        self.assertEqual(self.storage.calls, 2)
+
+    def test_ids_are_converted(self):
+        storage = CountingStorage()
+        storage.objects = {5: IntKeyModel({"key": 5, "size": 5})}
+        cache = StorageReadCache(IntKeyModel, 100)
+
+        def _call(call_name, *args):
+            return self._loop.run_until_complete(
+                cache.call(call_name, getattr(storage, call_name), *args))
+
+        storage.get_by_id = lambda obj_id: CountingStorage.get_by_id(storage, int(obj_id))
+        self.assertEqual(_call("get_by_id", "5").size, 5)
+        _call("store", IntKeyModel({"key": 5, "size": 6}))
+        self.assertEqual(_call("get_by_id", "5").size, 6)
+        self.assertEqual(_call("get_by_id", 5).size, 6)
+        self.assertEqual(storage.calls, 2)
+
+    def test_many_by_id(self):
+        self.assertEqual(set(self._call("get_many_by_id", ["node-1", "node-9", "node-2"])),
+                         {"node-1", "node-2"})
+        result = self._call("get_many_by_id", ("node-2", "node-1", "node-9"))
+        result.clear()
+        self.assertEqual(len(self._call("get_many_by_id", obj_ids={"node-1", "node-2"})), 2)
+        self.assertEqual(self.storage.calls, 2)
+        self._call("get_many_by_id", iter(["node-1"]))
+        self.assertEqual(self.storage.calls, 3)
+        self._call("store", CacheModel({"node_id": "node-9", "size": 9}))
+        self.assertEqual(len(self._call("get_many_by_id", ["node-1", "node-9"])), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
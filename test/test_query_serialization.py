@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from schematics.types import StringType, IntType, DateTimeType
+from cortx.utils.data.access import BaseModel, Query, ExtQuery, SortOrder, IFilter
+from cortx.utils.data.access.filters import And, Or, Compare, FilterOperationCompare
+from cortx.utils.errors import MalformedQueryError
+
+
+class QueryModel(BaseModel):
+    _id = "event_id"
+    event_id = StringType()
+    severity = IntType()
+    created_time = DateTimeType()
+
+
+class TestFilterValueObject(unittest.TestCase):
+
+    def test_structural_equality(self):
+        first = And(Compare(QueryModel.severity, ">", 1),
+                    Or(Compare("event_id", "=", "a"), Compare("event_id", "=", "b")))
+        second = And(Or(Compare("event_id", "=", "b"), Compare(QueryModel.event_id, "=", "a")),
+                     Compare("severity", ">", 1))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertEqual(len({first, second}), 1)
+
+    def test_constants_are_distinguished(self):
+        self.assertNotEqual(Compare("severity", "=", 1), Compare("severity", "=", "1"))
+        self.assertNotEqual(Compare("severity", "=", 1), Compare("severity", "=", True))
+        self.assertNotEqual(Compare("severity", "=", 1), Compare("severity", ">", 1))
+
+    def test_immutable(self):
+        leaf = Compare("severity", "=", 1)
+        with self.assertRaises(AttributeError):
+            leaf.right_operand = 2
+
+    def test_json_round_trip(self):
+        created_time = datetime(2020, 10, 1, 12, 30)
+        filter_obj = Or(And(Compare(QueryModel.severity, "<=", 3),
+                            Compare(QueryModel.created_time, ">", created_time)),
+                        Compare("event_id", "like", "disk"))
+        restored = IFilter.from_json(filter_obj.to_json())
+        self.assertEqual(restored, filter_obj)
+        self.assertEqual(restored.get_operands()[0].get_operands()[1].get_right_operand(),
+                         created_time)
+        self.assertIsInstance(restored.get_operands()[1], FilterOperationCompare)
+
+    def test_dates_round_trip(self):
+        for value in (datetime(999, 1, 1), datetime.min, date(5, 3, 1),
+                      datetime(2020, 10, 1, 12, 30, tzinfo=timezone.utc),
+                      datetime(999, 1, 1, 0, 0, 0, 5, tzinfo=timezone(timedelta(hours=-5)))):
+            filter_obj = Compare(QueryModel.created_time, ">", value)
+            restored = IFilter.from_json(filter_obj.to_json())
+            restored_value = restored.get_right_operand()
+            self.assertEqual(restored_value, value)
+            self.assertIs(type(restored_value), type(value))
+            if isinstance(value, datetime):
+                self.assertEqual(restored_value.utcoffset(), value.utcoffset())
+
+    def test_invalid_datetime(self):
+        with self.assertRaises(MalformedQueryError):
+            IFilter.from_json('[">", "created_time", {"$datetime": "yesterday"}]')
+
+
+class TestQueryValueObject(unittest.TestCase):
+
+    def test_equality(self):
+        first = Query().filter_by(Compare(QueryModel.severity, ">", 1)).order_by(
+            QueryModel.created_time, SortOrder.DESC).limit(10)
+        second = Query(limit=10).filter_by(Compare("severity", ">", 1)).order_by(
+            "created_time", SortOrder.DESC)
+        self.assertEqual(first, second)
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertNotEqual(first, Query().filter_by(Compare("severity", ">", 1)))
+        self.assertNotEqual(Query(), ExtQuery())
+
+    def test_json_round_trip(self):
+        query = Query().filter_by(Compare(QueryModel.severity, ">", 1)).order_by(
+            QueryModel.created_time, SortOrder.DESC).limit(10).offset(20)
+        restored = Query.from_json(query.to_json())
+        self.assertEqual(restored, query)
+        self.assertEqual(restored.data.order_by.order, SortOrder.DESC)
+        self.assertEqual(restored.data.offset, 20)
+
+        ext_query = ExtQuery().group_by(QueryModel.severity).limit(5)
+        restored = ExtQuery.from_json(ext_query.to_json())
+        self.assertEqual(restored, ext_query)
+        self.assertEqual(restored.data.group_by, "severity")
+
+
+class TestQueryCursor(unittest.TestCase):
+
+    def test_keyset(self):
+        self.assertEqual(Query().after().data.get_keyset("event_id"),
+                         [("event_id", SortOrder.ASC)])
+        query = Query().order_by(QueryModel.created_time, SortOrder.DESC).after()
+        self.assertEqual(query.data.get_keyset("event_id"),
+                         [("created_time", SortOrder.DESC), ("event_id", SortOrder.DESC)])
+
+    def test_cursor_round_trip(self):
+        obj = QueryModel({"event_id": "a1", "severity": 2,
+                          "created_time": datetime(2020, 10, 1, 12, 30)})
+        query = Query().order_by(QueryModel.created_time).limit(10).after()
+        self.assertIsNone(query.data.get_cursor_values("event_id"))
+        query.after(query.cursor_of(obj))
+        self.assertEqual(query.data.get_cursor_values("event_id"),
+                         ["2020-10-01T12:30:00.000000", "a1"])
+        restored = Query.from_json(query.to_json())
+        self.assertEqual(restored, query)
+
+    def test_invalid_cursor(self):
+        obj = QueryModel({"event_id": "a1", "severity": 2})
+        cursor = Query().order_by(QueryModel.severity).cursor_of(obj)
+        with self.assertRaises(MalformedQueryError):
+            Query().after(cursor).data.get_cursor_values("event_id")
+        with self.assertRaises(MalformedQueryError):
+            Query().after("not a cursor").data.get_cursor_values("event_id")
+        with self.assertRaises(MalformedQueryError):
+            Query().offset(10).after(cursor).data.get_cursor_values("event_id")
+
+
+class TestQueryProjection(unittest.TestCase):
+
+    def test_projection(self):
+        self.assertIsNone(Query().data.get_projection(QueryModel))
+        query = Query().select(QueryModel.severity, "event_id")
+        self.assertEqual(query.data.get_projection(QueryModel), ["severity", "event_id"])
+        query = Query().select("severity").order_by(QueryModel.created_time).after()
+        self.assertEqual(query.data.get_projection(QueryModel),
+                         ["severity", "event_id", "created_time"])
+
+    def test_unknown_field(self):
+        with self.assertRaises(MalformedQueryError):
+            Query().select("weight").data.get_projection(QueryModel)
+
+    def test_json_round_trip(self):
+        query = Query().select(QueryModel.severity).limit(5)
+        restored = Query.from_json(query.to_json())
+        self.assertEqual(restored.data.fields, ["severity"])
+        self.assertEqual(restored, query)
+        self.assertNotEqual(query, Query().limit(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
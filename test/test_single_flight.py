@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from cortx.utils.data.access import Query
+from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.db.single_flight import SingleFlight
+from cortx.utils.errors import DataAccessExternalError
+
+
+class SlowStorage:
+
+    def __init__(self):
+        self.calls = 0
+        self.version = 0
+        self.fail = False
+
+    async def get(self, query):
+        self.calls += 1
+        version = self.version
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise DataAccessExternalError("Storage is not available")
+        return [version]
+
+    async def store(self, obj):
+        self.version += 1
+
+
+class TestSingleFlight(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.storage = SlowStorage()
+        self.single_flight = SingleFlight()
+
+    def _get(self, query):
+        return self.single_flight.call("get", self.storage.get, query)
+
+    def _gather(self, *calls):
+        return self._loop.run_until_complete(
+            asyncio.gather(*calls, return_exceptions=True))
+
+    def test_identical_calls_are_coalesced(self):
+        results = self._gather(*(self._get(Query().filter_by(Compare("status", "=", "ok")))
+                                 for _ in range(5)),
+                               self._get(Query().filter_by(Compare("status", "=", "failed"))))
+        self.assertEqual(self.storage.calls, 2)
+        self.assertEqual(results[:5], [[0]] * 5)
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(self.single_flight.get_stats(),
+                         {"calls": 6, "coalesced": 4, "in_flight": 0})
+
+    def test_exception_is_shared(self):
+        self.storage.fail = True
+        results = self._gather(self._get(Query()), self._get(Query()))
+        self.assertEqual(self.storage.calls, 1)
+        self.assertTrue(all(isinstance(result, DataAccessExternalError) for result in results))
+
+    def test_reads_after_write_are_not_joined(self):
+        async def _read_write_read():
+            first = asyncio.ensure_future(self._get(Query()))
+            while not self.storage.calls:
+                await asyncio.sleep(0)
+            await self.single_flight.call("store", self.storage.store, None)
+            after_write = await self._get(Query())
+            return await first, after_write
+
+        before, after = self._loop.run_until_complete(_read_write_read())
+        self.assertEqual(before, [0])
+        self.assertEqual(after, [1])
+        self.assertEqual(self.storage.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from schematics.types import StringType, IntType, BooleanType, DateTimeType, ListType
+from cortx.utils.data.access import BaseModel, ExtQuery, Query, SortOrder
+from cortx.utils.data.access.filters import And, Compare, In, Or, StartsWith
+from cortx.utils.data.db.db_provider import DBSettings, ModelSettings
+from cortx.utils.data.db.sqlite_db import SQLiteDB
+from cortx.utils.errors import DataAccessInternalError
+
+
+class SQLiteAlertModel(BaseModel):
+    _id = "alert_id"
+    alert_id = StringType()
+    severity = StringType()
+    size = IntType()
+    resolved = BooleanType()
+    created_time = DateTimeType()
+    tags = ListType(StringType)
+
+
+START_TIME = datetime(2020, 1, 1)
+
+
+def make_alert(i: int, severity: str) -> SQLiteAlertModel:
+    return SQLiteAlertModel({"alert_id": f"alert-{i}", "severity": severity, "size": i,
+                             "resolved": i % 2 == 0, "tags": [f"tag-{i}"],
+                             "created_time": START_TIME + timedelta(hours=i)})
+
+
+class TestSQLiteDB(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        config = DBSettings({"path": os.path.join(self._dir.name, "storage.db")})
+        model_settings = ModelSettings({"collection": "alerts", "indexes": ["severity"]})
+        self.storage = self._run(SQLiteDB.create_database(config, "alerts", SQLiteAlertModel,
+                                                          model_settings))
+        severities = ["critical", "warning", "Warning", None, "info", "warning"]
+        result = self._run(self.storage.store_many(
+            make_alert(i, severity) for i, severity in enumerate(severities)))
+        self.assertTrue(result.ok)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def _ids(self, query):
+        return [obj.size for obj in self._run(self.storage.get(query))]
+
+    def test_round_trip(self):
+        alert = self._run(self.storage.get_by_id("alert-3"))
+        self.assertEqual(alert.to_primitive(), make_alert(3, None).to_primitive())
+        self.assertIs(alert.resolved, False)
+        self.assertIsNone(self._run(self.storage.get_by_id("alert-9")))
+
+    def test_filters(self):
+        self.assertEqual(self._ids(Query().filter_by(Compare("severity", "=", "warning"))),
+                         [1, 5])
+        self.assertEqual(self._ids(Query().filter_by(Compare("severity", "!=", "warning"))),
+                         [0, 2, 3, 4])
+        self.assertEqual(self._ids(Query().filter_by(
+            Or(Compare("size", ">=", 4), And(Compare("resolved", "=", True),
+                                             Compare("created_time", "<", START_TIME
+                                                     + timedelta(hours=1)))))), [0, 4, 5])
+        self.assertEqual(self._ids(Query().filter_by(In("severity", ["info", "critical"]))),
+                         [0, 4])
+        self.assertEqual(self._ids(Query().filter_by(StartsWith("alert_id", "alert-1"))), [1])
+        self.assertEqual(self._ids(Query().filter_by(Compare("severity", "like", "arn"))),
+                         [1, 2, 5])
+        self.assertEqual(self._ids(Query().filter_by(Compare("severity", "like", "ARN"))), [])
+        self.assertEqual(self._ids(Query().filter_by(Compare("severity", "like", "%"))), [])
+        with self.assertRaises(DataAccessInternalError):
+            self._run(self.storage.get(Query().filter_by(Compare("weight", "=", 1))))
+
+    def test_ordering_and_paging(self):
+        query = Query().order_by(SQLiteAlertModel.severity, SortOrder.DESC)
+        query.order_by(SQLiteAlertModel.size)
+        self.assertEqual(self._ids(query), [1, 2, 5, 4, 0, 3])
+        self.assertEqual(self._ids(query.offset(1).limit(3)), [2, 5, 4])
+        self.assertEqual(self._ids(Query().offset(4)), [4, 5])
+
+        query = Query().order_by(SQLiteAlertModel.severity).order_by(SQLiteAlertModel.size,
+                                                                      SortOrder.DESC).limit(2)
+        pages = list()
+        while True:
+            page = self._run(self.storage.get(query))
+            pages.append([obj.size for obj in page])
+            if len(page) < 2:
+                break
+            query.after(query.cursor_of(page[-1]))
+        self.assertEqual(pages, [[0, 4], [5, 2], [1, 3], []])
+
+    def test_projection(self):
+        alerts = self._run(self.storage.get(Query().select(SQLiteAlertModel.size).limit(1)))
+        self.assertEqual(alerts[0].to_primitive(), {"alert_id": "alert-0", "size": 0,
+                                                     "severity": None, "resolved": None,
+                                                     "created_time": None, "tags": None})
+
+    def test_aggregations(self):
+        ext_query = ExtQuery().aggregate(SQLiteAlertModel.size)
+        self.assertEqual(self._run(self.storage.sum(ext_query)), 15)
+        self.assertEqual(self._run(self.storage.avg(ext_query)), 2.5)
+        ext_query = ExtQuery().aggregate(SQLiteAlertModel.created_time)
+        self.assertEqual(self._run(self.storage.max(ext_query)), START_TIME + timedelta(hours=5))
+        ext_query = ExtQuery().group_by(SQLiteAlertModel.severity)
+        self.assertEqual(self._run(self.storage.count_by_query(ext_query)),
+                         {"critical": 1, "warning": 2, "Warning": 1, "info": 1})
+        ext_query = ExtQuery().filter_by(Compare("size", ">", 10)).aggregate("size")
+        self.assertEqual(self._run(self.storage.sum(ext_query)), 0)
+        self.assertIsNone(self._run(self.storage.min(ext_query)))
+
+    def test_writes(self):
+        self.assertEqual(self._run(self.storage.update(Compare("severity", "=", "warning"),
+                                                       {"resolved": True})), 2)
+        self.assertEqual(self._run(self.storage.count(Compare("resolved", "=", True))), 5)
+        result = self._run(self.storage.update_many({"alert-0": {"size": 10},
+                                                     "alert-9": {"size": 1}}))
+        self.assertEqual((result.succeeded, result.missing), (["alert-0"], ["alert-9"]))
+        self.assertEqual(self._run(self.storage.get_by_id("alert-0")).size, 10)
+        self.assertTrue(self._run(self.storage.delete_by_id("alert-1")))
+        self.assertEqual(self._run(self.storage.delete(Compare("size", ">", 4))), 2)
+        self.assertEqual(sorted(self._run(self.storage.get_many_by_id(
+            ["alert-1", "alert-2", "alert-3", "alert-4"]))), ["alert-2", "alert-3", "alert-4"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, Query, SortOrder
+from cortx.utils.data.db import GenericDataBase
+from cortx.utils.errors import DataAccessInternalError
+
+
+class IterateModel(BaseModel):
+    _id = "node_id"
+    node_id = StringType()
+    size = IntType()
+
+
+class ListDataBase(GenericDataBase):
+    """Storage which serves get requests from the list"""
+
+    def __init__(self, objects):
+        self._objects = objects
+        self.requests = 0
+
+    async def get(self, query: Query):
+        self.requests += 1
+        query = query.data
+        reverse = query.order_by.order == SortOrder.DESC
+        objects = sorted(self._objects, key=lambda obj: obj.size, reverse=reverse)
+        cursor_values = query.get_cursor_values(IterateModel.primary_key) \
+            if query.cursor is not None else None
+        if cursor_values is not None:
+            objects = [obj for obj in objects
+                       if (obj.size < cursor_values[0] if reverse else obj.size > cursor_values[0])]
+        offset = query.offset or 0
+        return objects[offset:offset + query.limit]
+
+    async def update(self, filter_obj, to_update):
+        pass
+
+    async def count(self, filter_obj=None):
+        pass
+
+
+class TestGenericIterate(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.storage = ListDataBase([IterateModel({"node_id": f"node-{i}", "size": i})
+                                     for i in range(10)])
+
+    def _iterate(self, query, batch_size):
+        async def _collect():
+            return [obj.size async for obj in self.storage.iterate(query, batch_size)]
+        return self._loop.run_until_complete(_collect())
+
+    def test_batches(self):
+        query = Query().order_by(IterateModel.size, SortOrder.DESC)
+        self.assertEqual(self._iterate(query, 3), list(range(9, -1, -1)))
+        self.assertEqual(self.storage.requests, 4)
+
+    def test_offset_and_limit(self):
+        query = Query().order_by(IterateModel.size).offset(2).limit(5)
+        self.assertEqual(self._iterate(query, 2), [2, 3, 4, 5, 6])
+        self.assertEqual(self.storage.requests, 3)
+
+    def test_keyset_pages(self):
+        query = Query().order_by(IterateModel.size, SortOrder.DESC).limit(7).after()
+        self.assertEqual(self._iterate(query, 3), [9, 8, 7, 6, 5, 4, 3])
+        self.assertEqual(self.storage.requests, 3)
+
+    def test_wrong_batch_size(self):
+        with self.assertRaises(DataAccessInternalError):
+            self._iterate(Query(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
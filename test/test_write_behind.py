@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# CORTX-Py-Utils: CORTX Python common library.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import unittest
+from schematics.types import StringType, IntType
+from cortx.utils.data.access import BaseModel, BulkWriteResult
+from cortx.utils.data.db.db_provider import AsyncDataBase, DBModelConfig, GeneralConfig
+from cortx.utils.data.db.write_behind import WriteBehindBuffer
+from cortx.utils.errors import DataAccessExternalError, DataAccessInternalError
+
+
+class EventModel(BaseModel):
+    _id = "event_id"
+    event_id = StringType()
+    count = IntType()
+
+
+class BatchStorage:
+
+    def __init__(self):
+        self.batches = list()
+        self.fail = False
+
+    async def store_many(self, objs):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise DataAccessExternalError("Storage is not available")
+        objs = list(objs)
+        self.batches.append([(obj.event_id, obj.count) for obj in objs])
+        result = BulkWriteResult()
+        for obj in objs:
+            result.add_success(obj.event_id)
+        return result
+
+
+class TestWriteBehindBuffer(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.storage = BatchStorage()
+        self.flushed = list()
+        self.buffer = WriteBehindBuffer(3, 0.02, self.flushed.append)
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def _store(self, event_id, count):
+        return self.buffer.store(self.storage.store_many,
+                                 EventModel({"event_id": event_id, "count": count}))
+
+    def test_size_threshold_and_coalescing(self):
+        async def _store_all():
+            for i in range(5):
+                await self._store(f"event-{i % 2}", i)
+            await self._store("event-2", 5)
+            await self._store("event-3", 6)
+
+        self._run(_store_all())
+        self.assertEqual(self.storage.batches, [[("event-1", 3), ("event-0", 4), ("event-2", 5)]])
+        self.assertEqual(self.flushed[0].succeeded, ["event-1", "event-0", "event-2"])
+        self.assertEqual(self.buffer.get_stats(),
+                         {"stored": 7, "coalesced": 3, "batches": 1, "pending": 1})
+
+    def test_time_threshold(self):
+        async def _store_and_wait():
+            await self._store("event-0", 0)
+            self.assertEqual(self.storage.batches, [])
+            await asyncio.sleep(0.1)
+
+        self._run(_store_and_wait())
+        self.assertEqual(self.storage.batches, [[("event-0", 0)]])
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_flush_order_and_errors(self):
+        async def _concurrent_flushes():
+            await self._store("event-0", 0)
+            first = asyncio.ensure_future(self.buffer.flush())
+            await asyncio.sleep(0)
+            await self._store("event-0", 1)
+            return await asyncio.gather(first, self.buffer.flush())
+
+        self._run(_concurrent_flushes())
+        self.assertEqual(self.storage.batches, [[("event-0", 0)], [("event-0", 1)]])
+
+        self.storage.fail = True
+        self._run(self._store("event-1", 2))
+        result = self._run(self.buffer.flush())
+        self.assertEqual(list(result.errors), ["event-1"])
+        self.assertIs(self.flushed[-1], result)
+        invalid = EventModel({"event_id": "event-2"})
+        invalid.count = "many"
+        with self.assertRaises(DataAccessInternalError):
+            self._run(self.buffer.store(self.storage.store_many, invalid))
+        self.assertEqual(len(self.buffer), 0)
+
+
+class TestAsyncDataBaseWriteBehind(unittest.TestCase):
+    _loop = asyncio.get_event_loop()
+
+    def test_reads_see_buffered_stores(self):
+        model_config = DBModelConfig({
+            "import_path": "test_write_behind.EventModel", "database": "memory",
+            "config": {"memory": {"collection": "events"}},
+            "write_behind": {"enabled": True, "max_batch_size": 10, "flush_interval": 10}})
+        general_config = GeneralConfig({
+            "databases": {"memory": {"import_path": "MemoryDB"}}, "models": []})
+        storage = AsyncDataBase(EventModel, model_config, general_config)
+        flushed = list()
+        storage.set_flush_callback(flushed.append)
+
+        async def _store_and_read():
+            for i in range(5):
+                await storage.store(EventModel({"event_id": f"event-{i}", "count": i}))
+            self.assertEqual(flushed, [])
+            return await storage.count()
+
+        self.assertEqual(self._loop.run_until_complete(_store_and_read()), 5)
+        self.assertEqual(len(flushed), 1)
+        self.assertEqual(len(flushed[0].succeeded), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()